@@ -0,0 +1,57 @@
+"""Unloading one of many descriptions from a store::
+
+    python -m benchmarks.bench_dataset --descriptions 500
+
+Every description has its own target namespace. Without named graphs the
+triples of a description are found by scanning the whole store for
+subjects in its namespace. With ``named_graph=True`` its graph is
+dropped.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+import rdflib.parser
+import rdflib.plugin
+from rdflib import URIRef
+
+from rdflib_wsdl.dataset import unload_description
+
+from .generate_wsdl import write_description
+
+_NAMESPACE = "http://example.com/bench/wsdl"
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--descriptions", type=int, default=500)
+    argparser.add_argument("--operations", type=int, default=10)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, 1, args.operations, 2)
+    template = out.getvalue()
+    documents = [template.replace(_NAMESPACE, "%s/%d" % (_NAMESPACE, i))
+                 .encode("utf-8") for i in range(args.descriptions)]
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    victim = "%s/%d#" % (_NAMESPACE, args.descriptions // 2)
+
+    graph = rdflib.Graph()
+    for document in documents:
+        graph.parse(data=document, format="wsdl")
+    start = time.perf_counter()
+    for triple in [t for t in graph if t[0].startswith(victim)]:
+        graph.remove(triple)
+    scan = time.perf_counter() - start
+    print("%d descriptions, %d triples" % (args.descriptions, len(graph)))
+    print("default graph, scan %8.4f s" % scan)
+
+    ds = rdflib.Dataset()
+    for document in documents:
+        ds.parse(data=document, format="wsdl", named_graph=True)
+    start = time.perf_counter()
+    unload_description(ds, URIRef(victim + "wsdl.description()"))
+    print("named graph, drop   %8.4f s" % (time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
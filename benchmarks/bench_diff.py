@@ -0,0 +1,55 @@
+"""Comparison of two revisions of a description with one changed endpoint
+address::
+
+    python -m benchmarks.bench_diff --interfaces 50 --operations 10
+
+Compares :py:func:`rdflib.compare.graph_diff` of both graphs made
+isomorphic with :py:func:`rdflib_wsdl.diff.diff_descriptions`. Parsing
+is part of both times.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+import rdflib.parser
+import rdflib.plugin
+from rdflib.compare import graph_diff, to_isomorphic
+
+from rdflib_wsdl.diff import diff_descriptions
+
+from .generate_wsdl import write_description
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=50)
+    argparser.add_argument("--operations", type=int, default=10)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    changed = data.replace(b'"http://example.com/bench/service0"',
+                           b'"http://example.com/bench/moved0"')
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    print("description: %d operations, %.1f MB"
+          % (args.interfaces * args.operations, len(data) / 2**20))
+    isomorphic, structural = [], []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        old = to_isomorphic(rdflib.Graph().parse(data=data, format="wsdl"))
+        new = to_isomorphic(rdflib.Graph().parse(data=changed, format="wsdl"))
+        both, only_old, only_new = graph_diff(old, new)
+        isomorphic.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        diff = diff_descriptions(data, changed)
+        structural.append(time.perf_counter() - start)
+    print("graph_diff        %8.3f s (%d triples changed)"
+          % (min(isomorphic), len(only_old) + len(only_new)))
+    print("diff_descriptions %8.3f s (%d components changed)"
+          % (min(structural), len(diff.changed)))
+
+if __name__ == "__main__":
+    main()
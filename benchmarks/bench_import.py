@@ -0,0 +1,43 @@
+"""Import time of rdflib_wsdl measured with ``python -X importtime``::
+
+    python -m benchmarks.bench_import --repeat 5
+
+Every statement runs in a new process. Reported is the median over all
+runs of the summed import time of all modules, that are imported in
+addition to rdflib.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "package": "import rdflib_wsdl",
+    "parser": "import rdflib_wsdl; rdflib_wsdl.WSDLXMLParser",
+    "all": "import rdflib_wsdl; rdflib_wsdl.parse_many; rdflib_wsdl.aparse;"
+           " rdflib_wsdl.generateRDF",
+    }
+
+def import_time(statement: str) -> int:
+    """Returns the import time in us of all modules, that are imported by
+    statement after rdflib.
+    """
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                          "import rdflib\n" + statement],
+                         check=True, capture_output=True, text=True)
+    lines = [line for line in out.stderr.splitlines()
+             if line.startswith("import time:") and "self [us]" not in line]
+    rdflib_end = max(i for i, line in enumerate(lines)
+                     if line.rstrip().endswith("| rdflib"))
+    return sum(int(line[12:].split("|")[0]) for line in lines[rdflib_end+1:])
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--repeat", type=int, default=5)
+    args = argparser.parse_args()
+    for name, statement in STATEMENTS.items():
+        times = [import_time(statement) for _ in range(args.repeat)]
+        print("%-8s %7.1f ms" % (name, statistics.median(times) / 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Re-ingestion of a description with one changed endpoint address, compared
+to dropping the graph and parsing it again::
+
+    python -m benchmarks.bench_ingest --interfaces 200 --operations 10
+
+Calls are the calls of ``add``, ``addN`` and ``remove`` on the store,
+like the round trips of a store backed by a database. Unloading shows
+the calls for removing all triples of a description.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+from rdflib.plugins.stores.memory import Memory
+
+from rdflib_wsdl.ingest import Ingester
+
+from .generate_wsdl import write_description
+
+class CountingStore(Memory):
+    """Memory store, that counts the calls adding or removing triples"""
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self._in_addN = False
+
+    def add(self, triple, context, quoted=False) -> None:
+        if not self._in_addN:
+            self.calls += 1
+        super().add(triple, context, quoted)
+
+    def addN(self, quads) -> None:
+        self.calls += 1
+        self._in_addN = True
+        try:
+            super().addN(quads)
+        finally:
+            self._in_addN = False
+
+    def remove(self, triple, context=None) -> None:
+        self.calls += 1
+        super().remove(triple, context)
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=200)
+    argparser.add_argument("--operations", type=int, default=10)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    changed = data.replace(b'"http://example.com/bench/service0"',
+                           b'"http://example.com/bench/moved0"')
+    print("description: %d operations, %.1f MB"
+          % (args.interfaces * args.operations, len(data) / 2**20))
+    reparse, reingest, unload = [], [], []
+    for _ in range(args.repeat):
+        store = CountingStore()
+        ingester = Ingester(rdflib.Graph(store=store))
+        ingester.ingest(data)
+        store.calls = 0
+        start = time.perf_counter()
+        ingester.target.remove((None, None, None))
+        Ingester(ingester.target).ingest(changed)
+        reparse.append(time.perf_counter() - start)
+        reparse_calls = store.calls
+
+        store = CountingStore()
+        ingester = Ingester(rdflib.Graph(store=store))
+        delta = ingester.ingest(data)
+        store.calls = 0
+        start = time.perf_counter()
+        ingester.ingest(changed)
+        reingest.append(time.perf_counter() - start)
+        reingest_calls = store.calls
+
+        store.calls = 0
+        start = time.perf_counter()
+        ingester.unload(delta.description)
+        unload.append(time.perf_counter() - start)
+        unload_calls = store.calls
+    print("drop and parse %8.3f s (%d calls)" % (min(reparse), reparse_calls))
+    print("re-ingest      %8.3f s (%d calls)" % (min(reingest), reingest_calls))
+    print("unload         %8.3f s (%d calls, %d triples)"
+          % (min(unload), unload_calls, len(delta.added)))
+
+if __name__ == "__main__":
+    main()
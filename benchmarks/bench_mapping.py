@@ -0,0 +1,45 @@
+"""Time of building the parser states and of mapping them to rdf for a
+description with many operations::
+
+    python -m benchmarks.bench_mapping --interfaces 50 --operations 40
+
+Mapping is done with the default mapper into a :py:class:`rdflib.Graph`.
+"""
+import argparse
+import io
+import time
+
+from rdflib_wsdl.xmlparser import WSDLXMLHandler
+from rdflib_wsdl.wsdl2rdf import get_mapper
+
+from .generate_wsdl import write_description
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=50)
+    argparser.add_argument("--operations", type=int, default=40)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    mapper = get_mapper()
+    print("description: %d operations, %.1f MB"
+          % (args.interfaces * args.operations, len(data) / 2**20))
+    parse_times, map_times = [], []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        reader = WSDLXMLHandler.create_parser(None, None,
+                                              rdf_generator=lambda d: ())
+        reader.feed(data)
+        reader.close()
+        description = reader.getContentHandler().description
+        parse_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        graph = mapper(description)
+        map_times.append(time.perf_counter() - start)
+    print("parse   %8.3f s" % min(parse_times))
+    print("mapping %8.3f s (%d triples)" % (min(map_times), len(graph)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Peak memory of parsing a large wsdl description.
+
+Every measurement runs in its own process and reports the peak resident
+set size (ru_maxrss) of that process::
+
+    python -m benchmarks.bench_memory --interfaces 200
+
+``states`` only builds the tree of parser states, ``lazy`` does the same
+but captures the schemas within wsdl:types only as byte spans, ``graph``
+additionally maps the description into a :py:class:`rdflib.Graph`.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+_MEASURE = """
+import resource, sys, xml.sax
+import rdflib, rdflib.plugin, rdflib.parser
+from rdflib_wsdl.xmlparser import WSDLXMLHandler
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.argv[2] == "states":
+    reader = WSDLXMLHandler.create_parser(None, rdflib.Graph(),
+                                          rdf_generator=lambda d: ())
+    reader.parse(sys.argv[1])
+elif sys.argv[2] == "lazy":
+    with open(sys.argv[1], "rb") as f:
+        data = f.read()
+    reader = WSDLXMLHandler.create_parser(None, rdflib.Graph(),
+                                          rdf_generator=lambda d: (),
+                                          source_buffer=data)
+    reader.feed(data)
+    reader.close()
+else:
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    rdflib.Graph().parse(sys.argv[1], format="wsdl")
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(base, peak)
+"""
+
+def measure(path: str, mode: str) -> tuple:
+    """Returns rss after imports and peak rss in kB"""
+    out = subprocess.run([sys.executable, "-c", _MEASURE, path, mode],
+                         check=True, capture_output=True, text=True)
+    base, peak = out.stdout.split()
+    return int(base), int(peak)
+
+def main() -> None:
+    from .generate_wsdl import write_description
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=200)
+    argparser.add_argument("--operations", type=int, default=10)
+    argparser.add_argument("--schema-elements", type=int, default=20)
+    args = argparser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "large.wsdl")
+        with open(path, "w", encoding="utf-8") as out:
+            write_description(out, args.interfaces, args.operations,
+                              args.schema_elements)
+        size = os.path.getsize(path) / 2**20
+        print("description: %.1f MB" % size)
+        for mode in ("states", "lazy", "graph"):
+            base, peak = measure(path, mode)
+            print("%-7s peak rss %7.1f MB (%+.1f MB over imports)"
+                  % (mode, peak / 1024, (peak - base) / 1024))
+
+if __name__ == "__main__":
+    main()
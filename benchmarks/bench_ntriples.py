@@ -0,0 +1,53 @@
+"""Throughput of converting a description with many operations to
+N-Triples::
+
+    python -m benchmarks.bench_ntriples --interfaces 50 --operations 40
+
+Compares parsing into a :py:class:`rdflib.Graph` and serializing it with
+writing the triple stream of the mapper directly.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+import rdflib.parser
+import rdflib.plugin
+
+from rdflib_wsdl.ntriples import convert_to_ntriples
+
+from .generate_wsdl import write_description
+
+def _graph_serialize(data: bytes, out: io.BytesIO) -> None:
+    graph = rdflib.Graph().parse(data=data, format="wsdl")
+    graph.serialize(out, format="nt", encoding="utf-8")
+
+def _direct(data: bytes, out: io.BytesIO) -> None:
+    convert_to_ntriples(io.BytesIO(data), out)
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=50)
+    argparser.add_argument("--operations", type=int, default=40)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    print("description: %d operations, %.1f MB"
+          % (args.interfaces * args.operations, len(data) / 2**20))
+    triples = len(rdflib.Graph().parse(data=data, format="wsdl"))
+    for name, convert in (("parse+serialize", _graph_serialize),
+                          ("direct", _direct)):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            convert(data, io.BytesIO())
+            times.append(time.perf_counter() - start)
+        print("%-16s %8.3f s %10.0f triples/s"
+              % (name, min(times), triples / min(times)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Scaling of mapping a description with many bindings over 1 to N
+worker processes::
+
+    python -m benchmarks.bench_parallel --interfaces 200 --operations 10
+
+The main process parses the whole document, cuts it into one small
+document per slice and merges the triples of the workers into the graph.
+Only parsing the slices and mapping them runs in the workers. The stages
+are timed separately in this process, so the time of the parallel part
+and the lower bound with any number of cpus can be read off, even on a
+machine with few cpus.
+"""
+import argparse
+import io
+import os
+import time
+
+import rdflib
+
+from rdflib_wsdl.batch import _decode_term
+from rdflib_wsdl.parallel import parse_parallel, _slices, _slice_documents,\
+        _map_slice
+from rdflib_wsdl.wsdl2rdf import BatchedSink
+from rdflib_wsdl.xmlparser import read_description
+
+from .generate_wsdl import write_description
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=200)
+    argparser.add_argument("--operations", type=int, default=10)
+    argparser.add_argument("--workers", type=int, nargs="+",
+                           default=[1, 2, 4, 8])
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    print("description: %d bindings, %d operations, %.1f MB, %d cpus"
+          % (args.interfaces, args.interfaces * args.operations,
+             len(data) / 2**20, os.cpu_count()))
+    for workers in args.workers:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            graph = parse_parallel(data, workers=workers)
+            times.append(time.perf_counter() - start)
+        print("%2d workers %8.3f s (%d triples)"
+              % (workers, min(times), len(graph)))
+    stages(data, max(args.workers), args.repeat)
+
+def stages(data: bytes, workers: int, repeat: int) -> None:
+    """Times the stages of parse_parallel one after another. Every stage
+    is the best of repeat runs.
+    """
+    best = [float("inf")] * 4
+    for _ in range(repeat):
+        start = time.perf_counter()
+        description = read_description(data)
+        parsed = time.perf_counter()
+        slices = list(_slices(description, workers * 4))
+        documents = list(_slice_documents(data, description, slices))
+        sliced = time.perf_counter()
+        results = [_map_slice(document, kind, False, None, "random")
+                   for document, (kind, _, _) in zip(documents, slices)]
+        mapped = time.perf_counter()
+        with BatchedSink(rdflib.Graph()) as batch:
+            for terms, indices in results:
+                terms = [_decode_term(term) for term in terms]
+                for i in range(0, len(indices), 3):
+                    batch.add((terms[indices[i]], terms[indices[i+1]],
+                               terms[indices[i+2]]))
+        merged = time.perf_counter()
+        best = [min(old, new) for old, new in zip(best, (
+                parsed - start, sliced - parsed, mapped - sliced,
+                merged - mapped))]
+    parse, slice_, workers_time, merge = best
+    print("main: parse %.3f s, slice documents %.3f s, merge %.3f s"
+          % (parse, slice_, merge))
+    print("workers: parse and map slices %.3f s, %.2f times the document"
+          % (workers_time, sum(map(len, documents)) / len(data)))
+    print("lower bound with enough cpus %.3f s" % (parse + slice_ + merge))
+
+if __name__ == "__main__":
+    main()
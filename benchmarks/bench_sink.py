@@ -0,0 +1,60 @@
+"""Calls into the store and time of parsing a description with many
+operations into a :py:class:`rdflib.Graph`::
+
+    python -m benchmarks.bench_sink --interfaces 50 --operations 40
+
+The store counts every call of ``add`` and ``addN``, like the round trips
+of a store backed by a database.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+import rdflib.parser
+import rdflib.plugin
+from rdflib.plugins.stores.memory import Memory
+
+from .generate_wsdl import write_description
+
+class CountingStore(Memory):
+    """Memory store, that counts calls of add and addN"""
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def add(self, triple, context, quoted=False) -> None:
+        self.calls += 1
+        super().add(triple, context, quoted)
+
+    def addN(self, quads) -> None:
+        self.calls += 1
+        # Memory.addN calls add for every quad
+        for s, p, o, c in quads:
+            super().add((s, p, o), c, False)
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--interfaces", type=int, default=50)
+    argparser.add_argument("--operations", type=int, default=40)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, args.interfaces, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    print("description: %d operations, %.1f MB"
+          % (args.interfaces * args.operations, len(data) / 2**20))
+    times = []
+    for _ in range(args.repeat):
+        store = CountingStore()
+        graph = rdflib.Graph(store=store)
+        start = time.perf_counter()
+        graph.parse(data=data, format="wsdl")
+        times.append(time.perf_counter() - start)
+    print("parse   %8.3f s (%d triples)" % (min(times), len(graph)))
+    print("store calls %d" % store.calls)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Time per parse of many small wsdl descriptions::
+
+    python -m benchmarks.bench_small --repeat 2000
+
+Setup of parser and mapper is a large share of parsing small descriptions.
+"""
+import argparse
+import io
+import time
+
+import rdflib
+import rdflib.parser
+import rdflib.plugin
+
+from .generate_wsdl import write_description
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--repeat", type=int, default=2000)
+    argparser.add_argument("--operations", type=int, default=2)
+    args = argparser.parse_args()
+    out = io.StringIO()
+    write_description(out, 1, args.operations, 2)
+    data = out.getvalue().encode("utf-8")
+    rdflib.plugin.register("wsdl", rdflib.parser.Parser,
+                           "rdflib_wsdl", "WSDLXMLParser")
+    rdflib.Graph().parse(data=data, format="wsdl")
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        rdflib.Graph().parse(data=data, format="wsdl")
+    duration = time.perf_counter() - start
+    print("description: %d bytes" % len(data))
+    print("%.3f ms per parse" % (1000 * duration / args.repeat))
+
+if __name__ == "__main__":
+    main()
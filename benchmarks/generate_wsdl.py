@@ -0,0 +1,98 @@
+"""Generates large wsdl descriptions for benchmarks.
+
+Usage::
+
+    python -m benchmarks.generate_wsdl path/to/large.wsdl --interfaces 200
+"""
+import argparse
+from typing import TextIO
+
+_HEAD = """<?xml version="1.0" encoding="utf-8" ?>
+<description
+    xmlns="http://www.w3.org/ns/wsdl"
+    targetNamespace="http://example.com/bench/wsdl"
+    xmlns:tns="http://example.com/bench/wsdl"
+    xmlns:ghns="http://example.com/bench/schemas"
+    xmlns:wsoap="http://www.w3.org/ns/wsdl/soap"
+    xmlns:soap="http://www.w3.org/2003/05/soap-envelope"
+    xmlns:wsdlx="http://www.w3.org/ns/wsdl-extensions">
+"""
+
+def write_description(out: TextIO, interfaces: int = 100,
+                      operations: int = 10, schema_elements: int = 20,
+                      ) -> None:
+    """Writes a description with given amount of interfaces. Every
+    interface has its own binding and service and given amount of
+    operations. The types contain for every operation an inline schema
+    with given amount of elements.
+    """
+    out.write(_HEAD)
+    out.write("  <types>\n")
+    for i in range(interfaces):
+        out.write('    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+                  ' targetNamespace="http://example.com/bench/schemas">\n')
+        for j in range(operations):
+            out.write('      <xs:element name="in%d_%d" type="tIn%d_%d"/>\n'
+                      % (i, j, i, j))
+            out.write('      <xs:complexType name="tIn%d_%d">\n'
+                      '        <xs:sequence>\n' % (i, j))
+            for k in range(schema_elements):
+                out.write('          <xs:element name="field%d"'
+                          ' type="xs:string"/>\n' % k)
+            out.write('        </xs:sequence>\n'
+                      '      </xs:complexType>\n')
+            out.write('      <xs:element name="out%d_%d" type="xs:double"/>\n'
+                      % (i, j))
+        out.write('      <xs:element name="error%d" type="xs:string"/>\n' % i)
+        out.write("    </xs:schema>\n")
+    out.write("  </types>\n")
+    for i in range(interfaces):
+        out.write('  <interface name="interface%d">\n' % i)
+        out.write('    <fault name="fault%d" element="ghns:error%d"/>\n'
+                  % (i, i))
+        for j in range(operations):
+            out.write(
+                '    <operation name="op%d_%d"'
+                ' pattern="http://www.w3.org/ns/wsdl/in-out"'
+                ' style="http://www.w3.org/ns/wsdl/style/iri"'
+                ' wsdlx:safe="true">\n'
+                '      <input messageLabel="In" element="ghns:in%d_%d"/>\n'
+                '      <output messageLabel="Out" element="ghns:out%d_%d"/>\n'
+                '      <outfault ref="tns:fault%d" messageLabel="Out"/>\n'
+                '    </operation>\n' % (i, j, i, j, i, j, i))
+        out.write("  </interface>\n")
+    for i in range(interfaces):
+        out.write(
+            '  <binding name="binding%d" interface="tns:interface%d"'
+            ' type="http://www.w3.org/ns/wsdl/soap"'
+            ' wsoap:protocol="http://www.w3.org/2003/05/soap/bindings/HTTP/">\n'
+            '    <fault ref="tns:fault%d" wsoap:code="soap:Sender"/>\n'
+            % (i, i, i))
+        for j in range(operations):
+            out.write(
+                '    <operation ref="tns:op%d_%d"'
+                ' wsoap:mep="http://www.w3.org/2003/05/soap/mep/soap-response"'
+                '/>\n' % (i, j))
+        out.write("  </binding>\n")
+    for i in range(interfaces):
+        out.write(
+            '  <service name="service%d" interface="tns:interface%d">\n'
+            '    <endpoint name="endpoint%d" binding="tns:binding%d"'
+            ' address="http://example.com/bench/service%d"/>\n'
+            '  </service>\n' % (i, i, i, i, i))
+    out.write("</description>\n")
+
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("path")
+    argparser.add_argument("--interfaces", type=int, default=100)
+    argparser.add_argument("--operations", type=int, default=10)
+    argparser.add_argument("--schema-elements", type=int, default=20)
+    args = argparser.parse_args()
+    with open(args.path, "w", encoding="utf-8") as out:
+        write_description(out, args.interfaces, args.operations,
+                          args.schema_elements)
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,49 @@
-from .rdflib_plugin import WSDLXMLParser
-from .wsdl2rdf import MapperWSDL2RDF, generateRDF
+"""Submodules are only imported, when one of their names is accessed.
+So the rdflib plugin :py:class:`WSDLXMLParser` only loads, what is
+needed for parsing.
+"""
+import typing as typ
+
+if typ.TYPE_CHECKING:
+    from .rdflib_plugin import WSDLXMLParser
+    from .xmlparser import WSDLIncrementalParser
+    from .batch import parse_many
+    from .aio import aparse
+    from .wsdl2rdf import MapperWSDL2RDF, generateRDF
+    from .ntriples import write_ntriples, convert_to_ntriples
+    from .parallel import parse_parallel
+    from .ingest import Ingester
+    from .diff import diff_descriptions
+    from .dataset import unload_description
+
+_lazy_names: typ.Mapping[str, str] = {
+        "WSDLXMLParser": "rdflib_plugin",
+        "WSDLIncrementalParser": "xmlparser",
+        "parse_many": "batch",
+        "aparse": "aio",
+        "MapperWSDL2RDF": "wsdl2rdf",
+        "generateRDF": "wsdl2rdf",
+        "write_ntriples": "ntriples",
+        "convert_to_ntriples": "ntriples",
+        "parse_parallel": "parallel",
+        "Ingester": "ingest",
+        "diff_descriptions": "diff",
+        "unload_description": "dataset",
+        }
+"""Exported names mapped to the submodule, that defines them"""
+
+__all__ = list(_lazy_names)
+
+def __getattr__(name: str) -> typ.Any:
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r"
+                             % (__name__, name)) from None
+    module = __import__(module_name, globals(), None, [name], 1)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> typ.List[str]:
+    return sorted(set(globals()) | set(_lazy_names))
@@ -0,0 +1,78 @@
+"""Parsing for asyncio applications.
+
+.. code-block:: python
+
+    reader, writer = await asyncio.open_connection(host, port)
+    graph = await aparse(reader)
+
+"""
+from collections.abc import AsyncIterable, AsyncIterator
+from itertools import chain
+from typing import Optional, Union
+import asyncio
+
+import rdflib
+
+from .xmlparser import WSDLIncrementalParser
+from .wsdl2rdf import MapperWSDL2RDF, BatchedSink, get_mapper,\
+        blank_node_ids
+
+AsyncByteStream = Union[asyncio.StreamReader, AsyncIterable[bytes]]
+"""Anything with an async method ``read(n)`` like
+:py:class:`asyncio.StreamReader` or an async iterable of bytes.
+"""
+
+async def aparse(stream: AsyncByteStream,
+                 sink: Optional[rdflib.Graph] = None,
+                 rdf_generator: Optional[MapperWSDL2RDF] = None,
+                 namespace_aware: bool = False,
+                 chunk_size: int = 2**16,
+                 batch_size: Optional[int] = None,
+                 bnode_mode: str = "random",
+                 ) -> rdflib.Graph:
+    """Parses the wsdl document from given stream and adds all triples to
+    sink. Control is given back to the event loop after every chunk
+    and after every mapped top-level component.
+
+    :param sink: If not given, a new :py:class:`rdflib.Graph` is used.
+    :param chunk_size: Maximal size of the chunks read from stream
+    :param batch_size: Number of triples added to sink per call of
+        :py:meth:`rdflib.Graph.addN`
+    :param bnode_mode: See :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`
+    :returns: sink
+    :raises xml.sax.SAXParseException:
+    """
+    if sink is None:
+        sink = rdflib.Graph()
+    if rdf_generator is None:
+        rdf_generator = get_mapper()
+    # Mapping is done here component per component instead of at close
+    parser = WSDLIncrementalParser(sink, rdf_generator=lambda d: (),
+                                   namespace_aware=namespace_aware)
+    async for chunk in _read_chunks(stream, chunk_size):
+        parser.feed(chunk)
+        await asyncio.sleep(0)
+    parser.close()
+    description = parser.description
+    for component in chain(description.interfaces, description.bindings,
+                           description.services):
+        with blank_node_ids(bnode_mode),\
+                BatchedSink(sink, batch_size) as batch:
+            rdf_generator.map_component(batch, component)
+        await asyncio.sleep(0)
+    with blank_node_ids(bnode_mode), BatchedSink(sink, batch_size) as batch:
+        rdf_generator.map_description_properties(batch, description)
+    return sink
+
+async def _read_chunks(stream: AsyncByteStream, chunk_size: int,
+                       ) -> AsyncIterator[bytes]:
+    if hasattr(stream, "read"):
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for data in stream:
+            for i in range(0, len(data), chunk_size):
+                yield data[i:i+chunk_size]
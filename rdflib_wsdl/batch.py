@@ -0,0 +1,205 @@
+"""Parses many wsdl documents at once with a pool of worker processes.
+
+.. code-block:: python
+
+    result = parse_many(["catalog.zip", "more/"], workers=4)
+    graph = result.graph
+    for error in result.errors:
+        print(error.name, error.message)
+
+Every worker parses documents with :py:class:`WSDLXMLHandler` into its own
+graph and sends the triples back as table of terms and indices into
+that table.
+"""
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from io import BytesIO
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+import os
+import tarfile
+import xml.sax.xmlreader
+import zipfile
+
+import rdflib
+from rdflib import BNode, Literal, URIRef
+
+from .xmlparser import WSDLXMLHandler
+
+_Job = Tuple[str, Union[str, bytes]]
+"""Name of the document and path to or content of the document"""
+
+_EncodedTerm = Tuple[Any, ...]
+_EncodedTriples = Tuple[List[_EncodedTerm], array]
+
+@dataclass
+class DocumentError:
+    """A document, that couldnt be parsed."""
+    name: str
+    message: str
+
+@dataclass
+class BatchResult:
+    """Result of :py:func:`parse_many`."""
+    graph: rdflib.Graph
+    documents: List[str] = field(default_factory=list)
+    """Names of all successfully parsed documents"""
+    errors: List[DocumentError] = field(default_factory=list)
+
+def parse_many(paths_or_zip: Union[str, os.PathLike,
+                                   Iterable[Union[str, os.PathLike]]],
+               target: Optional[rdflib.Graph] = None,
+               workers: Optional[int] = None,
+               pattern: str = "*.wsdl",
+               **parser_options: Any,
+               ) -> BatchResult:
+    """Parses all given wsdl documents and merges the triples into target.
+    Errors of single documents dont abort the other documents. Paths,
+    that dont exist or cant be read, are reported as errors too.
+
+    :param paths_or_zip: Wsdl documents, directories, zip- or tar-archives.
+        Directories and archives are searched for documents matching
+        pattern.
+    :param target: Graph or dataset for all triples. If a
+        :py:class:`rdflib.ConjunctiveGraph` is given, every document gets
+        its own graph named after the document. If not given, a new
+        :py:class:`rdflib.Graph` is used.
+    :param workers: Number of worker processes. Defaults to the number of
+        cpus. With 1 all documents are parsed in this process.
+    :param parser_options: Are given to
+        :py:meth:`WSDLXMLHandler.create_parser`, eg namespace_aware
+    """
+    if target is None:
+        target = rdflib.Graph()
+    if isinstance(paths_or_zip, (str, os.PathLike)):
+        paths_or_zip = [paths_or_zip]
+    result = BatchResult(target)
+    jobs: List[_Job] = []
+    for path in map(Path, paths_or_zip):
+        if not path.exists():
+            result.errors.append(DocumentError(
+                path.resolve().as_uri(),
+                "FileNotFoundError: No such file or directory"))
+            continue
+        try:
+            path_jobs = list(_collect_jobs(path, pattern))
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as err:
+            result.errors.append(DocumentError(
+                path.resolve().as_uri(), "%s: %s" % (type(err).__name__, err)))
+        else:
+            jobs.extend(path_jobs)
+    if workers == 1 or len(jobs) < 2:
+        results = (_parse_document(job, parser_options) for job in jobs)
+        _merge(result, results)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(_parse_document, jobs,
+                                   [parser_options] * len(jobs))
+            _merge(result, results)
+    return result
+
+def _merge(result: BatchResult,
+           results: Iterable[Tuple[str, Optional[_EncodedTriples],
+                                   Optional[str]]],
+           ) -> None:
+    """Adds all parsed triples to the target in order of the documents."""
+    target = result.graph
+    for name, encoded, message in results:
+        if encoded is None:
+            result.errors.append(DocumentError(name, message))
+            continue
+        if isinstance(target, rdflib.ConjunctiveGraph):
+            context = target.get_context(URIRef(name))
+        else:
+            context = target
+        terms = [_decode_term(term) for term in encoded[0]]
+        indices = encoded[1]
+        context.addN((terms[indices[i]], terms[indices[i+1]],
+                      terms[indices[i+2]], context)
+                     for i in range(0, len(indices), 3))
+        result.documents.append(name)
+
+def _collect_jobs(path: Path, pattern: str) -> Iterable[_Job]:
+    """Expands directories and archives to single documents. Documents
+    within archives are read here, so that workers dont have to open
+    the archive again.
+    """
+    if path.is_dir():
+        for subpath in sorted(path.rglob(pattern)):
+            if subpath.is_file():
+                yield subpath.resolve().as_uri(), str(subpath)
+    elif zipfile.is_zipfile(path):
+        base = path.resolve().as_uri()
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and fnmatch(info.filename, pattern):
+                    yield "%s!/%s" % (base, info.filename),\
+                            archive.read(info)
+    elif tarfile.is_tarfile(path):
+        base = path.resolve().as_uri()
+        with tarfile.open(path) as archive:
+            for info in archive:
+                if info.isfile() and fnmatch(info.name, pattern):
+                    yield "%s!/%s" % (base, info.name),\
+                            archive.extractfile(info).read()
+    else:
+        yield path.resolve().as_uri(), str(path)
+
+def _parse_document(job: _Job, parser_options: dict,
+                    ) -> Tuple[str, Optional[_EncodedTriples], Optional[str]]:
+    """Runs in the worker processes.
+
+    :returns: Name of the document, the encoded triples and an errormessage
+        if the document couldnt be parsed.
+    """
+    name, document = job
+    graph = rdflib.Graph()
+    source = xml.sax.xmlreader.InputSource(name)
+    if isinstance(document, bytes):
+        source.setByteStream(BytesIO(document))
+    try:
+        reader = WSDLXMLHandler.create_parser(source, graph, **parser_options)
+        if isinstance(document, bytes):
+            reader.parse(source)
+        else:
+            reader.parse(document)
+    except Exception as err:
+        return name, None, "%s: %s" % (type(err).__name__, err)
+    return name, _encode_triples(graph), None
+
+def _encode_triples(graph: rdflib.Graph) -> _EncodedTriples:
+    """Every term is only send once. Triples are send as indices into
+    the table of terms.
+    """
+    term_ids = {}
+    terms = []
+    indices = array("L")
+    for triple in graph:
+        for term in triple:
+            try:
+                indices.append(term_ids[term])
+            except KeyError:
+                term_ids[term] = len(terms)
+                indices.append(len(terms))
+                terms.append(_encode_term(term))
+    return terms, indices
+
+def _encode_term(term: rdflib.term.Node) -> _EncodedTerm:
+    if isinstance(term, URIRef):
+        return (str(term),)
+    elif isinstance(term, BNode):
+        return (None, str(term))
+    elif isinstance(term, Literal):
+        datatype = None if term.datatype is None else str(term.datatype)
+        return (None, str(term), datatype, term.language)
+    raise TypeError(term)
+
+def _decode_term(term: _EncodedTerm) -> rdflib.term.Node:
+    if len(term) == 1:
+        return URIRef(term[0])
+    elif len(term) == 2:
+        return BNode(term[1])
+    return Literal(term[1], datatype=term[2], lang=term[3])
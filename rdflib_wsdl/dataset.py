@@ -0,0 +1,71 @@
+"""One named graph per description in a :py:class:`rdflib.Dataset`.
+
+.. code-block:: python
+
+    ds = Dataset()
+    ds.parse(path, format="wsdl", named_graph=True)
+    # parsing a new revision replaces the graph of the description
+    ds.parse(path, format="wsdl", named_graph=True)
+    unload_description(ds, URIRef(
+        "http://greath.example.com/2004/wsdl/resSvc#wsdl.description()"))
+
+The graph of a description is named by the IRI of the description, see
+``wsdl.description()`` in
+`https://www.w3.org/TR/wsdl20/#wsdl-iri-references`_. Replacing or
+unloading a description only touches its own graph, so it takes time
+proportional to the triples of this description and not of the whole
+store.
+
+The sink has to be a :py:class:`rdflib.Dataset`, a
+:py:class:`rdflib.ConjunctiveGraph` or one of their graphs, eg the one
+:py:meth:`rdflib.Dataset.parse` passes to the parser. A plain
+:py:class:`rdflib.Graph` is rejected even if its store is context aware,
+because it wouldnt show the triples of the named graph.
+"""
+from rdflib import ConjunctiveGraph, Graph, URIRef
+
+def description_graph(sink: Graph, description_iri: URIRef,
+                      replace: bool = False) -> Graph:
+    """Graph named description_iri in the store of sink.
+
+    :param sink: Dataset, ConjunctiveGraph or one of their graphs
+    :param replace: Drop all triples of the graph first
+    :raises ValueError: If sink cant hold named graphs, see
+        :py:func:`check_named_graph_sink`
+    """
+    check_named_graph_sink(sink)
+    graph = Graph(store=sink.store, identifier=description_iri)
+    if replace:
+        _drop(graph)
+    return graph
+
+def unload_description(sink: Graph, description_iri: URIRef) -> None:
+    """Removes the graph of given description with all its triples.
+
+    :raises ValueError: If sink cant hold named graphs
+    """
+    _drop(description_graph(sink, description_iri))
+
+def check_named_graph_sink(sink: Graph) -> None:
+    """Checks, that the named graphs in the store of sink are visible
+    through sink. Thats the case for a Dataset or ConjunctiveGraph and
+    for their graphs, which are named by an IRI. Plain graphs are named
+    by a blank node.
+
+    :raises ValueError: If sink is a plain graph or its store isnt
+        context aware
+    """
+    if not sink.store.context_aware:
+        raise ValueError("Named graphs need a context aware store, got %r"
+                         % sink.store)
+    if not isinstance(sink, ConjunctiveGraph)\
+            and not isinstance(sink.identifier, URIRef):
+        raise ValueError("Named graphs need a Dataset or one of its "
+                         "graphs, got plain graph %r" % sink)
+
+def _drop(graph: Graph) -> None:
+    store = graph.store
+    if store.graph_aware:
+        store.remove_graph(graph)
+    else:
+        store.remove((None, None, None), context=graph)
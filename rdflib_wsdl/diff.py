@@ -0,0 +1,169 @@
+"""Structural diff of two revisions of a wsdl description.
+
+Components are matched by their fragment identifier, eg
+``wsdl.interfaceOperation(reservationInterface/opCheckAvailability)``,
+so no graph isomorphism is needed and the diff takes linear time.
+
+.. code-block:: python
+
+    diff = diff_descriptions(old_path, new_path)
+    for fragment in diff.added:
+        print("+", fragment)
+    for change in diff.changed:
+        for prop in change.properties:
+            print("~", change.fragment_identifier, prop.property)
+
+The properties of a component are the triples, that the mapper creates
+with the IRI of the component as subject, see
+:py:meth:`rdflib_wsdl.wsdl2rdf.MapperWSDL2RDF.iter_triples`. So
+properties of extensions are compared too. Nodes without IRI, like
+element declarations, are compared by their content. Links from a
+component to its subcomponents arent properties, a new subcomponent is
+only reported as added.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set,\
+        Tuple, Union
+
+from rdflib import BNode, URIRef
+from rdflib.term import Node
+
+from .ingest import Source
+from .xmlparser import read_description
+from .wsdl_components import _WSDLComponent, Description, Interface,\
+        InterfaceOperation, Binding, BindingOperation, Service
+from .wsdl2rdf import MapperWSDL2RDF, ExtensionParserData, get_mapper
+from .wsdl2rdf.class_MapperWSDL2RDF import _create_id
+
+_Value = Union[Node, FrozenSet[Tuple[URIRef, "_Value"]]]
+"""Object of a property. Blank nodes are replaced by their properties."""
+
+_Properties = Dict[URIRef, FrozenSet[_Value]]
+
+_SUBCOMPONENTS: Tuple[Tuple[type, Tuple[str, ...]], ...] = (
+        (Description, ("interfaces", "bindings", "services")),
+        (Interface, ("interface_faults", "interface_operations")),
+        (InterfaceOperation, ("interface_message_references",
+                              "interface_fault_references")),
+        (Binding, ("binding_faults", "binding_operations")),
+        (BindingOperation, ("binding_message_references",
+                            "binding_fault_references")),
+        (Service, ("endpoints",)),
+        )
+
+@dataclass
+class PropertyChange:
+    """Values of one property, that differ between both revisions"""
+    property: URIRef
+    removed: FrozenSet[_Value] = frozenset()
+    added: FrozenSet[_Value] = frozenset()
+
+@dataclass
+class ComponentChange:
+    """Component, that is in both revisions but has other properties"""
+    fragment_identifier: str
+    properties: List[PropertyChange] = field(default_factory=list)
+
+@dataclass
+class DescriptionDiff:
+    """Result of :py:func:`diff_descriptions`. Components are given by
+    their fragment identifiers in document order.
+    """
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[ComponentChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+def diff_descriptions(
+        old: Union[Description, Source], new: Union[Description, Source],
+        extensions: Optional[Union[MapperWSDL2RDF,
+                                   Iterable[ExtensionParserData]]] = None,
+        namespace_aware: bool = False,
+        ) -> DescriptionDiff:
+    """Compares the components of two revisions of a description.
+
+    :param old: Parsed description or content, path or binary stream of
+        the wsdl document
+    :param extensions: See :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper`
+    :raises xml.sax.SAXParseException:
+    """
+    mapper = get_mapper(extensions)
+    old_index = _index(_description(old, namespace_aware), mapper)
+    new_index = _index(_description(new, namespace_aware), mapper)
+    diff = DescriptionDiff()
+    for fragment, new_properties in new_index.items():
+        try:
+            old_properties = old_index[fragment]
+        except KeyError:
+            diff.added.append(fragment)
+            continue
+        if old_properties != new_properties:
+            diff.changed.append(ComponentChange(
+                fragment, list(_diff_properties(old_properties,
+                                                new_properties))))
+    diff.removed.extend(fragment for fragment in old_index
+                        if fragment not in new_index)
+    return diff
+
+def _description(source: Union[Description, Source],
+                 namespace_aware: bool) -> Description:
+    if isinstance(source, Description):
+        return source
+    return read_description(source, namespace_aware)
+
+def _diff_properties(old: _Properties, new: _Properties,
+                     ) -> Iterator[PropertyChange]:
+    for prop in dict.fromkeys((*old, *new)):
+        old_values = old.get(prop, frozenset())
+        new_values = new.get(prop, frozenset())
+        if old_values != new_values:
+            yield PropertyChange(prop, old_values - new_values,
+                                 new_values - old_values)
+
+def _walk(component: _WSDLComponent) -> Iterator[
+        Tuple[_WSDLComponent, List[_WSDLComponent]]]:
+    """Yields every component with its subcomponents, parents first"""
+    subcomponents: List[_WSDLComponent] = []
+    for cls, names in _SUBCOMPONENTS:
+        if isinstance(component, cls):
+            for name in names:
+                subcomponents.extend(getattr(component, name))
+            break
+    yield component, subcomponents
+    for subcomponent in subcomponents:
+        yield from _walk(subcomponent)
+
+def _index(description: Description, mapper: MapperWSDL2RDF,
+           ) -> Dict[str, _Properties]:
+    """Properties of every component by its fragment identifier"""
+    fragments: Dict[URIRef, str] = {}
+    links: Set[Tuple[URIRef, URIRef]] = set()
+    for component, subcomponents in _walk(description):
+        iri = _create_id(component)
+        fragments[iri] = component.fragment_identifier
+        links.update((iri, _create_id(sub)) for sub in subcomponents)
+    by_subject: Dict[Node, List[Tuple[URIRef, Node]]] = {}
+    for s, p, o in mapper.iter_triples(description):
+        if (s, o) not in links:
+            by_subject.setdefault(s, []).append((p, o))
+    folded: Dict[BNode, _Value] = {}
+    def value(node: Node) -> _Value:
+        if not isinstance(node, BNode):
+            return node
+        try:
+            return folded[node]
+        except KeyError:
+            pass
+        folded[node] = frozenset((p, value(o))
+                                 for p, o in by_subject.get(node, ()))
+        return folded[node]
+    index: Dict[str, _Properties] = {}
+    for iri, fragment in fragments.items():
+        properties: Dict[URIRef, Set[_Value]] = {}
+        for p, o in by_subject.get(iri, ()):
+            properties.setdefault(p, set()).add(value(o))
+        index[fragment] = {p: frozenset(values)
+                           for p, values in properties.items()}
+    return index
@@ -0,0 +1,192 @@
+"""Keeps the triples of wsdl documents in a live graph up to date.
+
+.. code-block:: python
+
+    ingester = Ingester(graph)
+    ingester.ingest(path)
+    # ... the service publishes a new revision
+    delta = ingester.ingest(path)
+    print(len(delta.added), len(delta.removed))
+
+For every ingested description an index of its triples grouped by the
+IRIs of its top-level components is kept. When the description is
+ingested again, only components, whose triples changed, are compared and
+only the difference is written to the graph. For this, blank nodes are
+created with ids derived from their owner, see
+:py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`.
+
+Additions are passed to the store in batches via ``addN``. Removals are
+passed in batches to ``removeN``, if the store has such a method.
+Otherwise all triples of a subject, that has no triples in the new
+revision, are removed with one call of ``remove`` with the pattern
+``(subject, None, None)``, likewise for a subject and predicate. So
+triples with such a subject, that were added by others, are removed too.
+"""
+from dataclasses import dataclass, field
+from itertools import chain
+from os import PathLike
+from typing import BinaryIO, Dict, FrozenSet, Iterable, List, Optional, Set,\
+        Tuple, Union
+
+import rdflib
+from rdflib import URIRef
+from rdflib.term import Node
+
+from .xmlparser import read_description
+from .xmlparser_states import wsdl_description
+from .wsdl2rdf import MapperWSDL2RDF, ExtensionParserData, BatchedSink,\
+        get_mapper, blank_node_ids
+from .wsdl2rdf.class_MapperWSDL2RDF import _Triple, _TripleList,\
+        _create_id, mapping_run
+from .wsdl2rdf.sink import _default_context, DEFAULT_BATCH_SIZE
+
+_Pattern = Tuple[Node, Optional[Node], Optional[Node]]
+
+Source = Union[bytes, str, PathLike, BinaryIO]
+"""Content, path or binary stream of a wsdl document"""
+
+@dataclass
+class DescriptionIndex:
+    """Triples of one ingested description"""
+    iri: URIRef
+    components: Dict[URIRef, FrozenSet[_Triple]] = field(default_factory=dict)
+    """Triples of every top-level component with all its subcomponents.
+    The triples of the description itself are stored under its IRI.
+    """
+
+    def triples(self) -> Set[_Triple]:
+        return set(chain.from_iterable(self.components.values()))
+
+@dataclass
+class Delta:
+    """Changes applied to the graph by :py:meth:`Ingester.ingest` or
+    :py:meth:`Ingester.unload`.
+    """
+    description: URIRef
+    added: List[_Triple] = field(default_factory=list)
+    removed: List[_Triple] = field(default_factory=list)
+    changed_components: List[URIRef] = field(default_factory=list)
+    """Top-level components, that were added, removed or changed"""
+
+class Ingester:
+    """Ingests wsdl documents into target and updates their triples, when
+    they are ingested again.
+
+    Triples shared by different descriptions are removed, when one of
+    these descriptions drops them.
+
+    :param target: Live graph. Of a :py:class:`rdflib.Dataset` the
+        default graph is used.
+    :param extensions: See :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper`
+    :param bnode_mode: ``stable`` or ``skolem``. Random blank nodes would
+        change on every ingestion.
+    :raises ValueError: If bnode_mode is ``random``
+    """
+    target: rdflib.Graph
+    descriptions: Dict[URIRef, DescriptionIndex]
+    """Index of every ingested description by its IRI"""
+
+    def __init__(self, target: Optional[rdflib.Graph] = None,
+                 extensions: Optional[Union[
+                     MapperWSDL2RDF, Iterable[ExtensionParserData]]] = None,
+                 namespace_aware: bool = False,
+                 batch_size: Optional[int] = None,
+                 bnode_mode: str = "stable",
+                 ) -> None:
+        if bnode_mode == "random":
+            raise ValueError("Ingestion needs stable blank nodes")
+        if target is None:
+            target = rdflib.Graph()
+        self.target = target
+        self.mapper = get_mapper(extensions)
+        self.namespace_aware = namespace_aware
+        self.batch_size = batch_size
+        self.bnode_mode = bnode_mode
+        self.descriptions = {}
+
+    def ingest(self, source: Source) -> Delta:
+        """Parses the wsdl document and applies the difference to the
+        triples of its last ingestion to the target.
+
+        :raises xml.sax.SAXParseException:
+        """
+        description = read_description(source, self.namespace_aware)
+        new = self._index(description)
+        old = self.descriptions.get(new.iri, DescriptionIndex(new.iri))
+        delta = Delta(new.iri)
+        changed_old: Set[_Triple] = set()
+        changed_new: Set[_Triple] = set()
+        for iri in dict.fromkeys(chain(old.components, new.components)):
+            old_triples = old.components.get(iri, frozenset())
+            new_triples = new.components.get(iri, frozenset())
+            if old_triples != new_triples:
+                delta.changed_components.append(iri)
+                changed_old.update(old_triples)
+                changed_new.update(new_triples)
+        if delta.changed_components:
+            # Triples can be shared with unchanged components
+            delta.removed = list(changed_old - new.triples())
+            delta.added = list(changed_new - old.triples())
+            self._apply(delta, new.triples())
+        self.descriptions[new.iri] = new
+        return delta
+
+    def unload(self, description_iri: URIRef) -> Delta:
+        """Removes all triples of given description from the target.
+
+        :raises KeyError: If the description wasnt ingested
+        """
+        old = self.descriptions.pop(description_iri)
+        delta = Delta(description_iri, removed=list(old.triples()),
+                      changed_components=list(old.components))
+        self._apply(delta)
+        return delta
+
+    def _index(self, description: wsdl_description) -> DescriptionIndex:
+        index = DescriptionIndex(_create_id(description))
+        with mapping_run(), blank_node_ids(self.bnode_mode):
+            for component in chain(description.interfaces,
+                                   description.bindings,
+                                   description.services):
+                triples = _TripleList()
+                self.mapper.map_component(triples, component)
+                index.components[_create_id(component)] = frozenset(triples)
+            triples = _TripleList()
+            self.mapper.map_description_properties(triples, description)
+            index.components[index.iri] = frozenset(triples)
+        return index
+
+    def _apply(self, delta: Delta, kept: Set[_Triple] = set()) -> None:
+        """Removes and adds the triples of delta.
+
+        :param kept: All triples of the description after applying delta
+        """
+        _remove_triples(_default_context(self.target), delta.removed, kept,
+                        self.batch_size or DEFAULT_BATCH_SIZE)
+        with BatchedSink(self.target, self.batch_size) as sink:
+            for triple in delta.added:
+                sink.add(triple)
+
+def _remove_triples(context: rdflib.Graph, removed: List[_Triple],
+                    kept: Set[_Triple], batch_size: int) -> None:
+    """Removes given triples from context with as few calls of its store
+    as possible.
+    """
+    store = context.store
+    if hasattr(store, "removeN"):
+        for i in range(0, len(removed), batch_size):
+            store.removeN([(s, p, o, context)
+                           for s, p, o in removed[i:i+batch_size]])
+        return
+    kept_subjects = {s for s, p, o in kept}
+    kept_pairs = {(s, p) for s, p, o in kept}
+    patterns: Dict[_Pattern, None] = {}
+    for s, p, o in removed:
+        if s not in kept_subjects:
+            patterns[s, None, None] = None
+        elif (s, p) not in kept_pairs:
+            patterns[s, p, None] = None
+        else:
+            patterns[s, p, o] = None
+    for pattern in patterns:
+        context.remove(pattern)
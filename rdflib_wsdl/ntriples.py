@@ -0,0 +1,112 @@
+"""Writes the triples of wsdl documents directly as N-Triples or N-Quads.
+
+No :py:class:`rdflib.Graph` is built. The triples are taken from
+:py:meth:`rdflib_wsdl.wsdl2rdf.MapperWSDL2RDF.iter_triples` and written
+in blocks to a binary stream, eg a file or ``socket.makefile("wb")``.
+
+.. code-block:: python
+
+    with open("catalog.wsdl", "rb") as src, open("catalog.nt", "wb") as out:
+        convert_to_ntriples(src, out)
+
+"""
+from functools import lru_cache
+from os import PathLike
+from typing import BinaryIO, Iterable, List, Optional, Union
+import re
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.term import Node
+
+from .xmlparser import read_description
+from .wsdl2rdf import MapperWSDL2RDF, ExtensionParserData, get_mapper
+from .wsdl2rdf.class_MapperWSDL2RDF import _Triple, _create_id,\
+        blank_node_ids
+
+FORMATS = ("nt", "nquads")
+"""Supported output formats"""
+
+_IRI_ESCAPE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+def _escape_iri_char(match: re.Match) -> str:
+    return "\\u%04X" % ord(match.group())
+
+@lru_cache(maxsize=2**16)
+def _iri(value: str) -> str:
+    """IRI with angle brackets. Chars not allowed in N-Triples are
+    escaped. Cached, because most IRIs recur often.
+    """
+    return "<%s>" % _IRI_ESCAPE.sub(_escape_iri_char, value)
+
+def _literal(literal: Literal) -> str:
+    encoded = '"%s"' % literal.replace("\\", "\\\\").replace("\n", "\\n")\
+            .replace('"', '\\"').replace("\r", "\\r")
+    if literal.language:
+        return "%s@%s" % (encoded, literal.language)
+    elif literal.datatype:
+        return "%s^^%s" % (encoded, _iri(literal.datatype))
+    return encoded
+
+def _term(term: Node) -> str:
+    if isinstance(term, URIRef):
+        return _iri(term)
+    elif isinstance(term, BNode):
+        return "_:%s" % term
+    elif isinstance(term, Literal):
+        return _literal(term)
+    raise TypeError("Cant write %r as N-Triples" % (term,))
+
+def write_ntriples(triples: Iterable[_Triple], out: BinaryIO,
+                   graph_name: Optional[URIRef] = None,
+                   block_size: int = 1024,
+                   ) -> int:
+    """Writes given triples utf-8 encoded to out.
+
+    :param graph_name: If given, N-Quads are written with this as graph.
+    :param block_size: Number of lines written to out per call
+    :returns: Number of written triples
+    """
+    end = " .\n" if graph_name is None else " %s .\n" % _iri(graph_name)
+    lines: List[str] = []
+    count = 0
+    for s, p, o in triples:
+        lines.append(" ".join((_term(s), _iri(p), _term(o))) + end)
+        if len(lines) >= block_size:
+            out.write("".join(lines).encode("utf-8"))
+            count += len(lines)
+            lines.clear()
+    if lines:
+        out.write("".join(lines).encode("utf-8"))
+        count += len(lines)
+    return count
+
+def convert_to_ntriples(
+        source: Union[str, PathLike, BinaryIO], out: BinaryIO,
+        format: str = "nt",
+        extensions: Optional[Union[MapperWSDL2RDF,
+                                   Iterable[ExtensionParserData]]] = None,
+        namespace_aware: bool = False,
+        chunk_size: int = 2**16,
+        bnode_mode: str = "random",
+        ) -> int:
+    """Parses the wsdl document from source and writes its triples to
+    out without building a graph.
+
+    :param source: Path or binary stream of the wsdl document
+    :param format: ``nt`` or ``nquads``. N-Quads use the IRI of the
+        description as graph.
+    :param extensions: See :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper`
+    :param bnode_mode: See :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`
+    :returns: Number of written triples
+    :raises ValueError: If the format is unknown
+    :raises xml.sax.SAXParseException:
+    """
+    if format not in FORMATS:
+        raise ValueError("Unknown format %r, expected one of %s"
+                         % (format, ", ".join(FORMATS)))
+    mapper = get_mapper(extensions)
+    description = read_description(source, namespace_aware, chunk_size)
+    graph_name = _create_id(description) if format == "nquads" else None
+    with blank_node_ids(bnode_mode):
+        return write_ntriples(mapper.iter_triples(description), out,
+                              graph_name)
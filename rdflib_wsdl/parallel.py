@@ -0,0 +1,235 @@
+"""Maps the top-level components of one large description with a pool of
+worker processes.
+
+Interfaces, bindings and services produce disjoint sets of triples, only
+their IRIs connect them. So the top-level components are split in
+slices. Every slice is sent to a worker as a small document, that only
+holds the components of the slice and the components they reference,
+eg the interfaces of bindings. The worker parses and maps it into a
+local buffer. The triples are sent back like in
+:py:mod:`rdflib_wsdl.batch` and merged into the sink in the order of the
+components, so the result doesnt depend on the number of workers.
+
+Referenced components are sent completely, because extensions may read
+their subcomponents, eg of the binding of an endpoint. The main process
+still parses the whole document and scans it once more for the byte
+spans of the top-level components, which are matched to the components
+by their qualified tag and name. Only mapping and the parsing of the
+slices is spread over the workers.
+
+.. code-block:: python
+
+    graph = parse_parallel(path.read_bytes(), workers=4)
+
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple,\
+        Union
+import os
+import re
+import xml.parsers.expat
+
+import rdflib
+
+from .batch import _EncodedTriples, _encode_triples, _decode_term
+from .xmlparser import read_description
+from .xmlparser_states import wsdl_description, SourceCapture,\
+        UnresolvedReference
+from .wsdl_components import _WSDLComponent, Interface, Binding, Service
+from .wsdl2rdf import MapperWSDL2RDF, ExtensionParserData, BatchedSink,\
+        get_mapper
+from .wsdl2rdf.class_MapperWSDL2RDF import mapping_run, blank_node_ids,\
+        _TripleList, _create_id
+from .dataset import description_graph, check_named_graph_sink
+
+_Slice = Tuple[str, int, int]
+"""Kind of top-level component, start and stop index"""
+
+_Extensions = Optional[Union[MapperWSDL2RDF, Iterable[ExtensionParserData]]]
+
+_Span = Tuple[int, int]
+
+_ElementKey = Tuple[str, Optional[str]]
+"""Qualified tag and name attribute of a top-level xml-element"""
+
+_TAGS: Tuple[Tuple[type, str], ...] = ((Interface, "interface"),
+                                       (Binding, "binding"),
+                                       (Service, "service"))
+
+_KINDS = ("interfaces", "bindings", "services")
+
+_ROOT_NAME = re.compile(rb"<([^\s/>]+)")
+
+def parse_parallel(document: bytes,
+                   sink: Optional[rdflib.Graph] = None,
+                   workers: Optional[int] = None,
+                   extensions: _Extensions = None,
+                   namespace_aware: bool = False,
+                   batch_size: Optional[int] = None,
+                   slices_per_worker: int = 4,
+                   bnode_mode: str = "random",
+                   named_graph: bool = False,
+                   ) -> rdflib.Graph:
+    """Parses given wsdl document and maps its top-level components with
+    a pool of worker processes.
+
+    :param sink: If not given, a new :py:class:`rdflib.Graph` is used.
+    :param workers: Number of worker processes. Defaults to the number of
+        cpus. With 1 everything is mapped in this process.
+    :param extensions: See :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper`.
+        Have to be picklable.
+    :param slices_per_worker: The components of every kind are split in
+        this many slices per worker.
+    :param bnode_mode: See :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`
+    :param named_graph: Add the triples to the graph named by the IRI of
+        the description in the store of sink, see
+        :py:func:`rdflib_wsdl.dataset.description_graph`.
+    :returns: sink
+    :raises xml.sax.SAXParseException:
+    :raises ValueError: If named_graph is given and sink cant hold named
+        graphs
+    """
+    if sink is None:
+        sink = rdflib.Dataset() if named_graph else rdflib.Graph()
+    if named_graph:
+        check_named_graph_sink(sink)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    description = read_description(document, namespace_aware)
+    mapper = get_mapper(extensions)
+    target = sink
+    if named_graph:
+        target = description_graph(sink, _create_id(description),
+                                   replace=True)
+    if workers == 1:
+        with blank_node_ids(bnode_mode),\
+                BatchedSink(target, batch_size) as batch:
+            mapper.map_into(batch, description)
+        return sink
+    slices = list(_slices(description, workers * slices_per_worker))
+    documents = list(_slice_documents(document, description, slices))
+    with ProcessPoolExecutor(workers) as executor:
+        results = executor.map(_map_slice, documents,
+                               [kind for kind, start, stop in slices],
+                               [namespace_aware] * len(slices),
+                               [extensions] * len(slices),
+                               [bnode_mode] * len(slices))
+        with BatchedSink(target, batch_size) as batch:
+            for terms, indices in results:
+                terms = [_decode_term(term) for term in terms]
+                for i in range(0, len(indices), 3):
+                    batch.add((terms[indices[i]], terms[indices[i+1]],
+                               terms[indices[i+2]]))
+    with blank_node_ids(bnode_mode), BatchedSink(target, batch_size) as batch:
+        mapper.map_description_properties(batch, description)
+    return sink
+
+def _slices(description: wsdl_description, count: int) -> Iterator[_Slice]:
+    """Splits the components of every kind in up to count slices"""
+    for kind in _KINDS:
+        length = len(getattr(description, kind))
+        step = max(1, -(-length // count))
+        for start in range(0, length, step):
+            yield kind, start, min(start + step, length)
+
+def _slice_documents(document: bytes, description: wsdl_description,
+                     slices: Iterable[_Slice]) -> Iterator[bytes]:
+    """Documents with the root element of document and only the
+    components of every slice and the components they reference.
+
+    :raises ValueError: If a component has no unique xml-element in
+        document
+    """
+    root_start, root_end, root_tag, children = _element_spans(document)
+    span_of: Dict[_ElementKey, Optional[_Span]] = {}
+    for span, key in children:
+        # None marks elements, that arent unique
+        span_of[key] = None if key in span_of else span
+    namespace = root_tag[:root_tag.rfind(" ") + 1]
+    def span(component: _WSDLComponent) -> _Span:
+        tag, = (tag for cls, tag in _TAGS if isinstance(component, cls))
+        found = span_of.get((namespace + tag, component.name))
+        if found is None:
+            raise ValueError("No unique xml-element for %s"
+                             % component.fragment_identifier)
+        return found
+    head = document[:root_end]
+    root_name = _ROOT_NAME.match(document, root_start).group(1)
+    tail = b"</%s>" % root_name
+    for kind, start, stop in slices:
+        needed: Dict[_Span, bytes] = {}
+        for component in getattr(description, kind)[start:stop]:
+            for needed_component in (component, *_references(component)):
+                s, e = span(needed_component)
+                needed[s, e] = document[s:e]
+        yield b"".join((head, *(needed[span] for span in sorted(needed)),
+                        tail))
+
+def _references(component: _WSDLComponent) -> Iterator[_WSDLComponent]:
+    """Top-level components, that are needed to map given component.
+    Unresolved references are left out, mapping in the worker reports
+    them.
+    """
+    try:
+        if isinstance(component, Binding):
+            # Operations and faults are resolved within the interface
+            yield component.interface
+        elif isinstance(component, Service):
+            yield component.interface
+            for endpoint in component.endpoints:
+                yield endpoint.binding
+                yield endpoint.binding.interface
+    except UnresolvedReference:
+        return
+
+def _element_spans(document: bytes,
+                   ) -> Tuple[int, int, str, List[Tuple[_Span, _ElementKey]]]:
+    """Start and end of the start tag of the root element, its qualified
+    tag and the byte spans of its child elements with their qualified
+    tag and name attribute. Qualified tags are the namespace and the
+    local name separated by a space.
+    """
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    source = SourceCapture(document, lambda: parser.CurrentByteIndex)
+    children: List[Tuple[_Span, _ElementKey]] = []
+    root: List[Any] = []
+    depth = 0
+    child_start = 0
+    child_key: _ElementKey = ("", None)
+    def start_element(name: str, attrs: Dict[str, str]) -> None:
+        nonlocal depth, child_start, child_key
+        if depth == 0:
+            root.extend((source.byte_index(),
+                         source.end_of_tag(source.byte_index()), name))
+        elif depth == 1:
+            child_start = source.byte_index()
+            child_key = (name, attrs.get("name"))
+        depth += 1
+    def end_element(name: str) -> None:
+        nonlocal depth
+        depth -= 1
+        if depth == 1:
+            end_of_starttag = source.end_of_tag(child_start)
+            if document[end_of_starttag-2:end_of_starttag] == b"/>":
+                children.append(((child_start, end_of_starttag), child_key))
+            else:
+                children.append(((child_start,
+                                  source.end_of_tag(source.byte_index())),
+                                 child_key))
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.Parse(document, True)
+    return root[0], root[1], root[2], children
+
+def _map_slice(document: bytes, kind: str, namespace_aware: bool,
+               extensions: _Extensions, bnode_mode: str) -> _EncodedTriples:
+    """Runs in the worker processes. Maps all components of given kind
+    in document.
+    """
+    description = read_description(document, namespace_aware)
+    mapper = get_mapper(extensions)
+    triples = _TripleList()
+    with mapping_run(), blank_node_ids(bnode_mode):
+        for component in getattr(description, kind):
+            mapper.map_component(triples, component)
+    return _encode_triples(triples)
@@ -1,9 +1,14 @@
 from urllib.parse import urldefrag, urljoin
+from io import BytesIO, UnsupportedOperation
+from typing import Any, Callable, Optional, Tuple
+import mmap
+import os
+import weakref
 import xml.sax
 from xml.sax import handler, make_parser, xmlreader, SAXParseException
 from xml.sax.handler import ErrorHandler
 from xml.sax.saxutils import escape, quoteattr
-from .xmlparser import WSDLXMLHandler
+from .xmlparser import WSDLXMLHandler, _rereader
     
 import rdflib.parser
 from rdflib.exceptions import Error, ParserError
@@ -13,28 +18,168 @@ from rdflib.term import BNode, Literal, URIRef
 import rdflib
 
 from .wsdl_components import Description
-from .wsdl2rdf import generateRDF
+from .wsdl2rdf import get_mapper
 
 class WSDLXML_PluginException(rdflib.plugin.PluginException):
     """Expected errortype of rdflib.Graph.parse."""
 
 class WSDLXMLParser(rdflib.parser.Parser):
-    """Implementation of a :term:`parser<Parsing>` for `rdflib.plugins`"""
+    """Implementation of a :term:`parser<Parsing>` for `rdflib.plugins`.
+
+    Local files are fed to the xml-reader from a memory map and
+    in-memory bytes from a memoryview, so the document isnt copied.
+    """
     _parser: WSDLXMLHandler
+    feed_size: int = 2**20
+    """Size of the slices fed to the xml-reader"""
 
-    def parse(self, source, sink, preserve_bnode_ids=None):
+    def parse(self, source, sink, preserve_bnode_ids=None,
+              namespace_aware: bool = False, streaming: bool = False,
+              lazy_types: bool = False, extensions=None,
+              batch_size: Optional[int] = None,
+              mapping_workers: Optional[int] = None,
+              skolemize: bool = False, named_graph: bool = False):
         """
+        :param preserve_bnode_ids: Derive the ids of blank nodes, eg of
+            element declarations, from the owning component. So parsing
+            the same document twice gives the same triples.
+        :param namespace_aware: Let the xml-reader resolve namespaces.
+            See :py:meth:`WSDLXMLHandler.create_parser`.
+        :param streaming: Add triples of every top-level component as soon
+            as it is parsed. See :py:meth:`WSDLXMLHandler.create_parser`.
+        :param lazy_types: Content of wsdl:types is kept as part of the
+            read document and only parsed, when accessed. The document
+            is read completely before parsing. The memory map of a local
+            file is closed after parsing, captured spans are read from the
+            file again on access. Other buffers are kept until the parsed
+            description is garbage collected.
+        :param extensions: Extensions used for mapping, eg
+            ``[sawsdlExtension]`` or a mapper like
+            :py:data:`rdflib_wsdl.wsdl2rdf.basicGenerateRDF`. Mappers are
+            cached per set of extensions.
+            See :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper`.
+        :param batch_size: Number of triples added to sink per call of
+            :py:meth:`rdflib.Graph.addN`. Larger batches mean fewer round
+            trips for stores with expensive calls.
+        :param mapping_workers: Map the top-level components with this
+            many worker processes. The document is read completely
+            before parsing. See
+            :py:func:`rdflib_wsdl.parallel.parse_parallel`.
+        :param skolemize: Like preserve_bnode_ids, but skolem IRIs are
+            used instead of blank nodes.
+        :param named_graph: Add the triples to a graph named by the IRI
+            of the description, eg when parsing into a
+            :py:class:`rdflib.Dataset`. Triples of an earlier revision in
+            this graph are replaced. See :py:mod:`rdflib_wsdl.dataset`.
         :raises WSDLXML_PluginException:
+        :raises ValueError: If named_graph is given and sink isnt a
+            Dataset, ConjunctiveGraph or one of their graphs or if
+            lazy_types is given and the document isnt encoded in utf-8
         """
         description: Description
-        self._parser = WSDLXMLHandler.create_parser(source, sink)
-        content_handler = self._parser.getContentHandler()
-        if preserve_bnode_ids is not None:
-            content_handler.preserve_bnode_ids = preserve_bnode_ids
-        # # We're only using it once now
-        # content_handler.reset()
-        # self._parser.reset()
+        if skolemize:
+            bnode_mode = "skolem"
+        elif preserve_bnode_ids:
+            bnode_mode = "stable"
+        else:
+            bnode_mode = "random"
+        if mapping_workers is not None:
+            self._parse_parallel(source, sink, mapping_workers,
+                                 namespace_aware=namespace_aware,
+                                 extensions=extensions,
+                                 batch_size=batch_size,
+                                 bnode_mode=bnode_mode,
+                                 named_graph=named_graph)
+            return
+        source_buffer, release, reread = _open_buffer(source, lazy_types)
+        capture_source = None
+        try:
+            self._parser = WSDLXMLHandler.create_parser(
+                    source, sink, get_mapper(extensions),
+                    namespace_aware=namespace_aware,
+                    streaming=streaming,
+                    source_buffer=source_buffer if lazy_types else None,
+                    batch_size=batch_size,
+                    bnode_mode=bnode_mode,
+                    named_graph=named_graph)
+            capture_source = self._parser.getContentHandler().capture_source
+            if capture_source is not None and reread is None:
+                # Captured spans are read after parsing, so the buffer
+                # lives as long as the states, that reference it
+                weakref.finalize(capture_source, release)
+                release = _keep_buffer
+            # # We're only using it once now
+            # content_handler.reset()
+            # self._parser.reset()
+            try:
+                if source_buffer is None:
+                    self._parser.parse(source)
+                else:
+                    for i in range(0, len(source_buffer), self.feed_size):
+                        self._parser.feed(source_buffer[i:i+self.feed_size])
+                    self._parser.close()
+            except SAXParseException as err:
+                raise WSDLXML_PluginException() from err
+        finally:
+            if capture_source is not None:
+                capture_source.detach()
+                if reread is not None:
+                    capture_source.release_buffer(reread)
+            release()
+
+    def _parse_parallel(self, source, sink, workers: int,
+                        **options: Any) -> None:
+        from .parallel import parse_parallel
+        source_buffer, release, _ = _open_buffer(source, True)
+        try:
+            document = bytes(source_buffer)
+        finally:
+            release()
         try:
-            self._parser.parse(source)
+            parse_parallel(document, sink, workers, **options)
         except SAXParseException as err:
             raise WSDLXML_PluginException() from err
+
+def _keep_buffer() -> None:
+    """Release function for buffers owned by a
+    :py:class:`rdflib_wsdl.xmlparser_states.SourceCapture`
+    """
+
+def _open_buffer(source: xmlreader.InputSource, read_all: bool = False,
+                 ) -> Tuple[Optional[Any], Callable[[], None],
+                            Optional[Callable[[int, int], bytes]]]:
+    """Returns the rest of the document of given source as bytes-like
+    object without copying, if possible. Local files are memory mapped,
+    :py:class:`io.BytesIO` are viewed.
+
+    :param read_all: If no copy-free buffer is available, read the
+        document instead of returning None.
+    :returns: The buffer or None, a function, that releases the buffer,
+        and for memory mapped files a function, that reads a span of the
+        buffer from the file again after release
+    """
+    stream = source.getByteStream()
+    if isinstance(stream, BytesIO):
+        # getvalue shares the bytes of the stream, getbuffer would copy
+        view = memoryview(stream.getvalue())[stream.tell():]
+        return view, view.release, None
+    try:
+        fileno = stream.fileno()
+        position = stream.tell()
+        stat = os.fstat(fileno)
+        if stat.st_size > position:
+            mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)[position:]
+            def release() -> None:
+                view.release()
+                mapped.close()
+            return view, release, _rereader(stream, position, stat)
+    except (AttributeError, UnsupportedOperation, OSError, ValueError):
+        pass
+    if read_all:
+        if stream is None:
+            data = source.getCharacterStream().read().encode("utf-8")
+        else:
+            data = stream.read()
+        return data, lambda: None, None
+    return None, lambda: None, None
@@ -1,5 +1,5 @@
 from rdflib import Namespace, RDF, Literal, URIRef
-from collections.abc import Mapping, Iterable
+from collections.abc import Mapping, Iterable, Iterator
 from typing import Tuple, Optional
 import re
 
@@ -13,12 +13,74 @@ _ns_wrpc = "http://www.w3.org/ns/wsdl/rpc#"
 _ns_sawsdl = "http://www.w3.org/ns/sawsdl#"
 _ns_xs = "http://www.w3.org/2001/XMLSchema"
 """Standard namespace of xs"""
-WHTTP = Namespace("http://www.w3.org/ns/wsdl/http#")
-WSDL = Namespace("http://www.w3.org/ns/wsdl-rdf#")
-WSDLX = Namespace("http://www.w3.org/ns/wsdl-extensions#")
-WSDL_RDF = Namespace(_ns_wsdlrdf)
-WSOAP = Namespace("http://www.w3.org/ns/wsdl/soap#")
-SAWSDL = Namespace(_ns_sawsdl)
+_ns_xml = "http://www.w3.org/XML/1998/namespace"
+"""Namespace bound to the prefix xml"""
+
+class InternedNamespace(Namespace):
+    """Namespace, that creates every term only once. Repeated access
+    returns the same :py:class:`rdflib.URIRef`. Terms of given vocabulary
+    are created in advance.
+    """
+    _terms: dict
+
+    def __new__(cls, value: str, vocabulary: Iterable[str] = ()):
+        self = super().__new__(cls, value)
+        self._terms = {}
+        for name in vocabulary:
+            self.term(name)
+        return self
+
+    def term(self, name: str) -> URIRef:
+        try:
+            return self._terms[name]
+        except KeyError:
+            pass
+        term = super().term(name)
+        self._terms[name] = term
+        if name.isidentifier() and not hasattr(type(self), name):
+            # Following attribute access doesnt need __getattr__
+            self.__dict__[name] = term
+        return term
+
+    def __getattr__(self, name: str) -> URIRef:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.term(name)
+
+WHTTP = InternedNamespace("http://www.w3.org/ns/wsdl/http#", (
+    "BindingUsesHTTPCookies", "authentificationRealm",
+    "authentificationScheme", "contentEncoding", "defaultContentEncoding",
+    "defaultMethod", "defaultQueryParameterSeparator", "errorCode",
+    "faultSerialization", "inputSerialization", "location",
+    "locationIgnoreUncited", "method", "offersHeader", "outputSerialization",
+    "queryParameterSeparator", "requiresHeader",
+    ))
+WSDL = InternedNamespace("http://www.w3.org/ns/wsdl-rdf#", (
+    "AnyContent", "Binding", "BindingFault", "BindingFaultReference",
+    "BindingMessageReference", "BindingOperation", "Description",
+    "ElementContent", "Endpoint", "InputMessage", "Interface",
+    "InterfaceFault", "InterfaceFaultReference", "InterfaceMessageReference",
+    "InterfaceOperation", "NoContent", "OtherContent", "OutputMessage",
+    "QName", "Service", "address", "binding", "bindingFault",
+    "bindingFaultReference", "bindingMessageReference", "bindingOperation",
+    "binds", "elementDeclaration", "endpoint", "extends", "implements",
+    "interface", "interfaceFault", "interfaceFaultReference",
+    "interfaceMessageReference", "interfaceOperation", "localName",
+    "messageContentModel", "messageExchangePattern", "messageLabel",
+    "namespace", "operationStyle", "service", "typeDefinition",
+    "usesBinding",
+    ))
+WSDLX = InternedNamespace("http://www.w3.org/ns/wsdl-extensions#", (
+    "SafeInteraction",
+    ))
+WSDL_RDF = WSDL
+WSOAP = InternedNamespace("http://www.w3.org/ns/wsdl/soap#", (
+    "action", "defaultSoapMEP", "faultCode", "protocol", "soapMEP",
+    "version",
+    ))
+SAWSDL = InternedNamespace(_ns_sawsdl, (
+    "modelReference",
+    ))
 
 MEP_inOnly = "http://www.w3.org/ns/wsdl/in-only"
 MEP_robustInOnly = "http://www.w3.org/ns/wsdl/robust-in-only"
@@ -29,10 +91,74 @@ MEP_robustOutOnly = "http://www.w3.org/ns/wsdl/robust-out-only"
 MEP_outIn = "http://www.w3.org/ns/wsdl/out-in"
 MEP_outOptionalIn = "http://www.w3.org/ns/wsdl/out-opt-in"
 
+class NamespaceScope(Mapping):
+    """Prefixes in scope of a xml-element. Only prefixes declared on the
+    element itself are stored. All other prefixes are resolved via the
+    parent scope. Elements without new declarations share the scope of
+    their parent.
+    """
+    __slots__ = ("parent", "_declared", "_cache")
+    parent: Optional["NamespaceScope"]
+    _declared: Mapping[str, str]
+    _cache: dict
+
+    def __init__(self, declared: Mapping[str, str] = {},
+                 parent: Optional["NamespaceScope"] = None,
+                 ) -> None:
+        self.parent = parent
+        self._declared = declared
+        self._cache = {}
+
+    def child(self, declared: Mapping[str, str]) -> "NamespaceScope":
+        """Returns the scope of a child element, that declares given
+        prefixes.
+        """
+        if not declared:
+            return self
+        return type(self)(declared, self)
+
+    def __getitem__(self, prefix: str) -> str:
+        try:
+            return self._declared[prefix]
+        except KeyError:
+            pass
+        try:
+            return self._cache[prefix]
+        except KeyError:
+            pass
+        if self.parent is None:
+            raise KeyError(prefix)
+        namespace = self.parent[prefix]
+        self._cache[prefix] = namespace
+        return namespace
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        scope: Optional[NamespaceScope] = self
+        while scope is not None:
+            for prefix in scope._declared:
+                if prefix not in seen:
+                    seen.add(prefix)
+                    yield prefix
+            scope = scope.parent
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return "NamespaceScope(%s)" % dict(self)
+
+
 def name2qname(name: str,
                defaultNS: str,
                otherNS: Mapping[str, str],
                ) -> Tuple[str, str]:
+    """Resolves a prefixed name.
+
+    :param otherNS: Mapping of prefixes to namespaces, eg
+        a :py:class:`NamespaceScope`
+    :raises KeyError: if prefix is unknown
+    """
     qname = name.split(":")
     if len(qname) == 1:
         return (defaultNS, name)
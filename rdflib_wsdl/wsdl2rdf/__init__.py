@@ -11,46 +11,122 @@ Plugin support for parser of :term:`WSDL`. This module uses the
 If you are using setuptools, you can implement a :py:class:`rdflib_wsdl.wsdl2rdf.class_MapperWSDL2RDF.ExtensionParserData` as an entry point
 as described in
 `https://setuptools.pypa.io/en/latest/userguide/entry_point.html#entry-points-for-plugins`_
+
+Plugins are only discovered on first use of :py:data:`additional_parser`,
+:py:data:`all_parser`, :py:data:`generateRDF` or :py:func:`get_mapper`.
+See :py:mod:`rdflib_wsdl.wsdl2rdf.plugin_discovery` for an optional
+on-disk manifest of the found plugins.
 """
-import sys
+import threading
 import typing as typ
-if sys.version_info < (3, 10):
-    from importlib_metadata import entry_points
-else:
-    from importlib.metadata import entry_points
-from .class_MapperWSDL2RDF import MapperWSDL2RDF, ExtensionParserData
+from collections import OrderedDict
+from .class_MapperWSDL2RDF import MapperWSDL2RDF, ExtensionParserData,\
+        yield_extension, legacy_extension, blank_node_ids, BNODE_MODES
 from .extensions import ParserData, sawsdlExtension, httpExtension, soapExtension
 from .python_extension import python_extension
+from .sink import BatchedSink, DEFAULT_BATCH_SIZE
 
-additional_parser: typ.Iterable[ExtensionParserData]\
-        = [sawsdlExtension, httpExtension, soapExtension, python_extension,
-           *(x.load() for x in entry_points(group='rdflib_wsdl.extensions.parser'))
-           ]
-"""All available additional parsers specified by
-entrypoint 'rdflib_wsdl.extensions.parser'. See parser for more information.
-Can be extended instead of relying on entrypoints:
+if typ.TYPE_CHECKING:
+    additional_parser: typ.List[ExtensionParserData]
+    all_parser: typ.List[ExtensionParserData]
+    basicGenerateRDF: MapperWSDL2RDF
+    generateRDF: MapperWSDL2RDF
 
-```
-my_parser_plugin = ParserData(...)
-rdflib_wsdl.wsdl2rdf.additional_parser.append(my_parser_plugin)
-```
+def _additional_parser() -> typ.List[ExtensionParserData]:
+    """All available additional parsers specified by
+    entrypoint 'rdflib_wsdl.extensions.parser'. See parser for more information.
+    Can be extended instead of relying on entrypoints:
 
-A :term:`rdflib_wsdl plugin`.
-"""
+    ```
+    my_parser_plugin = ParserData(...)
+    rdflib_wsdl.wsdl2rdf.additional_parser.append(my_parser_plugin)
+    ```
 
-all_parser = [sawsdlExtension, httpExtension, soapExtension, python_extension,
-              *additional_parser]
-"""All available parsers, so additional and builtin.
-See `additional_parser` for more information.
-"""
+    A :term:`rdflib_wsdl plugin`.
+    """
+    from .plugin_discovery import load_plugins
+    return [sawsdlExtension, httpExtension, soapExtension, python_extension,
+            *load_plugins()]
+
+def _all_parser() -> typ.List[ExtensionParserData]:
+    """All available parsers, so additional and builtin.
+    See `additional_parser` for more information.
+    """
+    return [sawsdlExtension, httpExtension, soapExtension, python_extension,
+            *__getattr__("additional_parser")]
+
+def _basicGenerateRDF() -> MapperWSDL2RDF:
+    """Basic wsdl to rdf transform with only builtin plugins enabled"""
+    return MapperWSDL2RDF.create_with_parser_data(
+            additional_extensions = [sawsdlExtension, httpExtension,
+                                     soapExtension]
+            )
 
-basicGenerateRDF = MapperWSDL2RDF.create_with_parser_data(
-        additional_extensions = [sawsdlExtension, httpExtension, soapExtension]
-        )
-"""Basic wsdl to rdf transform with only builtin plugins enabled"""
+def _generateRDF() -> MapperWSDL2RDF:
+    """WSDL to RDF transform with all found :term:`plugins<WSDL plugin>`
+    enabled.
+    """
+    return MapperWSDL2RDF.create_with_parser_data(
+            additional_extensions = __getattr__("all_parser"),
+            )
 
-generateRDF = MapperWSDL2RDF.create_with_parser_data(
-        additional_extensions = all_parser,
-        )
-"""WSDL to RDF transform with all found :term:`plugins<WSDL plugin>` enabled.
+_lazy_attributes: typ.Mapping[str, typ.Callable[[], typ.Any]] = {
+        "additional_parser": _additional_parser,
+        "all_parser": _all_parser,
+        "basicGenerateRDF": _basicGenerateRDF,
+        "generateRDF": _generateRDF,
+        }
+_lock = threading.RLock()
+
+def __getattr__(name: str) -> typ.Any:
+    """Creates the attributes in :py:data:`_lazy_attributes` on first
+    access. Afterwards they are plain module attributes.
+    """
+    try:
+        factory = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r"
+                             % (__name__, name)) from None
+    with _lock:
+        if name not in globals():
+            globals()[name] = factory()
+        return globals()[name]
+
+MAPPER_CACHE_SIZE: int = 32
+"""Number of mappers, that :py:func:`get_mapper` keeps. The least recently
+used mapper is dropped first.
 """
+_CacheEntry = typ.Tuple[typ.List[ExtensionParserData], MapperWSDL2RDF]
+_mappers: "OrderedDict[typ.Tuple[int, ...], _CacheEntry]" = OrderedDict()
+
+def get_mapper(extensions: typ.Optional[typ.Union[
+                    MapperWSDL2RDF, typ.Iterable[ExtensionParserData]]] = None,
+               ) -> MapperWSDL2RDF:
+    """Returns a cached mapper for given set of extensions. Mappers hold
+    no state between mappings, so they can be shared. Only the
+    :py:data:`MAPPER_CACHE_SIZE` most recently used mappers are kept.
+
+    :param extensions: Defaults to :py:data:`additional_parser`. If a
+        mapper is given, it is returned as is.
+    """
+    if isinstance(extensions, MapperWSDL2RDF):
+        return extensions
+    if extensions is None:
+        extensions = __getattr__("additional_parser")
+    extensions = list(extensions)
+    key = tuple(map(id, extensions))
+    with _lock:
+        try:
+            # extensions are kept with the mapper, so that their ids
+            # arent reused while the entry exists
+            mapper = _mappers[key][1]
+        except KeyError:
+            mapper = MapperWSDL2RDF.create_with_parser_data(
+                    additional_extensions = extensions,
+                    )
+            _mappers[key] = (extensions, mapper)
+            while len(_mappers) > MAPPER_CACHE_SIZE:
+                _mappers.popitem(last=False)
+        else:
+            _mappers.move_to_end(key)
+        return mapper
@@ -1,7 +1,13 @@
 from rdflib import Graph, URIRef, BNode, RDF, RDFS, Literal,\
         IdentifiedNode, XSD
-from typing import Mapping, Iterable, TypeVar, TypeAlias, Callable, Optional
-from urllib.parse import urlparse, urlunparse
+from rdflib.term import Node
+from typing import Mapping, Iterable, TypeVar, TypeAlias, Callable, Optional,\
+        Dict, Tuple, Iterator
+from urllib.parse import urlparse, urlunparse, ParseResult
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import lru_cache
+from hashlib import sha1
 from ..wsdl_components import Binding, BindingFaultReference,\
         BindingMessageReference, BindingOperation, Description,\
         ElementDeclaration, Endpoint, Interface, InterfaceFault,\
@@ -13,6 +19,7 @@ from ..shared import _ns_wsdl, _ns_wsdlx, _ns_wsdlrdf, _ns_wsoap, _ns_whttp,\
         SAWSDL, name2qname,\
         MEP_inOnly, MEP_robustInOnly, MEP_inOut, MEP_inOptionalOut,\
         MEP_outOnly, MEP_robustOutOnly, MEP_outIn, MEP_outOptionalIn
+from .terms import iri, literal, message_label_uri
 
 MESSAGECONTENTMODEL2URI = {MCM_ANY: WSDL.AnyContent,
                            MCM_NONE: WSDL.NoContent,
@@ -26,53 +33,152 @@ def _qname2rdfframes(namespace: str, local_name: str) -> Iterable:
     """
     yield RDF.type, WSDL.QName
     yield WSDL.localName, Literal(local_name)
-    yield WSDL.namespace, URIRef(namespace)
+    yield WSDL.namespace, iri(namespace)
+
+_iri_cache: ContextVar[Optional[Dict[int, Tuple[_WSDLComponent, URIRef]]]]\
+        = ContextVar("_iri_cache", default=None)
+"""IRIs of components created during the current mapping run. The
+components are kept, so that their ids arent reused.
+"""
+
+@contextmanager
+def mapping_run() -> Iterator[None]:
+    """Within a mapping run the IRI of every component is created only
+    once. Nested runs use the cache of the outermost run.
+    """
+    if _iri_cache.get() is not None:
+        yield
+        return
+    token = _iri_cache.set({})
+    try:
+        yield
+    finally:
+        _iri_cache.reset(token)
 
 def _create_id(element: _WSDLComponent) -> URIRef:
-    """`https://www.w3.org/TR/wsdl20/#wsdl-iri-references`_"""
+    """`https://www.w3.org/TR/wsdl20/#wsdl-iri-references`_
+
+    Is cached within a :py:func:`mapping_run`.
+    """
+    cache = _iri_cache.get()
+    if cache is not None:
+        try:
+            return cache[id(element)][1]
+        except KeyError:
+            pass
     fragment = element.fragment_identifier
-    return _qname2id(element.targetNamespace, fragment)
+    iri = _qname2id(element.targetNamespace, fragment)
+    if cache is not None:
+        cache[id(element)] = (element, iri)
+    return iri
+
+BNODE_MODES = ("random", "stable", "skolem")
+"""Modes for nodes without an IRI like element declarations. ``random``
+creates a new blank node every time. ``stable`` derives the id of the
+blank node from the IRI of the owning component and the role of the
+node, so parsing the same document twice gives the same triples.
+``skolem`` uses skolem IRIs with these ids instead of blank nodes.
+"""
+
+_bnode_mode: ContextVar[str] = ContextVar("_bnode_mode", default="random")
+
+@contextmanager
+def blank_node_ids(mode: str) -> Iterator[None]:
+    """Sets, how nodes without IRI are created in this context. See
+    :py:data:`BNODE_MODES`.
+
+    :raises ValueError: If mode is unknown
+    """
+    if mode not in BNODE_MODES:
+        raise ValueError("Unknown mode %r, expected one of %s"
+                         % (mode, ", ".join(BNODE_MODES)))
+    token = _bnode_mode.set(mode)
+    try:
+        yield
+    finally:
+        _bnode_mode.reset(token)
+
+def _create_bnode(owner: _WSDLComponent, role: str) -> IdentifiedNode:
+    """Node without IRI of its own, that belongs to owner. Owner may only
+    have one node per role.
+    """
+    mode = _bnode_mode.get()
+    if mode == "random":
+        return BNode()
+    owner_iri = _create_id(owner)
+    node_id = "wsdl" + sha1(("%s %s" % (owner_iri, role)).encode("utf-8"))\
+            .hexdigest()
+    if mode == "stable":
+        return BNode(node_id)
+    q = _parse_namespace(owner_iri)
+    if not q.netloc:
+        return BNode(node_id).skolemize()
+    return URIRef("%s://%s/.well-known/genid/%s"
+                  % (q.scheme, q.netloc, node_id))
+
+@lru_cache(maxsize=256)
+def _parse_namespace(namespace: str) -> ParseResult:
+    return urlparse(namespace)
 
 def _qname2id(namespace: str, name: str) -> URIRef:
     """`https://www.w3.org/TR/wsdl20/#wsdl-iri-references`_"""
-    q = urlparse(namespace)
+    q = _parse_namespace(namespace)
     return URIRef(urlunparse(q._replace(fragment = name)))
 
-def _messageLabel2URI(message_label: str, message_exchange_pattern: str,
-                      ) -> URIRef:
-    """`https://www.w3.org/TR/wsdl20-rdf/#meps`_"""
-    if message_exchange_pattern == MEP_inOnly:
-        return URIRef("http://www.w3.org/ns/wsdl/in-only#In")
-    elif message_exchange_pattern == MEP_robustInOnly:
-        return URIRef("http://www.w3.org/ns/wsdl/robust-in-only#In")
-    elif message_exchange_pattern == MEP_inOut:
-        if message_label.upper() == "IN":
-            return URIRef("http://www.w3.org/ns/wsdl/in-out#In")
-        else:
-            return URIRef("http://www.w3.org/ns/wsdl/in-out#Out")
-    elif message_exchange_pattern == MEP_inOptionalOut:
-        if message_label.upper() == "IN":
-            return URIRef("http://www.w3.org/ns/wsdl/in-opt-out#In")
-        else:
-            return URIRef("http://www.w3.org/ns/wsdl/in-opt-out#Out")
-    elif message_exchange_pattern == MEP_outOnly:
-        return URIRef("http://www.w3.org/ns/wsdl/out-only#Out")
-    elif message_exchange_pattern == MEP_robustOutOnly:
-        return URIRef("http://www.w3.org/ns/wsdl/robust-out-only#Out")
-    elif message_exchange_pattern == MEP_outIn:
-        if message_label.upper() == "IN":
-            return URIRef("http://www.w3.org/ns/wsdl/out-in#In")
-        else:
-            return URIRef("http://www.w3.org/ns/wsdl/out-in#Out")
-    elif message_exchange_pattern == MEP_outOptionalIn:
-        if message_label.upper() == "IN":
-            return URIRef("http://www.w3.org/ns/wsdl/out-opt-in#In")
-        else:
-            return URIRef("http://www.w3.org/ns/wsdl/out-opt-in#Out")
-    raise NotImplementedError(message_label, message_exchange_pattern)
-
 _C = TypeVar("_C")
+_Triple = Tuple[Node, Node, Node]
 WSDLMAPPER: TypeAlias = Callable[[Graph, _C], None]
+"""Extension, that adds the triples of given component to given graph.
+The graph is only a stand-in, that collects the triples, so extensions
+may only call its ``add``. See :py:func:`legacy_extension`.
+"""
+WSDLTRIPLES: TypeAlias = Callable[[_C], Iterable[_Triple]]
+"""Extension, that returns or yields the triples of given component.
+Has to be marked with :py:func:`yield_extension`.
+"""
+
+def yield_extension(extension: WSDLTRIPLES[_C]) -> WSDLTRIPLES[_C]:
+    """Marks given function as extension, that yields triples instead of
+    adding them to a graph. Use as decorator:
+
+    .. code-block:: python
+
+        @yield_extension
+        def my_endpoint_extension(endpoint):
+            yield _create_id(endpoint), RDF.type, MY.Endpoint
+
+    """
+    extension.yields_triples = True
+    return extension
+
+class _TripleList(list):
+    """Stands in for the graph given to extensions, that add triples.
+    Only ``add`` is supported, reading isnt.
+    """
+    add = list.append
+
+def legacy_extension(extension: WSDLMAPPER[_C]) -> WSDLTRIPLES[_C]:
+    """Adapter for extensions with the signature ``(graph, component)``.
+    The mapper applies this itself to all unmarked extensions.
+
+    Instead of a :py:class:`rdflib.Graph` the extension gets a list, that
+    only supports ``add``. Extensions, that read the graph, eg via
+    ``in``, ``triples`` or ``value``, have to be rewritten with
+    :py:func:`yield_extension`.
+    """
+    if getattr(extension, "yields_triples", False):
+        return extension
+    @yield_extension
+    def triples(component: _C) -> Iterable[_Triple]:
+        collected = _TripleList()
+        extension(collected, component)
+        return collected
+    return triples
+
+def _extension_triples(extensions: Iterable[Callable], component: _C,
+                       ) -> Iterator[_Triple]:
+    for extension in extensions:
+        yield from legacy_extension(extension)(component)
 
 class ExtensionParserData:
     """
@@ -115,6 +221,7 @@ class MapperWSDL2RDF:
                     Iterable[WSDLMAPPER[Description]] = [],
             ext_interfaceFault:\
                     Iterable[WSDLMAPPER[InterfaceFault]] = [],
+            ext_interface: Iterable[WSDLMAPPER[Interface]] = [],
             additional_extensions: Iterable[ExtensionParserData] = [],
             ) -> "MapperWSDL2RDF":
         """Creates a mapper with packed extensions. Use this for easy
@@ -124,6 +231,7 @@ class MapperWSDL2RDF:
         ext_interfaceMessageReference = list(ext_interfaceMessageReference)
         ext_interfaceFaultReference = list(ext_interfaceFaultReference)
         ext_interfaceFault = list(ext_interfaceFault)
+        ext_interface = list(ext_interface)
         ext_service = list(ext_service)
         ext_binding = list(ext_binding)
         ext_bindingOperation = list(ext_bindingOperation)
@@ -141,6 +249,8 @@ class MapperWSDL2RDF:
                 ext_interfaceFaultReference.append(add.interfaceFaultReference)
             if add.interfaceFault is not None:
                 ext_interfaceFault.append(add.interfaceFault)
+            if getattr(add, "interface", None) is not None:
+                ext_interface.append(add.interface)
             if add.service is not None:
                 ext_service.append(add.service)
             if add.binding is not None:
@@ -171,6 +281,7 @@ class MapperWSDL2RDF:
                 ext_interfaceMessageReference = ext_interfaceMessageReference,
                 ext_description = ext_description,
                 ext_interfaceFault = ext_interfaceFault,
+                ext_interface = ext_interface,
                 )
 
 
@@ -195,12 +306,17 @@ class MapperWSDL2RDF:
                     Iterable[WSDLMAPPER[Description]] = [],
             ext_interfaceFault:\
                     Iterable[WSDLMAPPER[InterfaceFault]] = [],
+            ext_interface: Iterable[WSDLMAPPER[Interface]] = [],
             ):
-        """Register all extensions"""
+        """Register all extensions. Extensions either add triples to a
+        given graph (:py:data:`WSDLMAPPER`) or are marked with
+        :py:func:`yield_extension` and yield them (:py:data:`WSDLTRIPLES`).
+        """
         self.ext_description = list(ext_description)
         self.ext_interfaceMessageReference = list(ext_interfaceMessageReference)
         self.ext_interfaceFaultReference = list(ext_interfaceFaultReference)
         self.ext_interfaceFault = list(ext_interfaceFault)
+        self.ext_interface = list(ext_interface)
         self.ext_service = list(ext_service)
         self.ext_binding = list(ext_binding)
         self.ext_bindingOperation = list(ext_bindingOperation)
@@ -212,229 +328,289 @@ class MapperWSDL2RDF:
 
     def __call__(self, basedescription: Description) -> Graph:
         g = Graph()
-        self._map_description(g, basedescription)
+        self.map_into(g, basedescription)
         return g
 
-    def _map_description(self, g: Graph, description: Description) -> None:
-        """`https://www.w3.org/TR/wsdl20-rdf/#description`_"""
+    def map_into(self, sink: Graph, description: Description) -> None:
+        """Maps the whole description directly into sink. Only
+        :py:meth:`rdflib.Graph.add` of sink is used, so a
+        :py:class:`rdflib_wsdl.wsdl2rdf.sink.BatchedSink` can be given.
+        """
+        add = sink.add
+        with mapping_run():
+            for triple in self._iter_description(description):
+                add(triple)
+
+    def iter_triples(self, description: Description) -> Iterator[_Triple]:
+        """Yields the triples of the whole description without collecting
+        them in a graph. Components are mapped, when the iterator reaches
+        them. The returned iterator forms its own mapping run, see
+        :py:func:`mapping_run`.
+        """
+        context = copy_context()
+        if context.run(_iri_cache.get) is None:
+            context.run(_iri_cache.set, {})
+        triples = self._iter_description(description)
+        while True:
+            # Steps run in the copied context, so the cache doesnt leak
+            # to the consumer between the steps
+            triple = context.run(next, triples, None)
+            if triple is None:
+                return
+            yield triple
+
+    def map_component(self, g: Graph,
+                      component: Interface | Binding | Service) -> None:
+        """Maps a single top-level component of a description with all
+        its subcomponents. Used, when components are mapped as soon as
+        they are parsed.
+
+        :raises KeyError: If a referenced component is not available
+        """
+        add = g.add
+        with mapping_run():
+            for triple in self._iter_component(component):
+                add(triple)
+
+    def map_description_properties(self, g: Graph,
+                                   description: Description) -> None:
+        """Maps only the description itself without its top-level
+        components. See :py:meth:`map_component`.
+        """
+        add = g.add
+        with mapping_run():
+            for triple in self._iter_description_properties(description):
+                add(triple)
+
+    def _iter_component(self, component: Interface | Binding | Service,
+                        ) -> Iterator[_Triple]:
+        if isinstance(component, Interface):
+            return self._iter_interface(component)
+        elif isinstance(component, Binding):
+            return self._iter_binding(component)
+        elif isinstance(component, Service):
+            return self._iter_service(component)
+        else:
+            raise TypeError("Expected interface, binding or service, "
+                            "got %r" % component)
+
+    def _iter_description_properties(self, description: Description,
+                                     ) -> Iterator[_Triple]:
         elemid = _create_id(description)
-        g.add((elemid, RDF.type, WSDL.Description))
+        yield (elemid, RDF.type, WSDL.Description)
+        yield from _extension_triples(self.ext_description, description)
+        #ignore type_definitions, element_declarations
+
+    def _iter_description(self, description: Description,
+                          ) -> Iterator[_Triple]:
+        """`https://www.w3.org/TR/wsdl20-rdf/#description`_"""
         for interface in description.interfaces:
-            self._map_interface(g, interface)
+            yield from self._iter_interface(interface)
         for binding in description.bindings:
-            self._map_binding(g, binding)
+            yield from self._iter_binding(binding)
         for service in description.services:
-            self._map_service(g, service)
-        for extmap in self.ext_description:
-            extmap(g, description)
-        #ignore type_definitions, element_declarations
+            yield from self._iter_service(service)
+        yield from self._iter_description_properties(description)
 
-    def _map_interface(self, g: Graph, interface: Interface) -> None:
+    def _iter_interface(self, interface: Interface) -> Iterator[_Triple]:
         elemid = _create_id(interface)
         parentid = _create_id(interface.parent)
-        g.add((elemid, RDF.type, WSDL.Interface))
-        g.add((parentid, WSDL.interface, elemid))
-        g.add((elemid, RDFS.label, Literal(interface.name)))
+        yield (elemid, RDF.type, WSDL.Interface)
+        yield (parentid, WSDL.interface, elemid)
+        yield (elemid, RDFS.label, Literal(interface.name))
         for other_interface in interface.extended_interfaces:
             otherid = _create_id(other_interface)
-            g.add((elemid, WSDL.extends, otherid))
+            yield (elemid, WSDL.extends, otherid)
         for interface_operation in interface.interface_operations:
-            self._map_interfaceOperation(g, interface_operation)
+            yield from self._iter_interfaceOperation(interface_operation)
         for interface_fault in interface.interface_faults:
-            self._map_interfaceFault(g, interface_fault)
-        for extmap in self.ext_interfaceFault:
-            extmap(g, interface_fault)
+            yield from self._iter_interfaceFault(interface_fault)
+        yield from _extension_triples(self.ext_interface, interface)
 
-    def _map_interfaceOperation(self, g: Graph,
-                                interfaceOperation: InterfaceOperation,
-                                ) -> None:
+    def _iter_interfaceOperation(self,
+                                 interfaceOperation: InterfaceOperation,
+                                 ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-4`_"""
         elemid = _create_id(interfaceOperation)
         parentid = _create_id(interfaceOperation.parent)
-        g.add((elemid, RDF.type, WSDL.InterfaceOperation))
-        g.add((parentid, WSDL.interfaceOperation, elemid))
-        g.add((elemid, RDFS.label, Literal(interfaceOperation.name)))
+        yield (elemid, RDF.type, WSDL.InterfaceOperation)
+        yield (parentid, WSDL.interfaceOperation, elemid)
+        yield (elemid, RDFS.label, Literal(interfaceOperation.name))
         for imr in interfaceOperation.interface_message_references:
-            self._map_interfaceMessageReference(g, imr)
+            yield from self._iter_interfaceMessageReference(imr)
         for ifr in interfaceOperation.interface_fault_references:
-            self._map_interfaceFaultReference(g, ifr)
+            yield from self._iter_interfaceFaultReference(ifr)
         mep = interfaceOperation.message_exchange_pattern
-        g.add((elemid, WSDL.messageExchangePattern, URIRef(mep)))
+        yield (elemid, WSDL.messageExchangePattern, iri(mep))
         for style in interfaceOperation.style:
-            g.add((elemid, WSDL.operationStyle, URIRef(style)))
-        for extmap in self.ext_interfaceOperation:
-            extmap(g, interfaceOperation)
-
-    def _map_interfaceMessageReference(
-            self, g: Graph,
-            interfaceMessageReference: InterfaceMessageReference,
-            ) -> None:
+            yield (elemid, WSDL.operationStyle, iri(style))
+        yield from _extension_triples(self.ext_interfaceOperation,
+                                      interfaceOperation)
+
+    def _iter_interfaceMessageReference(
+            self, interfaceMessageReference: InterfaceMessageReference,
+            ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-6`_"""
         elemid = _create_id(interfaceMessageReference)
         parentid = _create_id(interfaceMessageReference.parent)
-        g.add((elemid, RDF.type, WSDL.InterfaceMessageReference))
-        g.add((parentid, WSDL.interfaceMessageReference, elemid))
+        yield (elemid, RDF.type, WSDL.InterfaceMessageReference)
+        yield (parentid, WSDL.interfaceMessageReference, elemid)
         mcm = interfaceMessageReference.message_content_model
         if mcm == MCM_ELEMENT:
-            elementDeclaration_id = BNode()
-            g.add((elemid, WSDL.elementDeclaration, elementDeclaration_id))
+            elementDeclaration_id = _create_bnode(interfaceMessageReference,
+                                                  "elementDeclaration")
+            yield (elemid, WSDL.elementDeclaration, elementDeclaration_id)
             elem_ns, elem_name = interfaceMessageReference.element_declaration
             for prop, obj in _qname2rdfframes(elem_ns, elem_name):
-                g.add((elementDeclaration_id, prop, obj))
-        g.add((elemid, WSDL.messageContentModel, MESSAGECONTENTMODEL2URI[mcm]))
+                yield (elementDeclaration_id, prop, obj)
+        yield (elemid, WSDL.messageContentModel, MESSAGECONTENTMODEL2URI[mcm])
         if interfaceMessageReference.direction == "in":
-            g.add((elemid, RDF.type, WSDL.InputMessage))
+            yield (elemid, RDF.type, WSDL.InputMessage)
         else:
-            g.add((elemid, RDF.type, WSDL.OutputMessage))
-        ml_id = _messageLabel2URI(
+            yield (elemid, RDF.type, WSDL.OutputMessage)
+        ml_id = message_label_uri(
                 interfaceMessageReference.message_label,
                 interfaceMessageReference.parent.message_exchange_pattern)
-        g.add((elemid, WSDL.messageLabel, ml_id))
-        for extmap in self.ext_interfaceMessageReference:
-            extmap(g, interfaceMessageReference)
-
-    def _map_interfaceFaultReference(
-            self, g: Graph,
-            interfaceFaultReference: InterfaceFaultReference,
-            ) -> None:
+        yield (elemid, WSDL.messageLabel, ml_id)
+        yield from _extension_triples(self.ext_interfaceMessageReference,
+                                      interfaceMessageReference)
+
+    def _iter_interfaceFaultReference(
+            self, interfaceFaultReference: InterfaceFaultReference,
+            ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-7`_"""
         elemid = _create_id(interfaceFaultReference)
         parentid = _create_id(interfaceFaultReference.parent)
-        g.add((elemid, RDF.type, WSDL.InterfaceFaultReference))
-        g.add((parentid, WSDL.interfaceFaultReference, elemid))
+        yield (elemid, RDF.type, WSDL.InterfaceFaultReference)
+        yield (parentid, WSDL.interfaceFaultReference, elemid)
         interFault = interfaceFaultReference.interface_fault
-        g.add((elemid, WSDL.interfaceFault, _create_id(interFault)))
+        yield (elemid, WSDL.interfaceFault, _create_id(interFault))
         if interfaceFaultReference.direction == "in":
-            g.add((elemid, RDF.type, WSDL.InputMessage))
+            yield (elemid, RDF.type, WSDL.InputMessage)
         else:
-            g.add((elemid, RDF.type, WSDL.OutputMessage))
-        ml_id = _messageLabel2URI(
+            yield (elemid, RDF.type, WSDL.OutputMessage)
+        ml_id = message_label_uri(
                 interfaceFaultReference.message_label,
                 interfaceFaultReference.parent.message_exchange_pattern,
                 )
-        g.add((elemid, WSDL.messageLabel, ml_id))
-        for extmap in self.ext_interfaceFaultReference:
-            extmap(g, interfaceFaultReference)
+        yield (elemid, WSDL.messageLabel, ml_id)
+        yield from _extension_triples(self.ext_interfaceFaultReference,
+                                      interfaceFaultReference)
 
 
-    def _map_interfaceFault(
-            self, g: Graph,
-            interfaceFault: InterfaceFault,
-            ) -> None:
+    def _iter_interfaceFault(
+            self, interfaceFault: InterfaceFault,
+            ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-5`_"""
         elemid = _create_id(interfaceFault)
         parentid = _create_id(interfaceFault.parent)
-        g.add((elemid, RDF.type, WSDL.InterfaceFault))
-        g.add((parentid, WSDL.interfaceFault, elemid))
-        g.add((elemid, RDFS.label, Literal(interfaceFault.name)))
-        elementDeclaration_id = BNode()
-        g.add((elemid, WSDL.elementDeclaration, elementDeclaration_id))
+        yield (elemid, RDF.type, WSDL.InterfaceFault)
+        yield (parentid, WSDL.interfaceFault, elemid)
+        yield (elemid, RDFS.label, Literal(interfaceFault.name))
+        elementDeclaration_id = _create_bnode(interfaceFault,
+                                              "elementDeclaration")
+        yield (elemid, WSDL.elementDeclaration, elementDeclaration_id)
         for prop, obj in _qname2rdfframes(*interfaceFault.element_declaration):
-            g.add((elementDeclaration_id, prop, obj))
-        g.add((elemid, WSDL.messageContentModel,
-               MESSAGECONTENTMODEL2URI[interfaceFault.message_content_model]))
-        for extmap in self.ext_interfaceFault:
-            extmap(g, interfaceFault)
+            yield (elementDeclaration_id, prop, obj)
+        yield (elemid, WSDL.messageContentModel,
+               MESSAGECONTENTMODEL2URI[interfaceFault.message_content_model])
+        yield from _extension_triples(self.ext_interfaceFault, interfaceFault)
 
-    def _map_binding(self, g: Graph, binding: Binding) -> None:
+    def _iter_binding(self, binding: Binding) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-8`_"""
         elemid = _create_id(binding)
         parentid = _create_id(binding.parent)
-        g.add((elemid, RDF.type, WSDL.Binding))
-        g.add((parentid, WSDL.binding, elemid))
-        g.add((elemid, RDFS.label, Literal(binding.name)))
+        yield (elemid, RDF.type, WSDL.Binding)
+        yield (parentid, WSDL.binding, elemid)
+        yield (elemid, RDFS.label, Literal(binding.name))
         interfaceid = _create_id(binding.interface)
-        g.add((elemid, WSDL.binds, interfaceid))
-        g.add((elemid, RDF.type, URIRef(binding.type)))
+        yield (elemid, WSDL.binds, interfaceid)
+        yield (elemid, RDF.type, iri(binding.type))
         for bo in binding.binding_operations:
-            self._map_bindingOperation(g, bo)
+            yield from self._iter_bindingOperation(bo)
         for bf in binding.binding_faults:
-            self._map_bindingFault(g, bf)
-        for extmap in self.ext_binding:
-            extmap(g, binding)
+            yield from self._iter_bindingFault(bf)
+        yield from _extension_triples(self.ext_binding, binding)
 
-    def _map_bindingOperation(
-            self, g: Graph,
-            bindingOperation: BindingOperation) -> None:
+    def _iter_bindingOperation(
+            self, bindingOperation: BindingOperation) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-9`_"""
         elemid = _create_id(bindingOperation)
         parentid = _create_id(bindingOperation.parent)
-        g.add((elemid, RDF.type, WSDL.BindingOperation))
-        g.add((parentid, WSDL.bindingOperation, elemid))
+        yield (elemid, RDF.type, WSDL.BindingOperation)
+        yield (parentid, WSDL.bindingOperation, elemid)
         interid = _create_id(bindingOperation.interface_operation)
-        g.add((elemid, WSDL.binds, interid))
+        yield (elemid, WSDL.binds, interid)
         for bmr in bindingOperation.binding_message_references:
-            self._map_bindingMessageReference(g, bmr)
+            yield from self._iter_bindingMessageReference(bmr)
 
         for bfr in bindingOperation.binding_fault_references:
-            self._map_bindingFaultReference(g, bfr)
-        for extmap in self.ext_bindingOperation:
-            extmap(g, bindingOperation)
+            yield from self._iter_bindingFaultReference(bfr)
+        yield from _extension_triples(self.ext_bindingOperation,
+                                      bindingOperation)
 
-    def _map_bindingMessageReference(
-            self, g: Graph,
-            bindingMessageReference: BindingMessageReference) -> None:
+    def _iter_bindingMessageReference(
+            self, bindingMessageReference: BindingMessageReference,
+            ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-12`_"""
         elemid = _create_id(bindingMessageReference)
         parentid = _create_id(bindingMessageReference.parent)
-        g.add((elemid, RDF.type, WSDL.BindingMessageReference))
-        g.add((parentid, WSDL.bindingMessageReference, elemid))
+        yield (elemid, RDF.type, WSDL.BindingMessageReference)
+        yield (parentid, WSDL.bindingMessageReference, elemid)
         imr = bindingMessageReference.interface_message_reference
         imr_id = _create_id(imr)
-        g.add((elemid, WSDL.binds, imr_id))
-        for extmap in self.ext_bindingMessageReference:
-            extmap(g, bindingMessageReference)
+        yield (elemid, WSDL.binds, imr_id)
+        yield from _extension_triples(self.ext_bindingMessageReference,
+                                      bindingMessageReference)
 
-    def _map_bindingFaultReference(
-            self, g: Graph,
-            bindingFaultReference: BindingFaultReference) -> None:
+    def _iter_bindingFaultReference(
+            self, bindingFaultReference: BindingFaultReference,
+            ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-11`_"""
         elemid = _create_id(bindingFaultReference)
         parentid = _create_id(bindingFaultReference.parent)
-        g.add((elemid, RDF.type, WSDL.BindingFaultReference))
-        g.add((parentid, WSDL.bindingFaultReference, elemid))
+        yield (elemid, RDF.type, WSDL.BindingFaultReference)
+        yield (parentid, WSDL.bindingFaultReference, elemid)
 
         ifr_id = _create_id(bindingFaultReference.interface_fault_reference)
-        g.add((elemid, WSDL.binds, ifr_id))
-        for extmap in self.ext_bindingFaultReference:
-            extmap(g, bindingFaultReference)
+        yield (elemid, WSDL.binds, ifr_id)
+        yield from _extension_triples(self.ext_bindingFaultReference,
+                                      bindingFaultReference)
 
-    def _map_bindingFault(self, g: Graph, bindingFault: BindingFault) -> None:
+    def _iter_bindingFault(self, bindingFault: BindingFault,
+                           ) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-10`_"""
         elemid = _create_id(bindingFault)
         parentid = _create_id(bindingFault.parent)
-        g.add((elemid, RDF.type, WSDL.BindingFault))
-        g.add((parentid, WSDL.bindingFault, elemid))
+        yield (elemid, RDF.type, WSDL.BindingFault)
+        yield (parentid, WSDL.bindingFault, elemid)
         interfaceFault_id = _create_id(bindingFault.interface_fault)
-        g.add((elemid, WSDL.binds, interfaceFault_id))
-        for extmap in self.ext_bindingFault:
-            extmap(g, bindingFault)
+        yield (elemid, WSDL.binds, interfaceFault_id)
+        yield from _extension_triples(self.ext_bindingFault, bindingFault)
 
-    def _map_service(self, g: Graph, service: Service) -> None:
+    def _iter_service(self, service: Service) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-13`_"""
         elemid = _create_id(service)
         parentid = _create_id(service.parent)
-        g.add((elemid, RDF.type, WSDL.Service))
-        g.add((parentid, WSDL.service, elemid))
-        g.add((elemid, RDFS.label, Literal(service.name)))
-        g.add((elemid, WSDL.implements, _create_id(service.interface)))
+        yield (elemid, RDF.type, WSDL.Service)
+        yield (parentid, WSDL.service, elemid)
+        yield (elemid, RDFS.label, Literal(service.name))
+        yield (elemid, WSDL.implements, _create_id(service.interface))
         for endpoint in service.endpoints:
-            self._map_endpoint(g, endpoint)
-        for extmap in self.ext_service:
-            extmap(g, service)
+            yield from self._iter_endpoint(endpoint)
+        yield from _extension_triples(self.ext_service, service)
 
-    def _map_endpoint(self, g: Graph, endpoint: Endpoint) -> None:
+    def _iter_endpoint(self, endpoint: Endpoint) -> Iterator[_Triple]:
         """`https://www.w3.org/TR/wsdl20-rdf/#table2-14`_"""
         elemid = _create_id(endpoint)
         parentid = _create_id(endpoint.parent)
-        g.add((elemid, RDF.type, WSDL.Endpoint))
-        g.add((parentid, WSDL.endpoint, elemid))
-        g.add((elemid, RDFS.label, Literal(endpoint.name)))
-        g.add((elemid, WSDL.usesBinding, _create_id(endpoint.binding)))
+        yield (elemid, RDF.type, WSDL.Endpoint)
+        yield (parentid, WSDL.endpoint, elemid)
+        yield (elemid, RDFS.label, Literal(endpoint.name))
+        yield (elemid, WSDL.usesBinding, _create_id(endpoint.binding))
         try:
             if endpoint.address is not None:
-                g.add((elemid, WSDL.address, URIRef(endpoint.address)))
+                yield (elemid, WSDL.address, iri(endpoint.address))
         except AttributeError:
             pass
-        for extmap in self.ext_endpoint:
-            extmap(g, endpoint)
+        yield from _extension_triples(self.ext_endpoint, endpoint)
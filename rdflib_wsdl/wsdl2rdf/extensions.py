@@ -4,7 +4,8 @@ from urllib.parse import urlparse, urlunparse
 from ..wsdl_components import Binding, BindingFaultReference, BindingMessageReference, BindingOperation, Description, ElementDeclaration, Endpoint, Interface, InterfaceFault, InterfaceFaultReference, InterfaceMessageReference, InterfaceOperation, Service, TypeDefinition, Extension, _WSDLComponent, MCM_ANY, MCM_NONE, MCM_OTHER, MCM_ELEMENT, BindingFault
 from ..shared import _ns_wsdl, _ns_wsdlx, _ns_wsdlrdf, _ns_wsoap, _ns_whttp, _ns_wrpc, _ns_sawsdl, _ns_xs, WHTTP, WSDL, WSDLX, WSDL_RDF, WSOAP, SAWSDL, name2qname
 from ..shared import MEP_inOnly, MEP_robustInOnly, MEP_inOut, MEP_inOptionalOut,MEP_outOnly, MEP_robustOutOnly, MEP_outIn, MEP_outOptionalIn
-from .class_MapperWSDL2RDF import MESSAGECONTENTMODEL2URI, _create_id, _qname2id, _messageLabel2URI, _qname2rdfframes, WSDLMAPPER, ExtensionParserData
+from .class_MapperWSDL2RDF import MESSAGECONTENTMODEL2URI, _create_id, _create_bnode, _qname2id, _qname2rdfframes, WSDLMAPPER, ExtensionParserData
+from .terms import iri, literal, message_label_uri
 from dataclasses import dataclass, field
 
 @dataclass
@@ -56,7 +57,7 @@ def _ext_soap_map_binding(g: Graph, binding: Binding) -> None:
     if soap_underlying_protocol is None:
         return
     else:
-        g.add((elemid, WSOAP.protocol, URIRef(soap_underlying_protocol)))
+        g.add((elemid, WSOAP.protocol, iri(soap_underlying_protocol)))
     try:
         mep_default = binding.get(_ns_wsoap, "soapMEP", as_qname=True)
     except KeyError:
@@ -66,9 +67,9 @@ def _ext_soap_map_binding(g: Graph, binding: Binding) -> None:
     try:
         soap_version = binding.get(_ns_wsoap, "")
     except KeyError:
-        g.add((elemid, WSOAP.version, Literal("1.2")))
+        g.add((elemid, WSOAP.version, literal("1.2")))
     else:
-        g.add((elemid, WSOAP.version, Literal(soap_version)))
+        g.add((elemid, WSOAP.version, literal(soap_version)))
     _map_soap_module(g, elemid, binding)
 
 def _ext_soap_map_bindingOperation(
@@ -88,7 +89,7 @@ def _ext_soap_map_bindingOperation(
     except KeyError:
         pass
     else:
-        g.add((elemid, WSOAP.soapMEP, URIRef(mep)))
+        g.add((elemid, WSOAP.soapMEP, iri(mep)))
     _map_soap_module(g, elemid, bindingOperation)
 
 def _ext_soap_map_bindingFault(
@@ -99,7 +100,7 @@ def _ext_soap_map_bindingFault(
     soap_fault_code = bindingFault.get(_ns_wsoap, "code", as_qname=True)
     if soap_fault_code is not None:
         code_ns, code_name = soap_fault_code
-        q = BNode()
+        q = _create_bnode(bindingFault, "faultCode")
         for prop, obj in _qname2rdfframes(code_ns, code_name):
             g.add((q, prop, obj))
         g.add((elemid, WSOAP.faultCode, q))
@@ -182,20 +183,20 @@ def _ext_http_binding(g: Graph, binding: Binding) -> None:
     except KeyError:
         pass
     else:
-        g.add((elemid, WHTTP.defaultContentEncoding, Literal(coding)))
+        g.add((elemid, WHTTP.defaultContentEncoding, literal(coding)))
     try:
         method = binding.get(_ns_whttp, "defaultMethod")
     except KeyError:
         pass
     else:
-        g.add((elemid, WHTTP.defaultMethod, Literal(method)))
+        g.add((elemid, WHTTP.defaultMethod, literal(method)))
     try:
         separator = binding.get(_ns_whttp, "defaultQueryParameterSeparator")
     except KeyError:
-        g.add((elemid, WHTTP.defaultQueryParameterSeparator, Literal("&")))
+        g.add((elemid, WHTTP.defaultQueryParameterSeparator, literal("&")))
     else:
         g.add((elemid, WHTTP.defaultQueryParameterSeparator,
-               Literal(separator)))
+               literal(separator)))
 
 def _add_as_literal(
         g: Graph, elem, elemid, xml_namespace, xml_location, rdf_property,
@@ -209,7 +210,7 @@ def _add_as_literal(
     except KeyError:
         pass
     else:
-        g.add((elemid, rdf_property, Literal(value, **literal_kwargs)))
+        g.add((elemid, rdf_property, literal(value, **literal_kwargs)))
 
 def _ext_http_bindingOperation(
         g: Graph, bindingOperation: BindingOperation,
@@ -233,14 +234,14 @@ def _ext_http_bindingOperation(
         pass
     else:
         g.add((elemid, WHTTP.locationIgnoreUncited,
-               Literal(ignore_uncited, datatype=XSD.boolean)))
+               literal(ignore_uncited, datatype=XSD.boolean)))
     try:
         method = bindingOperation.get(_ns_whttp, "method")
     except KeyError:
         pass
     else:
         try:
-            g.add((elemid, WHTTP.method, URIRef(method)))
+            g.add((elemid, WHTTP.method, iri(method)))
         except Exception:
             raise Exception(g, method)
     _add_as_literal(g, bindingOperation, elemid, _ns_whttp,
@@ -257,7 +258,7 @@ def _ext_http_bindingFault(g: Graph, bindingFault: BindingFault) -> None:
     else:
         if error_code.upper() != "ANY":
             g.add((elemid, WHTTP.errorCode,
-                   Literal(error_code, datatype=XSD.int)))
+                   literal(error_code, datatype=XSD.int)))
     _add_as_literal(g, bindingFault, elemid, _ns_whttp,
                     "contentEncoding", WHTTP.contentEncoding)
     _map_http_headerBlock(g, elemid, bindingFault)
@@ -0,0 +1,85 @@
+"""Discovery of :term:`plugins<rdflib_wsdl plugin>` via the
+:term:`entry point` ``'rdflib_wsdl.extensions.parser'``.
+
+Scanning the installed distributions for entry points is expensive. If
+the environment variable ``RDFLIB_WSDL_PLUGIN_CACHE`` holds a path, the
+found entry points are stored as manifest in that file and reused, until
+a directory in :py:data:`sys.path` changes, eg because a distribution was
+installed or removed.
+"""
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import json
+import os
+import sys
+
+from .class_MapperWSDL2RDF import ExtensionParserData
+
+ENTRY_POINT_GROUP = 'rdflib_wsdl.extensions.parser'
+CACHE_ENVIRONMENT_VARIABLE = "RDFLIB_WSDL_PLUGIN_CACHE"
+
+_EntryPointSpec = Tuple[str, str]
+"""Name and value of an entry point"""
+
+def load_plugins(cache_path: Optional[Union[str, os.PathLike]] = None,
+                 ) -> List[ExtensionParserData]:
+    """Loads all plugins found as entry point.
+
+    :param cache_path: File for the manifest of found entry points.
+        Defaults to the environment variable ``RDFLIB_WSDL_PLUGIN_CACHE``.
+        Without a path, no manifest is used.
+    """
+    if sys.version_info < (3, 10):
+        from importlib_metadata import EntryPoint
+    else:
+        from importlib.metadata import EntryPoint
+    if cache_path is None:
+        cache_path = os.environ.get(CACHE_ENVIRONMENT_VARIABLE)
+    if cache_path:
+        specs = _cached_entry_points(Path(cache_path))
+    else:
+        specs = _scan_entry_points()
+    return [EntryPoint(name, value, ENTRY_POINT_GROUP).load()
+            for name, value in specs]
+
+def _scan_entry_points() -> List[_EntryPointSpec]:
+    if sys.version_info < (3, 10):
+        from importlib_metadata import entry_points
+    else:
+        from importlib.metadata import entry_points
+    return [(ep.name, ep.value)
+            for ep in entry_points(group=ENTRY_POINT_GROUP)]
+
+def _fingerprint() -> List[List[Union[str, int]]]:
+    """Modification times of all directories, where distributions can
+    be installed. Installing or removing a distribution changes these.
+    """
+    fingerprint = []
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+def _cached_entry_points(cache_path: Path) -> List[_EntryPointSpec]:
+    """Returns the entry points from the manifest, if it is still valid.
+    Else scans for entry points and renews the manifest.
+    """
+    fingerprint = _fingerprint()
+    try:
+        manifest = json.loads(cache_path.read_text(encoding="utf-8"))
+        if manifest["fingerprint"] == fingerprint:
+            return [tuple(spec) for spec in manifest["entry_points"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    specs = _scan_entry_points()
+    tmp_path = cache_path.with_name(cache_path.name + ".%d.tmp" % os.getpid())
+    try:
+        tmp_path.write_text(json.dumps({"fingerprint": fingerprint,
+                                        "entry_points": specs}),
+                            encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return specs
@@ -0,0 +1,91 @@
+"""Batched insertion of mapped triples into the target graph.
+
+Mappers only use :py:meth:`BatchedSink.add`, so they can write directly
+into the target. The triples are passed on to :py:meth:`rdflib.Graph.addN`
+in batches, which saves a call into the store per triple.
+"""
+from types import TracebackType
+from typing import List, Optional
+
+from rdflib import Graph
+
+from .class_MapperWSDL2RDF import _Triple
+
+DEFAULT_BATCH_SIZE = 1000
+"""Number of triples passed to the store in a single call"""
+
+class BatchedSink:
+    """Collects added triples and passes them in batches to the target.
+    As context manager pending triples are flushed on exit. If an
+    exception was raised, pending triples are discarded instead.
+
+    :param target: Graph, that receives all triples. If it is a
+        :py:class:`rdflib.Dataset`, its default graph is used.
+        Targets without ``addN`` get every triple via ``add``.
+    :param batch_size: Maximal number of triples per call of
+        :py:meth:`rdflib.Graph.addN`.
+    :param atomic: Hold back all triples till :py:meth:`flush`, so
+        nothing is added if the mapping fails midway.
+    """
+    __slots__ = ("target", "batch_size", "atomic", "_context", "_pending")
+    target: Graph
+    batch_size: int
+    atomic: bool
+    _context: Graph
+    _pending: List[_Triple]
+
+    def __init__(self, target: Graph,
+                 batch_size: Optional[int] = None,
+                 atomic: bool = False,
+                 ) -> None:
+        if batch_size is None:
+            batch_size = DEFAULT_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive, got %r"
+                             % batch_size)
+        self.target = target
+        self.batch_size = batch_size
+        self.atomic = atomic
+        self._context = _default_context(target)
+        self._pending = []
+
+    def add(self, triple: _Triple) -> None:
+        self._pending.append(triple)
+        if not self.atomic and len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Passes all pending triples to the target"""
+        pending, self._pending = self._pending, []
+        if not hasattr(self.target, "addN"):
+            # Plain collections like sets only support add
+            for triple in pending:
+                self.target.add(triple)
+            return
+        c = self._context
+        for i in range(0, len(pending), self.batch_size):
+            self.target.addN((s, p, o, c)
+                             for s, p, o in pending[i:i+self.batch_size])
+
+    def discard(self) -> None:
+        """Drops all pending triples"""
+        self._pending.clear()
+
+    def __enter__(self) -> "BatchedSink":
+        return self
+
+    def __exit__(self, exc_type: Optional[type],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+def _default_context(target: Graph) -> Graph:
+    """Graph used as context of all quads passed to target"""
+    # Newer rdflib deprecates default_context of Dataset
+    for name in ("default_graph", "default_context"):
+        if hasattr(type(target), name):
+            return getattr(target, name)
+    return target
@@ -0,0 +1,67 @@
+"""Pool of rdf terms used during mapping.
+
+The vocabularies of WSDL-RDF, WSOAP, WHTTP and SAWSDL are pre-interned
+in :py:mod:`rdflib_wsdl.shared`. Terms, that depend on the parsed
+document, are created via :py:func:`iri` and :py:func:`literal`, so that
+recurring values like the message exchange pattern of every operation
+share one object.
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from rdflib import Literal, URIRef
+
+from ..shared import MEP_inOnly, MEP_robustInOnly, MEP_inOut,\
+        MEP_inOptionalOut, MEP_outOnly, MEP_robustOutOnly, MEP_outIn,\
+        MEP_outOptionalIn
+
+@lru_cache(maxsize=4096)
+def iri(value: str) -> URIRef:
+    """Returns the same :py:class:`rdflib.URIRef` for recurring values"""
+    return URIRef(value)
+
+@lru_cache(maxsize=4096)
+def literal(value: str, datatype: Optional[URIRef] = None) -> Literal:
+    """Returns the same :py:class:`rdflib.Literal` for recurring values"""
+    return Literal(value, datatype=datatype)
+
+def _labels(mep: str, in_label: str, out_label: str,
+            ) -> Mapping[Tuple[str, str], URIRef]:
+    return {(mep, "In"): iri(mep + "#" + in_label),
+            (mep, "Out"): iri(mep + "#" + out_label)}
+
+MESSAGE_LABEL2URI: Mapping[Tuple[str, str], URIRef] = MappingProxyType({
+        # Patterns with only one message use its label for every message
+        **_labels(MEP_inOnly, "In", "In"),
+        **_labels(MEP_robustInOnly, "In", "In"),
+        **_labels(MEP_inOut, "In", "Out"),
+        **_labels(MEP_inOptionalOut, "In", "Out"),
+        **_labels(MEP_outOnly, "Out", "Out"),
+        **_labels(MEP_robustOutOnly, "Out", "Out"),
+        **_labels(MEP_outIn, "In", "Out"),
+        **_labels(MEP_outOptionalIn, "In", "Out"),
+        })
+"""IRI of message label for every message exchange pattern and label
+`https://www.w3.org/TR/wsdl20-rdf/#meps`_
+"""
+
+def message_label_uri(message_label: str, message_exchange_pattern: str,
+                      ) -> URIRef:
+    """`https://www.w3.org/TR/wsdl20-rdf/#meps`_
+
+    Labels are compared case insensitive. Every label except ``In``
+    is treated as ``Out``.
+
+    :raises NotImplementedError: if the pattern is unknown
+    """
+    try:
+        return MESSAGE_LABEL2URI[message_exchange_pattern, message_label]
+    except KeyError:
+        pass
+    label = "In" if message_label.upper() == "IN" else "Out"
+    try:
+        return MESSAGE_LABEL2URI[message_exchange_pattern, label]
+    except KeyError:
+        raise NotImplementedError(message_label,
+                                  message_exchange_pattern) from None
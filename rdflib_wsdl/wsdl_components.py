@@ -16,6 +16,7 @@ class _WSDLComponent(abc.ABC):
     """A comprehensive list of all components and their properties canbe found
     `https://www.w3.org/TR/wsdl/#componentsummary`_
     """
+    __slots__ = ()
     #@property
     #@abc.abstractmethod
     #def iri(self) -> URIRef: ...
@@ -39,6 +40,7 @@ class _WSDLComponent(abc.ABC):
                          
 
 class Binding(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def parent(self) -> "Description": ...
@@ -74,6 +76,7 @@ class Binding(_WSDLComponent):
         return "wsdl.binding(%s)" % self.name
 
 class BindingFault(_WSDLComponent):
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace, name, **kwargs: Any) -> Any:
         """This is needed to get access to data of extensions"""
@@ -98,6 +101,7 @@ class BindingFaultReference(_WSDLComponent):
         it has to be the same as a possible messagelabel to the refererenced
         interface fault.
     """
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace, name, **kwargs: Any) -> Any:
         """This is needed to get access to data of extensions"""
@@ -143,6 +147,7 @@ class BindingFaultReference(_WSDLComponent):
                 )
 
 class BindingMessageReference(_WSDLComponent):
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace, name, **kwargs: Any) -> Any:
         """This is needed to get access to data of extensions"""
@@ -177,6 +182,7 @@ class BindingMessageReference(_WSDLComponent):
                 )
 
 class BindingOperation(_WSDLComponent):
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace, name, **kwargs: Any) -> Any:
         """This is needed to get access to data of extensions"""
@@ -206,31 +212,62 @@ class BindingOperation(_WSDLComponent):
                                                  self.interface_operation.name)
 
 class Description(_WSDLComponent):
+    __slots__ = ()
     parent = None
 
-    def get_interfaceOperation(self, ref_ns, ref_name) -> "InterfaceOperation":
+    def get_interface(self, ref_ns, ref_name) -> "Interface":
         """
-        :TODO: comparing of ref_ns is missing because targetnamespace
-            not implemented
-        :raises: KeyError
+        :raises KeyError:
         """
         for interface in self.interfaces:
-            for operation in interface.interface_operations:
-                if operation.name == ref_name:
-                    return operation
-        raise KeyError()
+            if interface.name == ref_name\
+                    and interface.targetNamespace == ref_ns:
+                return interface
+        raise KeyError(ref_ns, ref_name)
 
-    def get_interfaceFault(self, ref_ns, ref_name) -> "InterfaceFault":
+    def get_binding(self, ref_ns, ref_name) -> "Binding":
+        """
+        :raises KeyError:
+        """
+        for binding in self.bindings:
+            if binding.name == ref_name and binding.targetNamespace == ref_ns:
+                return binding
+        raise KeyError(ref_ns, ref_name)
+
+    def get_service(self, ref_ns, ref_name) -> "Service":
+        """
+        :raises KeyError:
         """
-        :TODO: comparing of ref_ns is missing because targetnamespace
-            not implemented
-        :raises: KeyError
+        for service in self.services:
+            if service.name == ref_name and service.targetNamespace == ref_ns:
+                return service
+        raise KeyError(ref_ns, ref_name)
+
+    def get_interfaceOperation(self, ref_ns, ref_name) -> "InterfaceOperation":
+        """Operation of any interface. Operations are only unique within
+        their interface, prefer :py:meth:`Interface.get_interfaceOperation`.
+
+        :raises KeyError:
+        """
+        for interface in self.interfaces:
+            try:
+                return interface.get_interfaceOperation(ref_ns, ref_name)
+            except KeyError:
+                pass
+        raise KeyError(ref_ns, ref_name)
+
+    def get_interfaceFault(self, ref_ns, ref_name) -> "InterfaceFault":
+        """Fault of any interface. Faults are only unique within their
+        interface, prefer :py:meth:`Interface.get_interfaceFault`.
+
+        :raises KeyError:
         """
         for interface in self.interfaces:
-            for fault in interface.interface_faults:
-                if fault.name == ref_name:
-                    return fault
-        raise KeyError()
+            try:
+                return interface.get_interfaceFault(ref_ns, ref_name)
+            except KeyError:
+                pass
+        raise KeyError(ref_ns, ref_name)
 
     @property
     @abc.abstractmethod
@@ -257,6 +294,7 @@ class Description(_WSDLComponent):
         return "wsdl.description()"
 
 class ElementDeclaration(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def name(self) -> str: ...
@@ -274,6 +312,7 @@ class ElementDeclaration(_WSDLComponent):
                                                        self.system.namespace)
 
 class Endpoint(_WSDLComponent):
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace: str, name: str, **kwargs: Any) -> Any:
         raise KeyError(namespace, name)
@@ -299,6 +338,7 @@ class Endpoint(_WSDLComponent):
         return "wsdl.endpoint(%s/%s)"% (self.parent.name, self.name)
 
 class Interface(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def parent(self) -> "Description": ...
@@ -315,6 +355,25 @@ class Interface(_WSDLComponent):
     @abc.abstractmethod
     def interface_operations(self) -> Iterable["InterfaceOperation"]: ...
 
+    def get_interfaceOperation(self, ref_ns, ref_name) -> "InterfaceOperation":
+        """
+        :raises KeyError:
+        """
+        for operation in self.interface_operations:
+            if operation.name == ref_name\
+                    and operation.targetNamespace == ref_ns:
+                return operation
+        raise KeyError(ref_ns, ref_name)
+
+    def get_interfaceFault(self, ref_ns, ref_name) -> "InterfaceFault":
+        """
+        :raises KeyError:
+        """
+        for fault in self.interface_faults:
+            if fault.name == ref_name and fault.targetNamespace == ref_ns:
+                return fault
+        raise KeyError(ref_ns, ref_name)
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -327,6 +386,7 @@ class Interface(_WSDLComponent):
         return "wsdl.interface(%s)" % self.name
 
 class InterfaceFault(_WSDLComponent):
+    __slots__ = ()
     @property
     def element_declaration(self) -> Tuple[str, str]:
         """
@@ -361,6 +421,7 @@ class InterfaceFault(_WSDLComponent):
         return "wsdl.interfaceFault(%s/%s)" % (self.parent.name, self.name)
 
 class InterfaceFaultReference(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def direction(self) -> str:
@@ -396,6 +457,7 @@ class InterfaceFaultReference(_WSDLComponent):
                 )
 
 class InterfaceMessageReference(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def direction(self): ...
@@ -440,6 +502,7 @@ class InterfaceMessageReference(_WSDLComponent):
                 )
 
 class InterfaceOperation(_WSDLComponent):
+    __slots__ = ()
     @abc.abstractmethod
     def get(self, namespace: str, name: str, **kwargs: Any) -> Any:
         raise KeyError(namespace, name)
@@ -477,6 +540,7 @@ class InterfaceOperation(_WSDLComponent):
                 )
 
 class Service(_WSDLComponent):
+    __slots__ = ()
     @property
     def parent(self) -> "Description": ...
 
@@ -497,6 +561,7 @@ class Service(_WSDLComponent):
         return "wsdl.service(%s)" % self.name
 
 class TypeDefinition(_WSDLComponent):
+    __slots__ = ()
     @property
     def name(self) -> str: ...
     @property
@@ -517,6 +582,7 @@ class TypeDefinition(_WSDLComponent):
             return "wsdl.typeDef(%s,%s)" % (self.name, self.system.namespace)
 
 class Extension(_WSDLComponent):
+    __slots__ = ()
     @property
     @abc.abstractmethod
     def namespace(self) -> str:
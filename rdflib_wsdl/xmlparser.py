@@ -1,13 +1,36 @@
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, List, Union, BinaryIO, Callable
 from collections.abc import Mapping
+import mmap
+import os
+import weakref
 import xml.sax
 import xml.sax.handler
+from xml.sax.expatreader import ExpatParser
 from xml.sax.xmlreader import XMLReader
-from .xmlparser_states import _start, _state, name2qname, wsdl_description
+from .xmlparser_states import _start, _state, name2qname, wsdl_description,\
+        SourceCapture, UnresolvedReference, check_lazy_encoding
+from .wsdl_components import Interface, Binding, Service
 from io import IOBase
-from xml.sax.xmlreader import AttributesImpl
+from xml.sax.xmlreader import AttributesImpl, AttributesNSImpl
+import rdflib
 
-from .wsdl2rdf import MapperWSDL2RDF, additional_parser
+from .wsdl2rdf import MapperWSDL2RDF, BatchedSink, get_mapper
+from .wsdl2rdf.class_MapperWSDL2RDF import blank_node_ids, _create_id
+from .dataset import description_graph, check_named_graph_sink
+
+class ByteIndexExpatParser(ExpatParser):
+    """Expat xml-reader, that also tells the position of the current
+    xml-event in the document. Needed to capture subtrees as byte spans.
+    """
+    def byte_index(self) -> int:
+        """Index in the fed bytes of the current xml-event.
+
+        :raises ValueError: If no document is parsed
+        """
+        expat_parser = getattr(self, "_parser", None)
+        if expat_parser is None:
+            raise ValueError("No document is parsed")
+        return expat_parser.CurrentByteIndex
 
 class WSDLXMLHandler(xml.sax.handler.ContentHandler):
     """Transforms given wsdl/xml into rdf. Adds all triples to given sink.
@@ -18,21 +41,66 @@ class WSDLXMLHandler(xml.sax.handler.ContentHandler):
 
     @classmethod
     def create_parser(cls, target, store,
-                      rdf_generator: MapperWSDL2RDF=None) -> XMLReader:
+                      rdf_generator: MapperWSDL2RDF=None,
+                      namespace_aware: bool = False,
+                      streaming: bool = False,
+                      source_buffer: Optional[Any] = None,
+                      batch_size: Optional[int] = None,
+                      bnode_mode: str = "random",
+                      named_graph: bool = False,
+                      ) -> XMLReader:
         """Create a parser with this as content handler. Automaticly sets
         all expected features. Parsing adds all generated rdf triples
         to given store.
 
-        :param rdf_generator: If not given automaticly creates a mapper from
+        :param rdf_generator: If not given the cached mapper from
+            :py:func:`rdflib_wsdl.wsdl2rdf.get_mapper` with all available
+            extensions is used.
+        :param namespace_aware: Let the xml-reader resolve namespaces of
+            elements and attributes itself. Then only prefixes are tracked,
+            that are needed for attribute values with qnames.
+        :param streaming: Map every top-level component as soon as it is
+            parsed instead of the whole description at the end of the
+            document.
+        :param source_buffer: The complete document, that will be fed to
+            the returned parser. If given, the content of wsdl:types is
+            only captured as byte span and parsed on first access.
+        :param batch_size: Number of triples added to the store per call
+            of :py:meth:`rdflib.Graph.addN`. Defaults to
+            :py:data:`rdflib_wsdl.wsdl2rdf.DEFAULT_BATCH_SIZE`.
+        :param bnode_mode: How nodes without IRI are created. See
+            :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`.
+        :param named_graph: Add the triples to the graph named by the IRI
+            of the description in the store. Its old triples are dropped.
+            See :py:mod:`rdflib_wsdl.dataset`.
+        :raises ValueError: If named_graph is given and store cant hold
+            named graphs or if source_buffer isnt encoded in utf-8
         """
+        if named_graph:
+            check_named_graph_sink(store)
+        if source_buffer is not None:
+            check_lazy_encoding(source_buffer)
         if rdf_generator is None:
-            rdf_generator = MapperWSDL2RDF.create_with_parser_data(
-                    additional_extensions = additional_parser,
-                    )
-        parser = xml.sax.make_parser()
-        parser.setFeature(xml.sax.handler.feature_namespaces, 0)
+            rdf_generator = get_mapper()
+        if source_buffer is None:
+            parser = xml.sax.make_parser()
+        else:
+            parser = ByteIndexExpatParser()
+        parser.setFeature(xml.sax.handler.feature_namespaces,
+                          1 if namespace_aware else 0)
         #parser.setFeature(xml.sax.handler.feature_namespace_prefixes, 1)
         self = cls(store, rdf_generator)
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.bnode_mode = bnode_mode
+        self.named_graph = named_graph
+        if source_buffer is not None:
+            # The reader references this handler, so only a weak
+            # reference is kept. Else the buffer would live in a cycle
+            # until the next garbage collection.
+            reader = weakref.ref(parser)
+            self.capture_source = SourceCapture(
+                    source_buffer, lambda: reader().byte_index())
         self.setDocumentLocator(target)
         # rdfxml.setDocumentLocator(_Locator(self.url, self.parser))
         parser.setContentHandler(self)
@@ -40,26 +108,56 @@ class WSDLXMLHandler(xml.sax.handler.ContentHandler):
         return parser
 
 
+    streaming: bool
+    """If true, top-level components are mapped as soon as they are closed.
+    Components referencing components, that arent parsed yet, are deferred.
+    The parsed components are kept until the end of the document.
+    """
+    _deferred: List[Union[Interface, Binding, Service]]
+    capture_source: Optional[SourceCapture]
+    """If given, subtrees without wsdl components are captured lazily."""
+    batch_size: Optional[int]
+    """Number of triples added to the store per call. None for default."""
+    bnode_mode: str
+    """See :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`"""
+    named_graph: bool
+    """If true, triples are added to the graph of the description instead
+    of store. See :py:meth:`target`.
+    """
+    _target: Optional[rdflib.Graph]
+
     def __init__(self, store, rdf_generator):
         self.rdf_generator = rdf_generator
         self.store = store
-        self.preserve_bnode_ids = False
+        self.bnode_mode = "random"
+        self.streaming = False
+        self.capture_source = None
+        self.batch_size = None
+        self.named_graph = False
+        self._target = None
         self.reset()
         self.states = []
+        self._declared_prefixes = {}
+        self._deferred = []
 
-    def _get_currentState(self):
+    def _get_currentState(self) -> _state:
         return self.states[-1]
 
-    def _set_currentState(self, newstate):
-        if newstate not in self.states:
-            self.states.append(newstate)
-        elif self.states[-2] == newstate:
-            self.states.pop()
-        else:
-            raise Exception("Cant set state only to an old state, if that "
-                            "state is the previous state.")
+    currentState = property(fget=_get_currentState)
+    """State of the innermost open xml-element. :py:attr:`states` holds
+    the states of all open xml-elements.
+    """
+
+    @property
+    def preserve_bnode_ids(self) -> bool:
+        """Same as :py:attr:`bnode_mode` ``"stable"``. Wsdl has no blank
+        node ids, so ids are derived from the owning components.
+        """
+        return self.bnode_mode != "random"
 
-    currentState = property(fset=_set_currentState, fget=_get_currentState)
+    @preserve_bnode_ids.setter
+    def preserve_bnode_ids(self, value: bool) -> None:
+        self.bnode_mode = "stable" if value else "random"
 
     def reset(self):
         pass
@@ -68,51 +166,181 @@ class WSDLXMLHandler(xml.sax.handler.ContentHandler):
         self.locator = locator
 
     def startDocument(self):
-        self.currentState = self.startingstate()
-        
+        self.states = [self.startingstate(self.capture_source)]
+        self._target = None
+
     def parse(self, *args: Any):
         raise Exception()
 
-    #def feed(self, buffer):
-    #    raise Exception(buffer)
-    #    super().feed()
+    @property
+    def description(self) -> wsdl_description:
+        """Root of the parsed document.
+
+        :raises AttributeError: If no root element was parsed yet
+        """
+        try:
+            description = self.states[0].first_state
+        except IndexError:
+            description = None
+        if description is None:
+            raise AttributeError("No description parsed yet")
+        return description
+
+    @property
+    def target(self) -> rdflib.Graph:
+        """Graph, that receives the triples. With :py:attr:`named_graph`
+        the graph named by the IRI of the description, whose old triples
+        are dropped on first access.
+
+        :raises AttributeError: If no description was parsed yet
+        """
+        if not self.named_graph:
+            return self.store
+        if self._target is None:
+            self._target = description_graph(
+                    self.store, _create_id(self.description), replace=True)
+        return self._target
 
     def endDocument(self) -> None:
+        if len(self.states) != 1:
+            raise Exception("Document ended with %d open xml elements."
+                            % (len(self.states) - 1))
         assert isinstance(self.currentState, _start)
         assert self.currentState.first_state is not None
+        if self.capture_source is not None:
+            self.capture_source.detach()
+
+        with blank_node_ids(self.bnode_mode):
+            if self.streaming:
+                self._emit_deferred()
+                for component in self._deferred:
+                    self._emit_unresolved(component)
+                self._deferred.clear()
+                with BatchedSink(self.target, self.batch_size) as sink:
+                    self.rdf_generator.map_description_properties(
+                            sink, self.currentState.first_state)
+            elif isinstance(self.rdf_generator, MapperWSDL2RDF):
+                with BatchedSink(self.target, self.batch_size) as sink:
+                    self.rdf_generator.map_into(sink,
+                                                self.currentState.first_state)
+            else:
+                description = self.currentState.first_state
+                with BatchedSink(self.target, self.batch_size) as sink:
+                    for ax in self.rdf_generator(description):
+                        sink.add(ax)
 
-        for ax in self.rdf_generator(self.currentState.first_state):
-            self.store.add(ax)
-        #endinfograph = self.currentState.finalize()
-        #for ax in endinfograph:
-        #    self.store.add(ax)
+    def _emit_component(self, component: Union[Interface, Binding, Service],
+                        ) -> None:
+        """Maps given top-level component and adds all triples to the store.
+        Nothing is added, if the mapping fails.
+
+        :raises UnresolvedReference: If a referenced component isnt
+            available
+        """
+        with blank_node_ids(self.bnode_mode),\
+                BatchedSink(self.target, self.batch_size, atomic=True) as sink:
+            self.rdf_generator.map_component(sink, component)
+
+    def _emit_unresolved(self, component: Union[Interface, Binding, Service],
+                         ) -> None:
+        """Maps a component, that is still deferred at the end of the
+        document.
+
+        :raises WSDLXML_PluginException: Naming the unresolved reference
+        """
+        from .rdflib_plugin import WSDLXML_PluginException
+        try:
+            self._emit_component(component)
+        except UnresolvedReference as err:
+            kind, namespace, name = err.args
+            raise WSDLXML_PluginException(
+                    "%s references unknown %s {%s}%s"
+                    % (component.fragment_identifier, kind, namespace, name),
+                    ) from err
+
+    def _emit(self, component: Union[Interface, Binding, Service]) -> None:
+        """Maps given component if possible or defers it."""
+        try:
+            self._emit_component(component)
+        except UnresolvedReference:
+            self._deferred.append(component)
+        else:
+            self._emit_deferred()
+
+    def _emit_deferred(self) -> None:
+        """Maps all deferred components, whose references are available
+        now.
+        """
+        progress = True
+        while progress and self._deferred:
+            progress = False
+            for component in list(self._deferred):
+                try:
+                    self._emit_component(component)
+                except UnresolvedReference:
+                    continue
+                self._deferred.remove(component)
+                progress = True
 
     def startElement(self, name: str, attrs: AttributesImpl) -> None:
+        if self.currentState.captures_subtree:
+            self.states.append(self.currentState.transition(None, None,
+                                                            None, None))
+            return
         attrs_ = dict(attrs)
-        other_attrs, namespaces, defaultNS = extract_namespaces(attrs_)
-        namespaces = {**self.currentState.namespaces, **namespaces}
+        other_attrs, declared, defaultNS = extract_namespaces(attrs_)
+        namespaces = self.currentState.namespaces.child(declared)
         if defaultNS == None:
             defaultNS = self.currentState.default_namespace
         assert defaultNS is not None
         qname = name2qname(name, defaultNS, namespaces)
-        self.currentState = self.currentState.transition(qname, attrs_,
-                                                         namespaces, defaultNS)
+        qattrs = qualify_attributes(other_attrs, namespaces)
+        self.states.append(self.currentState.transition(qname, qattrs,
+                                                        namespaces, defaultNS))
 
     def endElement(self, name):
-        if isinstance(self.currentState, _start):
+        state = self.states[-1]
+        if isinstance(state, _start):
             raise Exception("Got one xml endelement too much.")
-        else:
-            self.currentState.close()
-            self.states.pop()
+        state.close()
+        self.states.pop()
+        if self.streaming and isinstance(self.states[-1], wsdl_description)\
+                and isinstance(state, (Interface, Binding, Service)):
+            self._emit(state)
 
-    def startElementNS(self, name, qname, attrs):
-        """Cant implement this with feature Namespaces enabled because
-        i need access to namespaces within binding.
+    def startPrefixMapping(self, prefix: Optional[str], uri: str) -> None:
+        """Only used with feature namespaces enabled. Prefixes are
+        collected until the next element starts.
         """
-        raise NotImplementedError()
+        self._declared_prefixes[prefix] = uri
 
-    def endElementNS(self, name, qname):
-        raise NotImplementedError()
+    def startElementNS(self, name: Tuple[Optional[str], str],
+                       qname: Optional[str],
+                       attrs: AttributesNSImpl) -> None:
+        """Used with feature namespaces enabled. Names of elements and
+        attributes are already resolved. Prefixes are still needed for
+        attributes with qnames as value, eg within binding. Those are
+        shared with the parent state, if no new prefixes are declared.
+        """
+        if self.currentState.captures_subtree:
+            self._declared_prefixes.clear()
+            self.states.append(self.currentState.transition(None, None,
+                                                            None, None))
+            return
+        namespaces = self.currentState.namespaces
+        defaultNS = self.currentState.default_namespace
+        if self._declared_prefixes:
+            declared = self._declared_prefixes
+            self._declared_prefixes = {}
+            defaultNS = declared.pop(None, defaultNS)
+            namespaces = namespaces.child(declared)
+        qattrs = dict(attrs.items())
+        self.states.append(self.currentState.transition(name, qattrs,
+                                                        namespaces, defaultNS))
+
+    def endElementNS(self, name: Tuple[Optional[str], str],
+                     qname: Optional[str]) -> None:
+        self.endElement(name)
 
     def characters(self, content):
         self.currentState.add_characters(content)
@@ -120,6 +348,190 @@ class WSDLXMLHandler(xml.sax.handler.ContentHandler):
     def ignorableWhitespace(self, content):
         pass
 
+class WSDLIncrementalParser:
+    """Parses a wsdl document, that arrives in chunks. Only the tree of
+    wsdl components is kept in memory, not the document itself.
+
+    .. code-block:: python
+
+        parser = WSDLIncrementalParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        graph = parser.close()
+        description = parser.description
+
+    :param store: All generated triples are added to this. If not given
+        a new :py:class:`rdflib.Graph` is used.
+    :param streaming: Triples of interfaces, bindings and services are
+        added to the store as soon as these are fed completely.
+    :param batch_size: Number of triples added to the store per call of
+        :py:meth:`rdflib.Graph.addN`
+    :param bnode_mode: See :py:data:`rdflib_wsdl.wsdl2rdf.BNODE_MODES`
+    :param source_buffer: The complete document, if it is available
+        before feeding. Then the content of wsdl:types is only captured
+        as byte span and parsed on first access. The buffer is kept as
+        long as the description. Without it chunks arent kept.
+    :raises ValueError: If source_buffer isnt encoded in utf-8
+    """
+    store: rdflib.Graph
+    _reader: xml.sax.xmlreader.IncrementalParser
+    _handler: WSDLXMLHandler
+
+    def __init__(self, store: Optional[rdflib.Graph] = None,
+                 rdf_generator: Optional[MapperWSDL2RDF] = None,
+                 namespace_aware: bool = False,
+                 streaming: bool = False,
+                 handler: type[WSDLXMLHandler] = WSDLXMLHandler,
+                 batch_size: Optional[int] = None,
+                 bnode_mode: str = "random",
+                 source_buffer: Optional[Any] = None,
+                 ) -> None:
+        if store is None:
+            store = rdflib.Graph()
+        self.store = store
+        self._reader = handler.create_parser(None, store, rdf_generator,
+                                             namespace_aware=namespace_aware,
+                                             streaming=streaming,
+                                             batch_size=batch_size,
+                                             bnode_mode=bnode_mode,
+                                             source_buffer=source_buffer)
+        self._handler = self._reader.getContentHandler()
+
+    def feed(self, data: bytes) -> None:
+        """Parses the next chunk of the document.
+
+        :raises xml.sax.SAXParseException:
+        """
+        self._reader.feed(data)
+
+    def close(self) -> rdflib.Graph:
+        """Finishes the document and maps it to rdf.
+
+        :returns: The store with all generated triples
+        :raises xml.sax.SAXParseException:
+        """
+        self._reader.close()
+        return self.store
+
+    @property
+    def description(self) -> wsdl_description:
+        """The parsed description. Available after :py:meth:`close`."""
+        return self._handler.description
+
+
+def read_description(source: Union[bytes, str, os.PathLike, BinaryIO],
+                     namespace_aware: bool = False,
+                     chunk_size: int = 2**16,
+                     lazy_types: bool = False,
+                     ) -> wsdl_description:
+    """Parses the wsdl document from source without mapping it to rdf.
+
+    :param source: Content, path or binary stream of the wsdl document
+    :param lazy_types: Content of wsdl:types is only parsed, when
+        accessed. Streams are read completely first. A file given by
+        path is memory mapped while parsing and read again on access.
+    :raises xml.sax.SAXParseException:
+    :raises ValueError: If lazy_types is given and the document isnt
+        encoded in utf-8
+    """
+    if lazy_types:
+        if isinstance(source, (str, os.PathLike)):
+            return _read_mapped_description(source, namespace_aware,
+                                            chunk_size)
+        if not isinstance(source, bytes):
+            source = source.read()
+        parser = WSDLIncrementalParser(rdf_generator=lambda d: (),
+                                       namespace_aware=namespace_aware,
+                                       source_buffer=source)
+    else:
+        parser = WSDLIncrementalParser(rdf_generator=lambda d: (),
+                                       namespace_aware=namespace_aware)
+    if isinstance(source, bytes):
+        parser.feed(source)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            _feed(parser, stream, chunk_size)
+    else:
+        _feed(parser, source, chunk_size)
+    parser.close()
+    return parser.description
+
+def _read_mapped_description(path: Union[str, os.PathLike],
+                             namespace_aware: bool, chunk_size: int,
+                             ) -> wsdl_description:
+    """Reads the description with lazy types from a memory map of given
+    file. The map is closed afterwards, captured spans are read from the
+    file again.
+    """
+    with open(path, "rb") as stream:
+        stat = os.fstat(stream.fileno())
+        if not stat.st_size:
+            # Empty files cant be mapped, let the xml-reader complain
+            return read_description(stream, namespace_aware, chunk_size)
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)\
+                as mapped, memoryview(mapped) as view:
+            parser = WSDLIncrementalParser(rdf_generator=lambda d: (),
+                                           namespace_aware=namespace_aware,
+                                           source_buffer=view)
+            capture_source = parser._handler.capture_source
+            try:
+                for i in range(0, len(view), chunk_size):
+                    parser.feed(view[i:i+chunk_size])
+                parser.close()
+            finally:
+                capture_source.detach()
+                capture_source.release_buffer(_rereader(stream, 0, stat))
+    return parser.description
+
+def _rereader(stream: Any, position: int, stat: os.stat_result,
+              ) -> Optional[Callable[[int, int], bytes]]:
+    """Returns a function, that reads a span of the memory mapped file
+    of stream again, or None if the path of the file isnt known.
+    """
+    path = getattr(stream, "name", None)
+    if not isinstance(path, (str, bytes, os.PathLike)):
+        return None
+    identity = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    def reread(start: int, end: int) -> bytes:
+        """
+        :raises ValueError: If the file was changed since parsing
+        """
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if identity != (stat.st_dev, stat.st_ino, stat.st_size,
+                            stat.st_mtime_ns):
+                raise ValueError("%s was changed since parsing" % path)
+            f.seek(position + start)
+            return f.read(end - start)
+    return reread
+
+def _feed(parser: WSDLIncrementalParser, stream: BinaryIO,
+          chunk_size: int) -> None:
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        parser.feed(chunk)
+
+def qualify_attributes(attrs: Mapping[str, str],
+                       namespaces: Mapping[str, str],
+                       ) -> Mapping[Tuple[Optional[str], str], str]:
+    """Maps names of attributes to qualified names (namespace, localname).
+    Attributes without prefix have no namespace. Attributes with unknown
+    prefix are kept as (None, name).
+    """
+    qattrs = {}
+    for key, x in attrs.items():
+        prefix, sep, local_name = key.partition(":")
+        if sep:
+            try:
+                qattrs[(namespaces[prefix], local_name)] = x
+                continue
+            except KeyError:
+                pass
+        qattrs[(None, key)] = x
+    return qattrs
+
 def extract_namespaces(attrs: Mapping[str, str],
               defaultNS: Optional[str] = None,
               ) -> Tuple[Mapping[str, str], Mapping[str, str], Optional[str]]:
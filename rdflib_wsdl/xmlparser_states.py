@@ -4,7 +4,7 @@ from collections.abc import Mapping
 import abc
 import typing as typ
 from typing import Optional, Union, Iterable, Tuple, Callable, Any, overload,\
-        Generic, TypeVar, List
+        Generic, TypeVar, List, Dict
 from collections.abc import MutableMapping, Mapping
 
 from rdflib import Graph, Namespace, RDF, URIRef, RDFS, Literal, BNode, IdentifiedNode
@@ -14,10 +14,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
 from urllib.parse import urlparse, urlunparse
+import codecs
+import re
 
-from .shared import _ns_wsdl, _ns_wsdlx, _ns_wsdlrdf, _ns_wsoap, _ns_whttp, _ns_wrpc, _ns_sawsdl, _ns_xs, WHTTP, WSDL, WSDLX, WSDL_RDF, WSOAP, SAWSDL
-from .shared import name2qname
+from .shared import _ns_xml, _ns_wsdl, _ns_wsdlx, _ns_wsdlrdf, _ns_wsoap, _ns_whttp, _ns_wrpc, _ns_sawsdl, _ns_xs, WHTTP, WSDL, WSDLX, WSDL_RDF, WSOAP, SAWSDL
+from .shared import name2qname, NamespaceScope
 
 from .wsdl_components import Binding, BindingFaultReference, BindingMessageReference, BindingOperation, Description, ElementDeclaration, Endpoint, Interface, InterfaceFault, InterfaceFaultReference, InterfaceMessageReference, InterfaceOperation, Service, TypeDefinition, Extension, BindingFault, MCM_ANY, MCM_NONE, MCM_OTHER, MCM_ELEMENT
 
@@ -26,24 +29,141 @@ from .wsdl_components import Binding, BindingFaultReference, BindingMessageRefer
 class UnexpectedNodetype(KeyError):
     """Is raised if an unexpected nodename is found in xmlfile"""
 
+class UnresolvedReference(KeyError):
+    """Is raised if a referenced component isnt known (yet). While
+    streaming, components with such references are deferred.
+    """
+
+_T = TypeVar("_T")
+
+def _resolve(table: Mapping[Tuple[str, str], _T], kind: str,
+             ref_ns: str, ref_name: str) -> _T:
+    """
+    :raises UnresolvedReference:
+    """
+    try:
+        return table[ref_ns, ref_name]
+    except KeyError:
+        raise UnresolvedReference(kind, ref_ns, ref_name) from None
+
+_XML_ENCODING = re.compile(
+        rb"""(?:\xef\xbb\xbf)?<\?xml[^>]*?encoding\s*=\s*["']([^"']*)["']""")
+_LAZY_ENCODINGS = ("utf-8", "ascii")
+
+def check_lazy_encoding(buffer: Any) -> None:
+    """Checks, that the document in buffer is encoded compatible to utf-8.
+    Captured spans are parsed in a wrapper, that is encoded with utf-8.
+
+    :raises ValueError: If the document declares another encoding or
+        starts with the byte order mark of utf-16 or utf-32
+    """
+    if b"\x00" in bytes(buffer[:4]):
+        raise ValueError("lazy capture of subtrees needs a document "
+                         "encoded in utf-8, got utf-16 or utf-32")
+    m = _XML_ENCODING.match(buffer)
+    if m is None:
+        return
+    declared = bytes(m.group(1)).decode("ascii", "replace")
+    try:
+        encoding = codecs.lookup(declared).name
+    except LookupError:
+        encoding = declared
+    if encoding not in _LAZY_ENCODINGS:
+        raise ValueError("lazy capture of subtrees needs a document "
+                         "encoded in utf-8, got %s" % declared)
+
+_END_OF_TAG = re.compile(rb"""(?:[^>"']|"[^"]*"|'[^']*')*>""")
+
+class SourceCapture:
+    """Access to the bytes of the parsed document. Used to capture
+    subtrees as byte spans instead of parsing them into states.
+
+    :param buffer: The complete document
+    :param byte_index: Returns the position of the current xml-event
+        in buffer
+    """
+    __slots__ = ("buffer", "_byte_index", "_reread", "__weakref__")
+    buffer: Any
+    """bytes-like object, eg bytes, memoryview or mmap. None after
+    :py:meth:`release_buffer`.
+    """
+    _byte_index: Optional[Callable[[], int]]
+    _reread: Optional[Callable[[int, int], bytes]]
+
+    def __init__(self, buffer: Any, byte_index: Callable[[], int]) -> None:
+        self.buffer = buffer
+        self._byte_index = byte_index
+        self._reread = None
+
+    def span(self, start: int, end: int) -> Any:
+        """Bytes of the document from start to end.
+
+        :raises ValueError: If the buffer was released and the document
+            cant be read again
+        """
+        if self.buffer is None:
+            if self._reread is None:
+                raise ValueError("Buffer of the document was released")
+            return self._reread(start, end)
+        return self.buffer[start:end]
+
+    def release_buffer(self, reread: Callable[[int, int], bytes]) -> None:
+        """Drops the buffer, eg so that its memory map can be closed.
+        Afterwards spans are read with reread.
+        """
+        self.buffer = None
+        self._reread = reread
+
+    def byte_index(self) -> int:
+        """
+        :raises ValueError: If parsing has already ended
+        """
+        if self._byte_index is None:
+            raise ValueError("Document isnt parsed anymore")
+        return self._byte_index()
+
+    def detach(self) -> None:
+        """Drops the reference to the xml-reader after parsing. Only the
+        buffer is kept for captured spans.
+        """
+        self._byte_index = None
+
+    def end_of_tag(self, index: int) -> int:
+        """Returns the position after the tag starting at index."""
+        m = _END_OF_TAG.match(self.buffer, index)
+        if m is None:
+            raise ValueError("No complete xml tag at byte %d" % index)
+        return m.end()
+
 G = TypeVar("G", bound="_state")
 class _createnode_mixin(Generic[G]):
     """This class specifies how transition between different levels
     are coordinated
     """
+    __slots__ = ()
     _special_states: Mapping[Tuple[Optional[str], str], type[G]]
     _default_state: Optional[type[G]] = None
+    _lazy_state: Optional[type[G]] = None
+    """Replaces the default state, if subtrees are captured lazily."""
     def transition(self, trans: Tuple[str, str],
-                   attrs: Mapping[Optional[str], str],
-                   namespaces: Mapping[str, str],
+                   attrs: Mapping[Tuple[Optional[str], str], str],
+                   namespaces: NamespaceScope,
                    default_namespace: str,
                    ) -> G:
         """
         :param trans: This is the name of the xml-element
+        :param attrs: Qualified attributes of the xml-element
+        :param namespaces: All prefixes in scope of the xml-element
         :raises: BadSyntax
         """
         #kwargs = {"parentnode":self, "attrs":attrs, "typeof":trans}
-        state_gen = self._special_states.get(trans, self._default_state)
+        state_gen = self._special_states.get(trans)
+        if state_gen is None:
+            if self._lazy_state is not None\
+                    and self.capture_source is not None:
+                state_gen = self._lazy_state
+            else:
+                state_gen = self._default_state
         if state_gen is None:
             raise UnexpectedNodetype(trans, type(self), self._special_states)
         #if trans not in _RIF:
@@ -59,42 +179,75 @@ class _state(abc.ABC):
     """This class determines how the xmlhandler will interact with the current
     state.
     """
-    axioms: Graph
-    _buffer: list
+    __slots__ = ("parentnode", "namespaces", "default_namespace", "attrs",
+                 "namespace_base", "_buffer")
+    _buffer: Optional[list]
+    _collects_text: bool = False
+    """Only states, that collect text, keep the plain text content"""
+    captures_subtree: bool = False
+    """If true, this state handles all xml-elements within itself."""
+    _bucket: Optional[str] = None
+    """Name of the bucket of the parent, this state is filed in.
+    See :py:meth:`_wsdl_element.get_children`.
+    """
     namespace_base: str
-    namespaces: Mapping[str, str]
+    namespaces: NamespaceScope
     default_namespace: str
+    attrs: Mapping[Tuple[Optional[str], str], str]
+    """All attributes with key (namespace, localname). Attributes without
+    prefix have no namespace.
+    """
     def __init__(self, trans: Tuple[str, str],
                  parentnode: Union["_start", "_state"],
-                 attrs: Mapping[Optional[str], str],
-                 namespaces: Mapping[str, str] = {},
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
                  default_namespace: Optional[str] = None,
                  ) -> None:
-        self._buffer = []
+        self._buffer = None
         self.parentnode = parentnode
-        self.namespaces = {**self.parentnode.namespaces, **namespaces}
+        if namespaces is not None:
+            self.namespaces = namespaces
+        else:
+            self.namespaces = self.parentnode.namespaces
         if default_namespace is not None:
             self.default_namespace = default_namespace
         else:
             self.default_namespace = self.parentnode.default_namespace 
-        self.attrs = {}
-        for key, x in attrs.items():
-            self.attrs[(None, key)] = x
-            try:
-                _q = name2qname(key, self.default_namespace, self.namespaces)
-            except KeyError:
-                pass
-            else:
-                self.attrs[_q] = x
+        self.attrs = attrs
 
     @property
     def content(self):
         """Returns all current plain text content"""
+        if self._buffer is None:
+            return ""
         return "".join(self._buffer)
 
     def add_characters(self, content):
         """Adds characters to the current plain text content"""
-        self._buffer.append(content)
+        if not self._collects_text:
+            return
+        if self._buffer is None:
+            self._buffer = [content]
+        else:
+            self._buffer.append(content)
+
+    def get_attribute(self, namespace: Optional[str], name: str) -> str:
+        """Returns value of the attribute. Attributes without prefix are
+        also found via the default namespace of this element.
+
+        :raises KeyError:
+        """
+        try:
+            return self.attrs[(namespace, name)]
+        except KeyError:
+            if namespace is None or namespace != self.default_namespace:
+                raise
+        return self.attrs[(None, name)]
+
+    @property
+    def capture_source(self) -> Optional[SourceCapture]:
+        """Source of the document, if subtrees are captured lazily."""
+        return self.parentnode.capture_source
 
     @abc.abstractmethod
     def close(self) -> Optional["_state"]: ...
@@ -104,13 +257,15 @@ class _to_ElementTree(_createnode_mixin[_state], _state):
     Extensions can be decievered via external mappings and are
     ignored if non is found.
     """
+    __slots__ = ("element",)
     element: ET.Element
+    _collects_text = True
     _special_states = {}
     #_default_state = self
     def __init__(self, trans: Tuple[str, str],
                  parentnode: Union[_state, "_start", "_to_ElementTree"],
-                 attrs: Mapping[Optional[str], str],
-                 namespaces: Mapping[str, str] = {},
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
                  default_namespace: Optional[str] = None,
                  ) -> None:
         super().__init__(trans, parentnode, attrs,
@@ -122,7 +277,11 @@ class _to_ElementTree(_createnode_mixin[_state], _state):
             self.element = ET.SubElement(self.parentnode.element, element_name)
         else:
             self.element = ET.Element(element_name)
-        self.element.attrib.update(self.attrs)
+        for (namespace, name), value in self.attrs.items():
+            if namespace is None:
+                self.element.set(name, value)
+            else:
+                self.element.set("{%s}%s" % (namespace, name), value)
 
     def close(self):
         """
@@ -134,23 +293,98 @@ class _to_ElementTree(_createnode_mixin[_state], _state):
 _to_ElementTree._default_state = _to_ElementTree
 
 
+class _lazy_ElementTree(_state):
+    """Like :py:class:`_to_ElementTree` but only the position of the
+    xml-element in the source is recorded. All xml-elements within are
+    handled by this state. The element is parsed on first access
+    of :py:attr:`element`.
+    """
+    __slots__ = ("trans", "start", "end", "_depth", "_source", "_element")
+    captures_subtree = True
+    start: int
+    end: Optional[int]
+    """Span of the xml-element in the source"""
+    def __init__(self, trans: Tuple[str, str],
+                 parentnode: _state,
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
+                 default_namespace: Optional[str] = None,
+                 ) -> None:
+        super().__init__(trans, parentnode, attrs,
+                         namespaces, default_namespace)
+        self.namespace_base = self.parentnode.namespace_base
+        self.trans = trans
+        self._source = self.capture_source
+        self.start = self._source.byte_index()
+        self.end = None
+        self._depth = 0
+        self._element = None
+
+    def transition(self, trans: Tuple[str, str],
+                   attrs: Mapping[Tuple[Optional[str], str], str],
+                   namespaces: NamespaceScope,
+                   default_namespace: str,
+                   ) -> "_lazy_ElementTree":
+        self._depth += 1
+        return self
+
+    def close(self):
+        if self._depth:
+            self._depth -= 1
+            return self
+        source = self._source
+        end_of_starttag = source.end_of_tag(self.start)
+        if source.buffer[end_of_starttag-2:end_of_starttag] == b"/>":
+            self.end = end_of_starttag
+        else:
+            self.end = source.end_of_tag(source.byte_index())
+        return self.parentnode
+
+    @property
+    def element(self) -> ET.Element:
+        if self._element is None:
+            self._element = self._parse_element()
+        return self._element
+
+    def _parse_element(self) -> ET.Element:
+        """Parses the captured span. Namespaces declared outside of the
+        span are declared on a wrapping element.
+        """
+        if self.end is None:
+            raise AttributeError("xml-element isnt closed yet")
+        declarations = ["<wrapper"]
+        for prefix, namespace in self.parentnode.namespaces.items():
+            if prefix != "xml":
+                declarations.append(" xmlns:%s=%s"
+                                    % (prefix, quoteattr(namespace)))
+        if self.parentnode.default_namespace is not None:
+            declarations.append(" xmlns=%s"
+                                % quoteattr(self.parentnode.default_namespace))
+        declarations.append(">")
+        wrapper = ET.fromstring(b"".join((
+            "".join(declarations).encode("utf-8"),
+            self._source.span(self.start, self.end),
+            b"</wrapper>",
+            )))
+        return wrapper[0]
+
+
 class _start(_createnode_mixin["wsdl_description"], _state):
     """Startstate"""
+    __slots__ = ("first_state", "capture_source")
     default_namespace = None
-    namespaces = {}
+    namespaces = NamespaceScope({"xml": _ns_xml})
     first_state: Optional["wsdl_description"]
     namespace_base = "http://schemas.xmlsoap.org/wsdl/"
-    def __init__(self) -> None:
+    def __init__(self, capture_source: Optional[SourceCapture] = None,
+                 ) -> None:
         self.first_state = None
-        self.axioms = rdflib.Graph()
-        self._buffer = []
-
-    def finalize(self):
-        return self.axioms
+        self.capture_source = capture_source
+        self._buffer = None
 
     def transition(self, trans: Tuple[str, str],
-                   attrs: Mapping[Optional[str], str],
-                   namespaces: Mapping[str, str],
+                   attrs: Mapping[Tuple[Optional[str], str], str],
+                   namespaces: NamespaceScope,
                    default_namespace: str,
                    ) -> "wsdl_description":
         assert self.first_state is None, "Only one rootnode is expected"
@@ -168,36 +402,29 @@ class _state_with_axioms(_createnode_mixin[G], _state):
     :TODO: change append_axiom because this doesnt work with how 
         properties of class 2 work.
     """
+    __slots__ = ()
     parentnode: _state
     attrs: Mapping[Tuple[Optional[str], str], str]
-    namespaces: Mapping[str, str]
+    namespaces: NamespaceScope
     default_namespace: str
     def __init__(self, trans: Tuple[str, str], parentnode: _state,
-                 attrs: Mapping[str, str],
-                 namespaces: Mapping[str, str] = {},
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
                  default_namespace: Optional[str] = None,
                  ):
         self.parentnode = parentnode
-        self.axioms = rdflib.Graph()
-        self._buffer = []
-        self.namespaces = {**self.parentnode.namespaces, **namespaces}
+        self._buffer = None
+        if namespaces is not None:
+            self.namespaces = namespaces
+        else:
+            self.namespaces = self.parentnode.namespaces
         if default_namespace is not None:
             self.default_namespace = default_namespace
         else:
             self.default_namespace = self.parentnode.default_namespace 
-        self.attrs = {}
-        for key, x in attrs.items():
-            self.attrs[(None, key)] = x
-            try:
-                _q = name2qname(key, self.default_namespace, self.namespaces)
-            except KeyError:
-                pass
-            else:
-                self.attrs[_q] = x
+        self.attrs = attrs
         try:
-            self.namespace_base\
-                    = self.attrs['http://www.w3.org/XML/1998/namespace',
-                                 'base']
+            self.namespace_base = self.attrs[_ns_xml, 'base']
         except KeyError:
             self.namespace_base = parentnode.namespace_base
 
@@ -205,50 +432,124 @@ class _state_with_axioms(_createnode_mixin[G], _state):
         return
 
 class _wsdl_element(_state_with_axioms[G]):
+    __slots__ = ("child_nodes", "_buckets")
     child_nodes: List[G]
     """Register child nodes"""
+    _buckets: Optional[Dict[str, List[G]]]
+    """Child nodes by their :py:attr:`_state._bucket`"""
     def __init__(self, trans: Tuple[str, str],
                  parentnode: Union["_start", "_state"],
-                 attrs: Mapping[str, str],
-                 namespaces: Mapping[str, str] = {},
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
                  default_namespace: Optional[str] = None,
                  ) -> None:
         super().__init__(trans, parentnode, attrs,
                          namespaces, default_namespace)
         self.child_nodes = []
+        self._buckets = None
 
     @property
     def targetNamespace(self) -> str:
         return self.parentnode.targetNamespace
 
+    def get_children(self, bucket: str) -> List[G]:
+        """Returns all child nodes filed in given bucket in document order.
+        The returned list mustnt be changed.
+        """
+        if self._buckets is None:
+            return []
+        return self._buckets.get(bucket, [])
+
     @property
     def parent(self):
         return self.parentnode
 
     def transition(self, trans: Tuple[str, str],
-                   attrs: Mapping[Optional[str], str],
-                   namespaces: Mapping[str, str],
+                   attrs: Mapping[Tuple[Optional[str], str], str],
+                   namespaces: NamespaceScope,
                    default_namespace: str,
                    ) -> G:
         next_element = super().transition(trans, attrs, namespaces,
                                           default_namespace)
         self.child_nodes.append(next_element)
+        if next_element._bucket is not None:
+            if self._buckets is None:
+                self._buckets = {}
+            try:
+                self._buckets[next_element._bucket].append(next_element)
+            except KeyError:
+                self._buckets[next_element._bucket] = [next_element]
         return next_element
 
 
+_QName = Tuple[str, str]
+
 class wsdl_description(_wsdl_element[_wsdl_element], Description):
-    """`https://www.w3.org/TR/wsdl/#Description`_"""
+    """`https://www.w3.org/TR/wsdl/#Description`_
+
+    References between components are resolved with symbol tables keyed
+    by (namespace, localname). Components are registered, when their
+    xml-element closes.
+    """
+    __slots__ = ("_interfaces", "_bindings", "_services")
     name = None
+    _interfaces: Dict[_QName, "wsdl_interface"]
+    _bindings: Dict[_QName, "wsdl_binding"]
+    _services: Dict[_QName, "wsdl_service"]
+
+    def __init__(self, trans: Tuple[str, str],
+                 parentnode: Union["_start", "_state"],
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
+                 default_namespace: Optional[str] = None,
+                 ) -> None:
+        super().__init__(trans, parentnode, attrs,
+                         namespaces, default_namespace)
+        self._interfaces = {}
+        self._bindings = {}
+        self._services = {}
+
+    def register(self, component: "_wsdl_properties") -> None:
+        """Makes given closed component available for lookups. The first
+        component with the same qname is kept.
+        """
+        if isinstance(component, wsdl_interface):
+            table = self._interfaces
+        elif isinstance(component, wsdl_binding):
+            table = self._bindings
+        elif isinstance(component, wsdl_service):
+            table = self._services
+        else:
+            raise TypeError(component)
+        table.setdefault((component.targetNamespace, component.name),
+                         component)
+
+    def get_interface(self, ref_ns, ref_name) -> "wsdl_interface":
+        """
+        :raises UnresolvedReference:
+        """
+        return _resolve(self._interfaces, "interface", ref_ns, ref_name)
+
+    def get_binding(self, ref_ns, ref_name) -> "wsdl_binding":
+        """
+        :raises UnresolvedReference:
+        """
+        return _resolve(self._bindings, "binding", ref_ns, ref_name)
+
+    def get_service(self, ref_ns, ref_name) -> "wsdl_service":
+        """
+        :raises UnresolvedReference:
+        """
+        return _resolve(self._services, "service", ref_ns, ref_name)
 
     @property
     def bindings(self) -> Iterable["wsdl_binding"]:
-        return [x for x in self.child_nodes if isinstance(x, wsdl_binding)]
+        return self.get_children("bindings")
 
     @property
     def element_declarations(self) -> Iterable:
         REMOVE_EMPTY = str.maketrans({" ": None})
-        types = next(x for x in self.child_nodes
-                     if isinstance(x, wsdl_types))
+        types = self.get_children("types")[0]
         elem_decls = list(types.get_element_declarations())
         raise NotImplementedError(elem_decls)
         try:
@@ -262,15 +563,15 @@ class wsdl_description(_wsdl_element[_wsdl_element], Description):
 
     @property
     def interfaces(self) -> Iterable["wsdl_interface"]:
-        return [x for x in self.child_nodes if isinstance(x, wsdl_interface)]
+        return self.get_children("interfaces")
 
     @property
     def services(self) -> Iterable["wsdl_service"]:
-        return [x for x in self.child_nodes if isinstance(x, wsdl_service)]
+        return self.get_children("services")
 
     @property
     def type_definitions(self) -> Iterable["wsdl_types"]:
-        types = next(x for x in self.child_nodes if isinstance(x, wsdl_types))
+        types = self.get_children("types")[0]
         return types.get_type_definitions()
 
     @property
@@ -281,6 +582,7 @@ class wsdl_description(_wsdl_element[_wsdl_element], Description):
             return self.attrs[(_ns_wsdl, 'targetNamespace')]
 
 class _wsdl_with_QNameMapping(_wsdl_element):
+    __slots__ = ()
     local_name: str
     """Either 'wsdl.description', 'wsdl.'interface', 'wsdl.binding',
     'wsdl.service', 'wsdl.interfaceMessageReference',
@@ -292,19 +594,22 @@ class _wsdl_with_QNameMapping(_wsdl_element):
         return "%s#%s" % (self.parentnode.targetNamespace,
                           self.local_name)
 
-class wsdl_documentation(_wsdl_with_QNameMapping): ...
+class wsdl_documentation(_wsdl_with_QNameMapping):
+    __slots__ = ()
+    _collects_text = True
 
 class wsdl_typeextension(_to_ElementTree):
     """
     is used in documentation.types as extension for every type
     """
+    __slots__ = ("xml_info", "trans")
     xml_info: ET.ElementTree
     trans: Tuple[str, str]
     def __init__(
             self, trans: Tuple[str, str],
             parentnode: Union["_start", "_state"],
-            attrs: Mapping[Optional[str], str],
-            namespaces: Mapping[str, str] = {},
+            attrs: Mapping[Tuple[Optional[str], str], str],
+            namespaces: Optional[NamespaceScope] = None,
             default_namespace: Optional[str] = None,
             ) -> None:
         super().__init__(trans, parentnode, attrs,
@@ -322,11 +627,30 @@ class wsdl_typeextension(_to_ElementTree):
         self.xml_info = ET.ElementTree(self.element)
         return ret
 
+class wsdl_lazytypeextension(_lazy_ElementTree):
+    """Like :py:class:`wsdl_typeextension` but the extension is only
+    parsed when accessed.
+    """
+    __slots__ = ()
+
+    @property
+    def xml_info(self) -> ET.ElementTree:
+        return ET.ElementTree(self.element)
+
+    def get_type_definitions(self) -> Iterable[TypeDefinition]:
+        raise NotImplementedError()
+
+    def get_element_declarations(self) -> Iterable[ElementDeclaration]:
+        raise NotImplementedError(ET.tostring(self.xml_info.getroot()))
+
 class wsdl_types(_wsdl_element[_wsdl_element], TypeDefinition):
     """
     :TODO: xs:import is missing as expected transtype
     """
+    __slots__ = ()
+    _bucket = "types"
     _default_state = wsdl_typeextension
+    _lazy_state = wsdl_lazytypeextension
     child_nodes: Iterable["wsdl_typeextension"]
 
     def get_type_definitions(self):
@@ -342,6 +666,7 @@ class wsdl_types(_wsdl_element[_wsdl_element], TypeDefinition):
 
 
 class _wsdl_properties(_wsdl_element[_wsdl_element]):
+    __slots__ = ()
     parentnode: _wsdl_element
 
     @property
@@ -349,7 +674,61 @@ class _wsdl_properties(_wsdl_element[_wsdl_element]):
     def name(self) -> str: ...
 
 
-class wsdl_interface(_wsdl_properties, Interface):
+class _wsdl_toplevel(_wsdl_properties):
+    """Interface, binding or service. Registers itself at the description
+    for lookups, when closed.
+    """
+    __slots__ = ()
+    parentnode: wsdl_description
+
+    def close(self) -> None:
+        super().close()
+        self.parentnode.register(self)
+
+
+class wsdl_interface(_wsdl_toplevel, Interface):
+    """Names of operations and faults are only unique within one
+    interface, so references to them are resolved here.
+    """
+    __slots__ = ("_operations", "_faults")
+    _bucket = "interfaces"
+    _operations: Dict[_QName, "wsdl_interfaceOperation"]
+    _faults: Dict[_QName, "wsdl_interfaceFault"]
+
+    def __init__(self, trans: Tuple[str, str],
+                 parentnode: Union["_start", "_state"],
+                 attrs: Mapping[Tuple[Optional[str], str], str],
+                 namespaces: Optional[NamespaceScope] = None,
+                 default_namespace: Optional[str] = None,
+                 ) -> None:
+        super().__init__(trans, parentnode, attrs,
+                         namespaces, default_namespace)
+        self._operations = {}
+        self._faults = {}
+
+    def close(self) -> None:
+        for operation in self.interface_operations:
+            self._operations.setdefault(
+                    (operation.targetNamespace, operation.name), operation)
+        for fault in self.interface_faults:
+            self._faults.setdefault((fault.targetNamespace, fault.name),
+                                    fault)
+        super().close()
+
+    def get_interfaceOperation(self, ref_ns, ref_name,
+                               ) -> "wsdl_interfaceOperation":
+        """
+        :raises UnresolvedReference:
+        """
+        return _resolve(self._operations, "interfaceOperation",
+                        ref_ns, ref_name)
+
+    def get_interfaceFault(self, ref_ns, ref_name) -> "wsdl_interfaceFault":
+        """
+        :raises UnresolvedReference:
+        """
+        return _resolve(self._faults, "interfaceFault", ref_ns, ref_name)
+
     @property
     def name(self) -> str:
         return self.attrs[(None, "name")]
@@ -368,22 +747,23 @@ class wsdl_interface(_wsdl_properties, Interface):
 
     @property
     def interface_faults(self) -> Iterable["wsdl_interfaceFault"]:
-        return [x for x in self.child_nodes
-                if isinstance(x, wsdl_interfaceFault)]
+        return self.get_children("interface_faults")
 
     @property
     def interface_operations(self) -> Iterable["wsdl_interfaceOperation"]:
-        return [x for x in self.child_nodes
-                if isinstance(x, wsdl_interfaceOperation)]
+        return self.get_children("interface_operations")
+
 
+class wsdl_binding(_wsdl_toplevel, Binding):
+    __slots__ = ()
+    _bucket = "bindings"
 
-class wsdl_binding(_wsdl_properties, Binding):
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -393,12 +773,10 @@ class wsdl_binding(_wsdl_properties, Binding):
 
     @property
     def binding_faults(self) -> Iterable["wsdl_bindingFault"]:
-        return (x for x in self.child_nodes
-                if isinstance(x, wsdl_bindingFault))
+        return self.get_children("binding_faults")
     @property
     def binding_operations(self) -> Iterable["wsdl_bindingOperation"]:
-        return (x for x in self.child_nodes
-                if isinstance(x, wsdl_bindingOperation))
+        return self.get_children("binding_operations")
 
     @property
     def type(self) -> str:
@@ -409,28 +787,27 @@ class wsdl_binding(_wsdl_properties, Binding):
         inter_ns, inter_name = name2qname(self.attrs[(None, "interface")],
                                           self.default_namespace,
                                           self.namespaces)
-        return next(x for x in self.parent.interfaces
-                    if x.name == inter_name and x.targetNamespace == inter_ns)
+        return self.parent.get_interface(inter_ns, inter_name)
 
     @property
     def name(self) -> str:
         return self.attrs[(None, "name")]
 
 
-class wsdl_service(_wsdl_properties, Service):
+class wsdl_service(_wsdl_toplevel, Service):
+    __slots__ = ()
+    _bucket = "services"
 
     @property
     def endpoints(self) -> Iterable["wsdl_endpoint"]:
-        return (x for x in self.child_nodes
-                if isinstance(x, wsdl_endpoint))
+        return self.get_children("endpoints")
 
     @property
     def interface(self) -> "wsdl_interface":
         name = self.attrs[(None, "interface")]
         inter_ns, inter_name = name2qname(name, self.default_namespace,
                                           self.namespaces)
-        return next(x for x in self.parent.interfaces
-                    if x.name == inter_name and x.targetNamespace == inter_ns)
+        return self.parent.get_interface(inter_ns, inter_name)
 
     @property
     def name(self) -> str:
@@ -438,13 +815,15 @@ class wsdl_service(_wsdl_properties, Service):
 
 
 class wsdl_bindingFault(_wsdl_properties, BindingFault):
+    __slots__ = ()
+    _bucket = "binding_faults"
     parentnode: wsdl_binding
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -458,7 +837,7 @@ class wsdl_bindingFault(_wsdl_properties, BindingFault):
         ref_ns, ref_name = name2qname(self.attrs[(None, "ref")],
                                       self.default_namespace,
                                       self.namespaces)
-        return self.parent.parent.get_interfaceFault(ref_ns, ref_name)
+        return self.parent.interface.get_interfaceFault(ref_ns, ref_name)
 
     @property
     def ref(self) -> str:
@@ -479,13 +858,15 @@ class wsdl_bindingFault(_wsdl_properties, BindingFault):
         return name
 
 class wsdl_bindingOperation(_wsdl_properties, BindingOperation):
+    __slots__ = ()
+    _bucket = "binding_operations"
     parentnode: wsdl_binding
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -495,21 +876,19 @@ class wsdl_bindingOperation(_wsdl_properties, BindingOperation):
 
     @property
     def binding_fault_references(self):
-        return (x for x in self.child_nodes
-                if isinstance(x, (wsdl_bindingFaultReferenceIn,
-                                  wsdl_bindingFaultReferenceOut)))
+        return self.get_children("binding_fault_references")
 
     @property
     def binding_message_references(self) -> Iterable["BindingMessageReference"]:
-        return (x for x in self.child_nodes
-                if isinstance(x, wsdl_bindingMessageReference))
+        return self.get_children("binding_message_references")
 
     @property
     def interface_operation(self) -> "wsdl_interfaceOperation":
         ref_ns, ref_name = name2qname(self.attrs[(None, "ref")],
                                       self.default_namespace,
                                       self.namespaces)
-        return self.parent.parent.get_interfaceOperation(ref_ns, ref_name)
+        return self.parent.interface.get_interfaceOperation(ref_ns,
+                                                            ref_name)
 
     @property
     def ref(self) -> str:
@@ -530,12 +909,15 @@ class wsdl_bindingOperation(_wsdl_properties, BindingOperation):
         return name
 
 class wsdl_bindingMessageReference(_wsdl_element, BindingMessageReference):
+    __slots__ = ()
+    _bucket = "binding_message_references"
+
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -547,12 +929,15 @@ class wsdl_bindingMessageReference(_wsdl_element, BindingMessageReference):
         raise NotImplementedError()
 
 class wsdl_bindingFaultReference(_wsdl_element, BindingFaultReference):
+    __slots__ = ()
+    _bucket = "binding_fault_references"
+
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -563,29 +948,35 @@ class wsdl_bindingFaultReference(_wsdl_element, BindingFaultReference):
 class wsdl_messageReferenceIn(_wsdl_properties):
     """More information in `https://www.w3.org/TR/wsdl/#Binding_Message_Reference_XMLRep`_
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         raise NotImplementedError()
 
 class wsdl_messageReferenceOut(_wsdl_properties):
     """More information in `https://www.w3.org/TR/wsdl/#Binding_Message_Reference_XMLRep`_
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         raise NotImplementedError()
 
 class wsdl_bindingFaultReferenceIn(wsdl_bindingFaultReference):
     """More information in `https://www.w3.org/TR/wsdl/#Binding_Fault_Reference`_
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         raise NotImplementedError()
 
 class wsdl_bindingFaultReferenceOut(wsdl_bindingFaultReference):
     """More information in `https://www.w3.org/TR/wsdl/#Binding_Fault_Reference`_
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         raise NotImplementedError()
 
 
 class wsdl_interfaceFault(_wsdl_properties, InterfaceFault):
+    __slots__ = ()
+    _bucket = "interface_faults"
     parentnode: wsdl_interface
 
     @property
@@ -635,6 +1026,8 @@ class wsdl_interfaceFault(_wsdl_properties, InterfaceFault):
         return self.attrs[(None, "name")]
 
 class wsdl_interfaceOperation(_wsdl_properties, InterfaceOperation):
+    __slots__ = ()
+    _bucket = "interface_operations"
     input: Optional["wsdl_input"]
     output: Optional["wsdl_output"]
     parentnode: wsdl_interface
@@ -644,7 +1037,7 @@ class wsdl_interfaceOperation(_wsdl_properties, InterfaceOperation):
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -655,14 +1048,12 @@ class wsdl_interfaceOperation(_wsdl_properties, InterfaceOperation):
     @property
     def interface_fault_references(
             self) -> Iterable["InterfaceFaultReference"]:
-        return [x for x in self.child_nodes
-                if isinstance(x, (wsdl_infault, wsdl_outfault))]
+        return self.get_children("interface_fault_references")
 
     @property
     def interface_message_references(
             self) -> Iterable[Union["wsdl_input", "wsdl_output"]]:
-        return [x for x in self.child_nodes
-                if isinstance(x, (wsdl_input, wsdl_output))]
+        return self.get_children("interface_message_references")
 
 
     @property
@@ -677,7 +1068,10 @@ class wsdl_interfaceOperation(_wsdl_properties, InterfaceOperation):
         """Implements acces to if operation is safe.
         See `https://www.w3.org/TR/wsdl20-adjuncts/#safety`_
         """
-        return self.attrs.get((_ns_wsdlx, "safe"), "xs:false")
+        try:
+            return self.get_attribute(_ns_wsdlx, "safe")
+        except KeyError:
+            return "xs:false"
 
     @property
     def message_exchange_pattern(self) -> str:
@@ -701,13 +1095,15 @@ class wsdl_endpoint(_wsdl_properties, Endpoint):
     """:term:`wsdl endpoint`
     For more information see `https://www.w3.org/TR/wsdl/#Endpoint`_
     """
+    __slots__ = ()
+    _bucket = "endpoints"
     parentnode: "wsdl_service"
     def get(self, namespace: str, name: str, as_qname: bool=False,
             **kwargs: Any) -> str | Tuple[str, str]:
         if kwargs:
             raise TypeError("Unexpected keywords: %s" % kwargs)
         try:
-            q = self.attrs[(namespace, name)]
+            q = self.get_attribute(namespace, name)
         except KeyError:
             raise
             return None
@@ -720,8 +1116,7 @@ class wsdl_endpoint(_wsdl_properties, Endpoint):
     def binding(self) -> "wsdl_binding":
         ns, name = name2qname(self.attrs[(None, "binding")],
                               self.default_namespace, self.namespaces)
-        return next(x for x in self.parent.parent.bindings
-                    if x.name == name and x.targetNamespace == ns)
+        return self.parent.parent.get_binding(ns, name)
 
     @property
     def address(self) -> str:
@@ -737,6 +1132,7 @@ class wsdl_endpoint(_wsdl_properties, Endpoint):
 
 
 class _wsdl_interfaceReference(_wsdl_properties):
+    __slots__ = ()
     contentmodel: str
 
     @property
@@ -757,6 +1153,8 @@ class _wsdl_interfaceReference(_wsdl_properties):
 
 class _wsdl_interfaceMessageReference(_wsdl_interfaceReference,
                                       InterfaceMessageReference):
+    __slots__ = ()
+    _bucket = "interface_message_references"
     parentnode: "wsdl_interfaceOperation"
 
     @property
@@ -806,6 +1204,8 @@ class _wsdl_interfaceMessageReference(_wsdl_interfaceReference,
 
 
 class wsdl_input(_wsdl_interfaceMessageReference):
+    __slots__ = ()
+
     @property
     def direction(self) -> str: return "in"
 
@@ -814,6 +1214,8 @@ class wsdl_input(_wsdl_interfaceMessageReference):
         return self.attrs[(None, "element")]
 
 class wsdl_output(_wsdl_interfaceMessageReference):
+    __slots__ = ()
+
     @property
     def direction(self) -> str: return "out"
 
@@ -823,6 +1225,8 @@ class wsdl_output(_wsdl_interfaceMessageReference):
 
 #class _wsdl_interfaceFaultReference(_wsdl_interfaceReference):
 class _wsdl_interfaceFaultReference(_wsdl_properties, InterfaceFaultReference):
+    __slots__ = ()
+    _bucket = "interface_fault_references"
     parentnode: wsdl_interfaceOperation
 
     @property
@@ -844,6 +1248,8 @@ class _wsdl_interfaceFaultReference(_wsdl_properties, InterfaceFaultReference):
         return self.attrs[(None, "messageLabel")]
 
 class wsdl_infault(_wsdl_interfaceFaultReference):
+    __slots__ = ()
+
     @property
     def interface_fault(self):
         raise NotImplementedError()
@@ -860,13 +1266,14 @@ class wsdl_infault(_wsdl_interfaceFaultReference):
 
 
 class wsdl_outfault(_wsdl_interfaceFaultReference):
+    __slots__ = ()
+
     @property
     def interface_fault(self) -> wsdl_interfaceFault:
         ref_ns, ref_name = name2qname(self.attrs[(None, "ref")],
                                       self.default_namespace,
                                       self.namespaces)
-        return next(x for x in self.interface.interface_faults
-                    if x.name == ref_name and x.targetNamespace == ref_ns)
+        return self.interface.get_interfaceFault(ref_ns, ref_name)
 
     @property
     def direction(self) -> str:
@@ -877,10 +1284,12 @@ class wsdl_outfault(_wsdl_interfaceFaultReference):
         return self.operation.output
 
 
-class wsdl_fault(_wsdl_element): ...
+class wsdl_fault(_wsdl_element):
+    __slots__ = ()
 
 
-class wsdl_operation(_wsdl_element): ...
+class wsdl_operation(_wsdl_element):
+    __slots__ = ()
 
 
 #ignore 'Access to generic instance variables via class is ambiguous'
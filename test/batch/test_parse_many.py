@@ -0,0 +1,65 @@
+import tarfile
+import zipfile
+import pytest
+from rdflib import Dataset, Graph, URIRef
+from rdflib.compare import isomorphic
+from rdflib_wsdl import parse_many
+from ..examplecases import ex1
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Directory with example 1 and a broken document"""
+    directory = tmp_path / "catalog"
+    directory.mkdir()
+    (directory / "ex1.wsdl").write_bytes(ex1.path_wsdl.read_bytes())
+    (directory / "broken.wsdl").write_text("<description>")
+    (directory / "ignored.txt").write_text("not a wsdl document")
+    return directory
+
+
+def _expected() -> Graph:
+    return Graph().parse(ex1.path_ttl, format="ttl")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parseDirectory(catalog, workers):
+    result = parse_many(catalog, workers=workers)
+    assert [error.name.rpartition("/")[2] for error in result.errors]\
+            == ["broken.wsdl"]
+    assert len(result.documents) == 1
+    assert isomorphic(result.graph, _expected())
+
+
+@pytest.mark.parametrize("archive_type", ["zip", "tar"])
+def test_parseArchive(catalog, tmp_path, archive_type):
+    path = tmp_path / ("catalog." + archive_type)
+    if archive_type == "zip":
+        with zipfile.ZipFile(path, "w") as archive:
+            for document in catalog.iterdir():
+                archive.write(document, document.name)
+    else:
+        with tarfile.open(path, "w:gz") as archive:
+            for document in catalog.iterdir():
+                archive.add(document, document.name)
+    result = parse_many([path], workers=2)
+    assert len(result.errors) == 1
+    assert isomorphic(result.graph, _expected())
+
+
+def test_parseIntoDataset(catalog):
+    """Every document gets its own graph in a dataset."""
+    dataset = Dataset()
+    result = parse_many(catalog, target=dataset, workers=1)
+    name, = result.documents
+    assert isomorphic(dataset.graph(URIRef(name)), _expected())
+
+
+def test_parseMissingPath(catalog, tmp_path):
+    """A missing path is reported and doesnt abort the batch."""
+    missing = tmp_path / "missing.wsdl"
+    result = parse_many([missing, catalog], workers=1)
+    assert [error.name.rpartition("/")[2] for error in result.errors]\
+            == ["missing.wsdl", "broken.wsdl"]
+    assert result.errors[0].message.startswith("FileNotFoundError")
+    assert isomorphic(result.graph, _expected())
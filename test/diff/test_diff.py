@@ -0,0 +1,45 @@
+from rdflib import URIRef
+from rdflib_wsdl import diff_descriptions
+from rdflib_wsdl.shared import WSDL
+from ..examplecases import ex1
+
+
+def _changed(*replacements) -> bytes:
+    data = ex1.path_wsdl.read_text()
+    for old, new in replacements:
+        assert old in data
+        data = data.replace(old, new)
+    return data.encode()
+
+
+def test_diffUnchanged():
+    diff = diff_descriptions(ex1.path_wsdl, ex1.path_wsdl.read_bytes())
+    assert not diff
+    assert not diff.added and not diff.removed and not diff.changed
+
+
+def test_diffProperty():
+    new = _changed(('"http://greath.example.com/2004/reservation"',
+                    '"http://greath.example.com/2005/reservation"'))
+    diff = diff_descriptions(ex1.path_wsdl, new)
+    assert not diff.added and not diff.removed
+    [change] = diff.changed
+    assert change.fragment_identifier\
+            == "wsdl.endpoint(reservationService/reservationEndpoint)"
+    [prop] = change.properties
+    assert prop.property == WSDL.address
+    assert prop.added == {
+            URIRef("http://greath.example.com/2005/reservation")}
+
+
+def test_diffRenamedOperation():
+    new = _changed(('name="opCheckAvailability"', 'name="opCheck"'),
+                   ('ref="tns:opCheckAvailability"', 'ref="tns:opCheck"'))
+    diff = diff_descriptions(ex1.path_wsdl, new)
+    assert "wsdl.interfaceOperation(reservationInterface/opCheck)"\
+            in diff.added
+    assert "wsdl.bindingOperation(reservationSOAPBinding/opCheckAvailability)"\
+            in diff.removed
+    assert len(diff.added) == len(diff.removed) == 5
+    # Links to subcomponents arent reported as changed properties
+    assert not diff.changed
@@ -47,3 +47,33 @@ def test_compareDifferentFormats(register_wsdl_format, description_info):
             logger.debug("info only in compgraph:\n%s" % incomp.serialize())
             logger.debug("info only in nextraph:\n%s" % innext.serialize())
             raise
+
+
+@pytest.mark.parametrize("parse_kwargs", [
+    param({"namespace_aware": True}, id="namespace_aware"),
+    param({"streaming": True}, id="streaming"),
+    param({"lazy_types": True}, id="lazy_types"),
+    ])
+def test_parserModes(register_wsdl_format, description_info, parse_kwargs):
+    """Tests if every mode of the parser produces the same triples."""
+    iso_comp = to_isomorphic(description_info.graph)
+    nextgraph = Graph().parse(description_info.path_wsdl, format="wsdl",
+                              **parse_kwargs)
+    iso_next = to_isomorphic(nextgraph)
+    inboth, incomp, innext = graph_diff(iso_comp, iso_next)
+    assert not innext and not incomp, "Not the same information"
+
+
+@pytest.mark.parametrize("data_type", [bytes, str])
+@pytest.mark.parametrize("lazy_types", [False, True])
+def test_parseData(register_wsdl_format, description_info, data_type,
+                   lazy_types):
+    """Tests parsing from memory. Bytes are fed without copying."""
+    data = description_info.path_wsdl.read_bytes()
+    if data_type is str:
+        data = data.decode("utf-8")
+    nextgraph = Graph().parse(data=data, format="wsdl",
+                              lazy_types=lazy_types)
+    inboth, incomp, innext = graph_diff(to_isomorphic(description_info.graph),
+                                        to_isomorphic(nextgraph))
+    assert not innext and not incomp, "Not the same information"
@@ -0,0 +1,92 @@
+from rdflib import Graph, URIRef
+from rdflib.plugins.stores.memory import Memory
+from rdflib_wsdl import Ingester
+from rdflib_wsdl.shared import WSDL
+from ..examplecases import ex1
+
+
+class _CountingStore(Memory):
+    """Counts added and removed triples"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = 0
+
+    def add(self, triple, context, quoted=False):
+        self.writes += 1
+        super().add(triple, context, quoted)
+
+    def remove(self, triple, context=None):
+        self.writes += 1
+        super().remove(triple, context)
+
+
+_ADDRESS = "http://greath.example.com/2004/reservation"
+_MOVED = "http://greath.example.com/2005/reservation"
+
+
+def _moved_endpoint() -> bytes:
+    data = ex1.path_wsdl.read_text()
+    assert data.count('"%s"' % _ADDRESS) == 1
+    return data.replace('"%s"' % _ADDRESS, '"%s"' % _MOVED).encode()
+
+
+def test_reingestUnchanged():
+    graph = Graph()
+    ingester = Ingester(graph)
+    first = ingester.ingest(ex1.path_wsdl)
+    assert len(first.added) == len(graph)
+    delta = ingester.ingest(ex1.path_wsdl.read_bytes())
+    assert not delta.added and not delta.removed
+    assert not delta.changed_components
+
+
+def test_reingestDelta():
+    store = _CountingStore()
+    graph = Graph(store=store)
+    ingester = Ingester(graph)
+    ingester.ingest(ex1.path_wsdl)
+    store.writes = 0
+    changed = _moved_endpoint()
+    delta = ingester.ingest(changed)
+    assert URIRef(_MOVED) in set(graph.objects(None, WSDL.address))
+    assert len(delta.changed_components) == 1
+    assert len(delta.added) == len(delta.removed) == 1
+    assert store.writes == 2
+    expected = Graph()
+    Ingester(expected).ingest(changed)
+    assert set(graph) == set(expected)
+
+
+def test_unload():
+    store = _CountingStore()
+    graph = Graph(store=store)
+    ingester = Ingester(graph)
+    delta = ingester.ingest(ex1.path_wsdl)
+    store.writes = 0
+    ingester.unload(delta.description)
+    assert len(graph) == 0
+    # One pattern per subject instead of one call per triple
+    assert store.writes == len({s for s, p, o in delta.added})
+    assert store.writes < len(delta.added)
+
+
+class _RemoveNStore(Memory):
+    """Store with a method to remove many quads at once"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.removeN_calls = 0
+
+    def removeN(self, quads):
+        self.removeN_calls += 1
+        for s, p, o, c in quads:
+            self.remove((s, p, o), c)
+
+
+def test_unloadRemoveN():
+    store = _RemoveNStore()
+    graph = Graph(store=store)
+    ingester = Ingester(graph)
+    delta = ingester.ingest(ex1.path_wsdl)
+    ingester.unload(delta.description)
+    assert len(graph) == 0
+    assert store.removeN_calls == 1
@@ -0,0 +1,36 @@
+import pytest
+from rdflib import BNode, Graph, URIRef
+from rdflib.compare import isomorphic
+from rdflib_wsdl.shared import WSDL
+from ..examplecases import ex1
+
+
+def _parse(**options) -> Graph:
+    return Graph().parse(ex1.path_wsdl, format="wsdl", **options)
+
+
+def test_stableBNodes(register_wsdl_format):
+    first = _parse(preserve_bnode_ids=True)
+    second = _parse(preserve_bnode_ids=True, streaming=True)
+    assert set(first) == set(second)
+    assert isomorphic(first, Graph().parse(ex1.path_ttl, format="ttl"))
+    assert any(isinstance(o, BNode)
+               for o in first.objects(None, WSDL.elementDeclaration))
+    assert set(_parse()) != set(_parse()), "default stays random"
+
+
+def test_skolemized(register_wsdl_format):
+    graph = _parse(skolemize=True)
+    declarations = list(graph.objects(None, WSDL.elementDeclaration))
+    assert declarations
+    for node in declarations:
+        assert isinstance(node, URIRef)
+        assert node.startswith("http://greath.example.com/.well-known/genid/")
+    assert set(graph) == set(_parse(skolemize=True))
+
+
+def test_unknownMode():
+    from rdflib_wsdl.wsdl2rdf import blank_node_ids
+    with pytest.raises(ValueError):
+        with blank_node_ids("sequential"):
+            pass
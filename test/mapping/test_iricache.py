@@ -0,0 +1,34 @@
+from rdflib_wsdl import WSDLIncrementalParser
+from rdflib_wsdl.wsdl2rdf.class_MapperWSDL2RDF import _create_id, mapping_run
+from ..examplecases import ex1
+
+
+class _CountingOperation:
+    """Counts how often the fragment identifier is computed"""
+    def __init__(self, operation):
+        self.operation = operation
+        self.calls = 0
+
+    @property
+    def targetNamespace(self):
+        return self.operation.targetNamespace
+
+    @property
+    def fragment_identifier(self):
+        self.calls += 1
+        return self.operation.fragment_identifier
+
+
+def test_iriCachedPerRun():
+    parser = WSDLIncrementalParser(rdf_generator=lambda d: ())
+    parser.feed(ex1.path_wsdl.read_bytes())
+    parser.close()
+    operation = parser.description.interfaces[0].interface_operations[0]
+    counting = _CountingOperation(operation)
+    with mapping_run():
+        iri = _create_id(counting)
+        with mapping_run():
+            assert _create_id(counting) is iri
+    assert counting.calls == 1
+    assert _create_id(counting) == iri
+    assert counting.calls == 2, "outside of a run nothing is cached"
@@ -0,0 +1,45 @@
+from rdflib import Graph, Literal, RDFS
+from rdflib.compare import isomorphic
+from rdflib_wsdl import WSDLIncrementalParser
+from rdflib_wsdl.wsdl2rdf import MapperWSDL2RDF, ParserData, get_mapper,\
+        yield_extension, legacy_extension
+from rdflib_wsdl.wsdl2rdf.class_MapperWSDL2RDF import _create_id, _iri_cache
+from ..examplecases import ex1
+
+
+def _parse_ex1():
+    parser = WSDLIncrementalParser(rdf_generator=lambda d: ())
+    parser.feed(ex1.path_wsdl.read_bytes())
+    parser.close()
+    return parser.description
+
+
+def test_iterTriples():
+    description = _parse_ex1()
+    triples = get_mapper().iter_triples(description)
+    first = next(triples)
+    assert _iri_cache.get() is None, "mapping run leaked to consumer"
+    graph = Graph()
+    graph.add(first)
+    for triple in triples:
+        graph.add(triple)
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    assert isomorphic(graph, expected)
+
+
+def test_extensionProtocols():
+    @yield_extension
+    def yielding(endpoint):
+        yield _create_id(endpoint), RDFS.comment, Literal("yielded")
+
+    def adding(g, endpoint):
+        g.add((_create_id(endpoint), RDFS.comment, Literal("added")))
+
+    mapper = MapperWSDL2RDF.create_with_parser_data(additional_extensions=[
+        ParserData(endpoint=yielding), ParserData(endpoint=adding)])
+    comments = {o for s, p, o in mapper.iter_triples(_parse_ex1())
+                if p == RDFS.comment}
+    assert comments == {Literal("yielded"), Literal("added")}
+    adapted = legacy_extension(adding)
+    assert adapted.yields_triples
+    assert legacy_extension(yielding) is yielding
@@ -0,0 +1,53 @@
+import pytest
+from rdflib import Graph, Dataset, URIRef
+from rdflib.compare import isomorphic
+from rdflib.plugins.stores.memory import Memory
+from rdflib_wsdl import WSDLIncrementalParser
+from rdflib_wsdl.wsdl2rdf import BatchedSink
+from ..examplecases import ex1
+
+
+class _CountingStore(Memory):
+    """Counts the calls of addN"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.addN_calls = 0
+
+    def addN(self, quads):
+        self.addN_calls += 1
+        return super().addN(quads)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_batchedInsertion(streaming):
+    store = _CountingStore()
+    graph = Graph(store=store)
+    parser = WSDLIncrementalParser(graph, streaming=streaming, batch_size=50)
+    parser.feed(ex1.path_wsdl.read_bytes())
+    parser.close()
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    assert isomorphic(graph, expected)
+    assert 0 < store.addN_calls <= len(graph) // 50 + 5
+
+
+def test_batchedSinkAtomic():
+    target = Graph()
+    triple = (URIRef("http://example.com/s"), URIRef("http://example.com/p"),
+              URIRef("http://example.com/o"))
+    with pytest.raises(KeyError):
+        with BatchedSink(target, 1, atomic=True) as sink:
+            sink.add(triple)
+            raise KeyError()
+    assert len(target) == 0
+    with BatchedSink(target, 1) as sink:
+        sink.add(triple)
+        assert triple in target, "full batches are added immediately"
+
+
+def test_batchedSinkDataset():
+    target = Dataset()
+    triple = (URIRef("http://example.com/s"), URIRef("http://example.com/p"),
+              URIRef("http://example.com/o"))
+    with BatchedSink(target) as sink:
+        sink.add(triple)
+    assert triple in target.default_graph
@@ -0,0 +1,29 @@
+import pytest
+from rdflib import URIRef
+from rdflib_wsdl.shared import WSDL, WSOAP, MEP_inOnly, MEP_inOut
+from rdflib_wsdl.wsdl2rdf.terms import iri, literal, message_label_uri
+
+
+def test_termsInterned():
+    assert WSDL.Interface is WSDL.Interface
+    assert WSDL["binds"] is WSDL.binds
+    assert WSOAP.term("unusedTerm") is WSOAP.unusedTerm
+    assert WSDL.index != WSDL["index"], "str methods arent shadowed"
+    assert iri(MEP_inOut) is iri(MEP_inOut)
+    assert literal("1.2") is literal("1.2")
+
+
+@pytest.mark.parametrize("label,mep,expected", [
+    ("In", MEP_inOut, "http://www.w3.org/ns/wsdl/in-out#In"),
+    ("in", MEP_inOut, "http://www.w3.org/ns/wsdl/in-out#In"),
+    ("Out", MEP_inOut, "http://www.w3.org/ns/wsdl/in-out#Out"),
+    ("Other", MEP_inOut, "http://www.w3.org/ns/wsdl/in-out#Out"),
+    ("Out", MEP_inOnly, "http://www.w3.org/ns/wsdl/in-only#In"),
+    ])
+def test_messageLabel(label, mep, expected):
+    assert message_label_uri(label, mep) == URIRef(expected)
+
+
+def test_messageLabelUnknownPattern():
+    with pytest.raises(NotImplementedError):
+        message_label_uri("In", "http://example.com/unknown-mep")
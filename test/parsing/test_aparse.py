@@ -0,0 +1,31 @@
+import asyncio
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib_wsdl import aparse
+from ..examplecases import ex1
+
+
+def test_aparseStreamReader():
+    async def parse() -> Graph:
+        reader = asyncio.StreamReader()
+        reader.feed_data(ex1.path_wsdl.read_bytes())
+        reader.feed_eof()
+        return await aparse(reader, chunk_size=100)
+    graph = asyncio.run(parse())
+    assert isomorphic(graph, Graph().parse(ex1.path_ttl, format="ttl"))
+
+
+def test_aparseConcurrent():
+    """Tests that multiple documents can be parsed concurrently from
+    async iterables.
+    """
+    data = ex1.path_wsdl.read_bytes()
+    async def chunks():
+        for i in range(0, len(data), 50):
+            yield data[i:i+50]
+            await asyncio.sleep(0)
+    async def parse_all():
+        return await asyncio.gather(*(aparse(chunks()) for _ in range(3)))
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    for graph in asyncio.run(parse_all()):
+        assert isomorphic(graph, expected)
@@ -0,0 +1,55 @@
+import pytest
+from pytest import param
+from rdflib import Dataset, Graph, URIRef
+from rdflib.compare import isomorphic
+from rdflib_wsdl import unload_description
+from ..examplecases import ex1
+
+_RESSVC = "http://greath.example.com/2004/wsdl/resSvc"
+_IRI = URIRef(_RESSVC + "#wsdl.description()")
+_OTHER = URIRef("http://example.com/other#wsdl.description()")
+
+
+def _other_description() -> bytes:
+    """Returns example 1 with another target namespace."""
+    data = ex1.path_wsdl.read_text()
+    return data.replace('"%s"' % _RESSVC, '"http://example.com/other"')\
+            .replace('xmlns:tns="%s"' % _RESSVC,
+                     'xmlns:tns="http://example.com/other"').encode()
+
+
+@pytest.mark.parametrize("parse_kwargs", [
+    param({}, id="default"),
+    param({"streaming": True}, id="streaming"),
+    param({"mapping_workers": 1}, id="parallel"),
+    ])
+def test_namedGraph(register_wsdl_format, parse_kwargs):
+    ds = Dataset()
+    ds.parse(ex1.path_wsdl, format="wsdl", named_graph=True, **parse_kwargs)
+    assert len(ds.graph(ds.default_graph.identifier)) == 0
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    assert isomorphic(ds.graph(_IRI), expected)
+
+
+def test_replaceAndUnload(register_wsdl_format):
+    ds = Dataset()
+    ds.parse(ex1.path_wsdl, format="wsdl", named_graph=True)
+    ds.parse(data=_other_description(), format="wsdl", named_graph=True)
+    other = set(ds.graph(_OTHER))
+    assert other and not other & set(ds.graph(_IRI))
+    # A new revision replaces only the triples of its description
+    ds.parse(ex1.path_wsdl, format="wsdl", named_graph=True,
+             preserve_bnode_ids=True)
+    assert len(ds.graph(_IRI)) == len(Graph().parse(ex1.path_ttl))
+    assert set(ds.graph(_OTHER)) == other
+    unload_description(ds, _IRI)
+    assert _IRI not in {g.identifier for g in ds.graphs()}
+    assert set(ds.graph(_OTHER)) == other
+
+
+@pytest.mark.parametrize("store", ["SimpleMemory", "Memory"])
+def test_namedGraphNeedsContexts(register_wsdl_format, store):
+    g = Graph(store=store)
+    with pytest.raises(ValueError):
+        g.parse(ex1.path_wsdl, format="wsdl", named_graph=True)
+    assert len(g.store) == 0
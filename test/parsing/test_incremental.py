@@ -0,0 +1,21 @@
+from rdflib import Graph
+from rdflib.compare import to_isomorphic, graph_diff
+from rdflib_wsdl import WSDLIncrementalParser
+from rdflib_wsdl.wsdl_components import Description
+from ..examplecases import ex1
+
+
+def test_feedChunks():
+    """Tests if wsdl given in small chunks is parsed the same as the
+    whole document.
+    """
+    data = ex1.path_wsdl.read_bytes()
+    parser = WSDLIncrementalParser()
+    for i in range(0, len(data), 64):
+        parser.feed(data[i:i+64])
+    graph = parser.close()
+    assert isinstance(parser.description, Description)
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    inboth, inexpected, ingraph = graph_diff(to_isomorphic(expected),
+                                             to_isomorphic(graph))
+    assert not inexpected and not ingraph
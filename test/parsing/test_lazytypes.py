@@ -0,0 +1,146 @@
+from xml.etree import ElementTree as ET
+import gc
+import io
+import mmap
+import pytest
+from rdflib import Graph
+from rdflib_wsdl.wsdl2rdf import MapperWSDL2RDF, ParserData
+from rdflib_wsdl.xmlparser import WSDLXMLHandler, read_description
+from rdflib_wsdl.xmlparser_states import wsdl_types, wsdl_typeextension, \
+        wsdl_lazytypeextension
+from ..examplecases import ex1
+
+
+def _types_extension(data: bytes, lazy: bool):
+    parser = WSDLXMLHandler.create_parser(None, set(),
+                                          source_buffer=data if lazy else None)
+    parser.feed(data)
+    parser.close()
+    description = parser.getContentHandler().description
+    types, = [state for state in description.child_nodes
+              if isinstance(state, wsdl_types)]
+    extension, = types.child_nodes
+    return extension
+
+
+def test_lazyTypes():
+    """Tests that lazy captured schemas are the same as directly parsed."""
+    data = ex1.path_wsdl.read_bytes()
+    expected = _types_extension(data, False)
+    lazy = _types_extension(data, True)
+    assert isinstance(expected, wsdl_typeextension)
+    assert isinstance(lazy, wsdl_lazytypeextension)
+    assert lazy._element is None, "schema shouldnt be parsed before access"
+    assert [(e.tag, e.attrib) for e in lazy.xml_info.iter()]\
+            == [(e.tag, e.attrib) for e in expected.xml_info.iter()]
+
+
+def test_lazyTypesEmptyElement():
+    """Tests capturing of an empty xml-element with '/>' in an attribute."""
+    data = ex1.path_wsdl.read_bytes()
+    start = data.index(b"<xs:schema")
+    end = data.index(b"</xs:schema>") + len(b"</xs:schema>")
+    empty = b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" a="/>"/>'
+    data = data[:start] + empty + data[end:]
+    lazy = _types_extension(data, True)
+    root = lazy.xml_info.getroot()
+    assert root.tag == "{http://www.w3.org/2001/XMLSchema}schema"
+    assert root.get("a") == "/>"
+    assert len(root) == 0
+
+
+def _keeping_mapper(descriptions: list) -> MapperWSDL2RDF:
+    """Mapper, that keeps every mapped description in descriptions."""
+    def keep_description(g, interface):
+        descriptions.append(interface.parent)
+    return MapperWSDL2RDF.create_with_parser_data(additional_extensions=[
+        ParserData(interface=keep_description)])
+
+
+def _lazy_schema(description):
+    types, = description.get_children("types")
+    extension, = types.child_nodes
+    assert isinstance(extension, wsdl_lazytypeextension)
+    return extension.xml_info.getroot()
+
+
+@pytest.mark.parametrize("from_path", [True, False])
+def test_lazyTypesAfterPluginParse(register_wsdl_format, from_path):
+    """Captured schemas stay readable after parsing with the plugin,
+    although the document was memory mapped or viewed.
+    """
+    descriptions = []
+    mapper = _keeping_mapper(descriptions)
+    if from_path:
+        Graph().parse(ex1.path_wsdl, format="wsdl", lazy_types=True,
+                      extensions=mapper)
+    else:
+        Graph().parse(data=ex1.path_wsdl.read_bytes(), format="wsdl",
+                      lazy_types=True, extensions=mapper)
+    description, = descriptions
+    root = _lazy_schema(description)
+    assert root.tag == "{http://www.w3.org/2001/XMLSchema}schema"
+
+
+def test_lazyTypesClosesMap(register_wsdl_format, monkeypatch):
+    """The memory map of the document is closed after parsing without
+    garbage collection, also if the description is kept.
+    """
+    maps = []
+    class TrackedMap(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            maps.append(self)
+    monkeypatch.setattr(mmap, "mmap", TrackedMap)
+    descriptions = []
+    gc.disable()
+    try:
+        Graph().parse(ex1.path_wsdl, format="wsdl", lazy_types=True)
+        Graph().parse(ex1.path_wsdl, format="wsdl", lazy_types=True,
+                      extensions=_keeping_mapper(descriptions))
+        assert len(maps) == 2
+        assert all(m.closed for m in maps)
+    finally:
+        gc.enable()
+    root = _lazy_schema(descriptions[0])
+    assert root.tag == "{http://www.w3.org/2001/XMLSchema}schema"
+
+
+def test_lazyTypesChangedFile(register_wsdl_format, tmp_path):
+    """Captured schemas arent read from a file changed after parsing."""
+    path = tmp_path / "ex1.wsdl"
+    path.write_bytes(ex1.path_wsdl.read_bytes())
+    descriptions = []
+    Graph().parse(path, format="wsdl", lazy_types=True,
+                  extensions=_keeping_mapper(descriptions))
+    path.write_bytes(b"<!-- moved -->" + ex1.path_wsdl.read_bytes())
+    with pytest.raises(ValueError):
+        _lazy_schema(descriptions[0])
+
+
+@pytest.mark.parametrize("source", [
+    pytest.param(lambda: ex1.path_wsdl, id="path"),
+    pytest.param(lambda: ex1.path_wsdl.read_bytes(), id="bytes"),
+    pytest.param(lambda: io.BytesIO(ex1.path_wsdl.read_bytes()), id="stream"),
+    ])
+def test_lazyTypesReadDescription(source):
+    """read_description captures schemas lazily for every kind of source.
+    """
+    description = read_description(source(), lazy_types=True)
+    root = _lazy_schema(description)
+    assert root.tag == "{http://www.w3.org/2001/XMLSchema}schema"
+
+
+def test_lazyTypesOtherEncoding(register_wsdl_format):
+    """Documents not encoded in utf-8 are refused instead of giving wrong
+    schemas on access.
+    """
+    data = ex1.path_wsdl.read_text()
+    data = '<?xml version="1.0" encoding="ISO-8859-1"?>\n'\
+            + data[data.index("<description"):]
+    with pytest.raises(ValueError, match="ISO-8859-1"):
+        Graph().parse(data=data.encode("latin-1"), format="wsdl",
+                      lazy_types=True)
+    with pytest.raises(ValueError, match="utf-16"):
+        read_description(data.replace("ISO-8859-1", "UTF-16")
+                         .encode("utf-16"), lazy_types=True)
+    Graph().parse(data=data.encode("latin-1"), format="wsdl")
@@ -0,0 +1,37 @@
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib_wsdl import wsdl2rdf
+from rdflib_wsdl.wsdl2rdf import get_mapper, basicGenerateRDF, \
+        sawsdlExtension, httpExtension, soapExtension, ParserData
+from ..examplecases import ex1
+
+
+def test_getMapperCached():
+    extensions = [sawsdlExtension, httpExtension, soapExtension]
+    mapper = get_mapper(extensions)
+    assert get_mapper(list(extensions)) is mapper
+    assert get_mapper(extensions[:2]) is not mapper
+    assert get_mapper() is get_mapper()
+    assert get_mapper(basicGenerateRDF) is basicGenerateRDF
+
+
+def test_getMapperBounded():
+    """Many distinct lists of extensions dont grow the cache without limit.
+    """
+    extensions = [sawsdlExtension, httpExtension, soapExtension]
+    mapper = get_mapper(extensions)
+    for _ in range(3 * wsdl2rdf.MAPPER_CACHE_SIZE):
+        get_mapper([ParserData(interface=lambda g, interface: None)])
+        assert get_mapper(extensions) is mapper, \
+                "recently used mappers have to stay cached"
+    assert len(wsdl2rdf._mappers) <= wsdl2rdf.MAPPER_CACHE_SIZE
+
+
+def test_parseWithExtensions(register_wsdl_format):
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    basic = Graph().parse(ex1.path_wsdl, format="wsdl",
+                          extensions=basicGenerateRDF)
+    assert isomorphic(basic, expected)
+    without_soap = Graph().parse(ex1.path_wsdl, format="wsdl",
+                                 extensions=[])
+    assert 0 < len(without_soap) < len(expected)
@@ -0,0 +1,21 @@
+import pytest
+from rdflib_wsdl.shared import NamespaceScope, name2qname
+
+
+def test_namespaceScope():
+    """Tests that scopes resolve prefixes via their parents and are shared,
+    if no new prefixes are declared.
+    """
+    root = NamespaceScope({"tns": "http://example.com/tns",
+                           "xs": "http://www.w3.org/2001/XMLSchema"})
+    assert root.child({}) is root
+    inner = root.child({"tns": "http://example.com/other"})
+    assert name2qname("tns:a", "http://default", inner)\
+            == ("http://example.com/other", "a")
+    assert name2qname("xs:b", "http://default", inner)\
+            == ("http://www.w3.org/2001/XMLSchema", "b")
+    assert name2qname("c", "http://default", inner) == ("http://default", "c")
+    assert dict(inner) == {"tns": "http://example.com/other",
+                           "xs": "http://www.w3.org/2001/XMLSchema"}
+    with pytest.raises(KeyError):
+        name2qname("missing:d", "http://default", inner)
@@ -0,0 +1,89 @@
+import pytest
+from rdflib import Graph, Namespace
+from rdflib.compare import isomorphic
+from rdflib_wsdl import parse_parallel
+from rdflib_wsdl.parallel import _slices, _slice_documents
+from rdflib_wsdl.xmlparser import read_description
+from rdflib_wsdl.wsdl2rdf import ParserData, additional_parser
+from rdflib_wsdl.wsdl2rdf.class_MapperWSDL2RDF import _create_id
+from ..examplecases import ex1
+
+
+def test_parseParallel():
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    document = ex1.path_wsdl.read_bytes()
+    assert isomorphic(parse_parallel(document, workers=2), expected)
+    assert isomorphic(parse_parallel(document, workers=1), expected)
+
+
+def test_parseParallelPlugin(register_wsdl_format):
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    graph = Graph().parse(ex1.path_wsdl, format="wsdl", mapping_workers=2)
+    assert isomorphic(graph, expected)
+
+
+def test_slices():
+    description = read_description(ex1.path_wsdl)
+    assert list(_slices(description, 3)) == [
+            ("interfaces", 0, 1), ("bindings", 0, 1), ("services", 0, 1)]
+
+
+def test_sliceDocuments():
+    """Workers only get the components of their slice and the components
+    these reference.
+    """
+    data = ex1.path_wsdl.read_text()
+    start = data.index("  <documentation>")
+    end = data.index("</documentation>") + len("</documentation>")
+    document = (data[:start] + '<documentation a="/>"/>' + data[end:])\
+            .encode()
+    description = read_description(document)
+    interfaces, bindings, services = _slice_documents(
+            document, description, _slices(description, 3))
+    for sliced in (interfaces, bindings, services):
+        assert b"<types>" not in sliced and b"<documentation" not in sliced
+        assert sliced.endswith(b"</description>")
+    assert b"<binding" not in interfaces and b"<service" not in interfaces
+    assert b"<interface" in bindings and b"<service" not in bindings
+    assert b"<interface" in services and b"<binding" in services
+    # Extensions may read the subcomponents of referenced components
+    assert services.count(b"<operation") == bindings.count(b"<operation")
+    assert [len(read_description(sliced).services) for sliced
+            in (interfaces, bindings, services)] == [0, 0, 1]
+
+
+def test_sliceDocumentsMismatch():
+    """Components without their xml-element in the document raise an
+    error instead of sending workers the wrong elements.
+    """
+    data = ex1.path_wsdl.read_text()
+    description = read_description(data.encode())
+    start = data.index("  <interface")
+    end = data.index("</interface>") + len("</interface>")
+    document = (data[:start] + data[end:]).encode()
+    with pytest.raises(ValueError, match="reservationInterface"):
+        list(_slice_documents(document, description,
+                              _slices(description, 3)))
+
+
+EX = Namespace("http://example.com/test#")
+
+def _endpoint_operations(g, endpoint):
+    """Extension, that reads the subcomponents of the binding of endpoint.
+    """
+    for operation in endpoint.binding.binding_operations:
+        g.add((_create_id(endpoint), EX.operation, _create_id(operation)))
+
+
+def test_parallelSameAsSerial(register_wsdl_format):
+    """Parallel mapping gives the same triples as serial mapping with the
+    available extensions and an extension reading referenced components.
+    """
+    extensions = [*additional_parser,
+                  ParserData(endpoint=_endpoint_operations)]
+    serial = Graph().parse(ex1.path_wsdl, format="wsdl", skolemize=True,
+                           extensions=extensions)
+    parallel = Graph().parse(ex1.path_wsdl, format="wsdl", skolemize=True,
+                             extensions=extensions, mapping_workers=2)
+    assert (None, EX.operation, None) in serial
+    assert set(parallel) == set(serial)
@@ -0,0 +1,65 @@
+import pytest
+from rdflib import Graph
+from rdflib.compare import to_isomorphic, graph_diff
+from rdflib_wsdl import WSDLIncrementalParser
+from rdflib_wsdl.rdflib_plugin import WSDLXML_PluginException
+from rdflib_wsdl.shared import WSDL
+from rdflib_wsdl.xmlparser_states import UnresolvedReference
+from ..examplecases import ex1
+
+
+def _reordered_ex1() -> bytes:
+    """Returns example 1 with the interface after binding and service."""
+    data = ex1.path_wsdl.read_text()
+    start = data.index("  <interface")
+    end = data.index("</interface>") + len("</interface>")
+    interface = data[start:end]
+    data = data[:start] + data[end:]
+    closing = data.index("</description>")
+    return (data[:closing] + interface + "\n" + data[closing:]).encode()
+
+
+def test_streamingDeferred():
+    """Tests that components referencing components, that are parsed later,
+    are deferred and the triples are the same as without streaming.
+    """
+    data = _reordered_ex1()
+    parser = WSDLIncrementalParser(streaming=True)
+    parser.feed(data[:data.index(b"<interface ")])
+    assert len(parser.store) == 0, "binding and service have to be deferred"
+    parser.feed(data[data.index(b"<interface "):])
+    graph = parser.close()
+    assert (None, WSDL.implements, None) in graph
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    inboth, inexpected, ingraph = graph_diff(to_isomorphic(expected),
+                                             to_isomorphic(graph))
+    assert not inexpected and not ingraph
+
+
+def test_streamingMappingError():
+    """Errors other than unresolved references arent deferred but raised,
+    when the component is parsed.
+    """
+    data = ex1.path_wsdl.read_text()
+    data = data.replace('style="http://www.w3.org/ns/wsdl/style/iri"', "")
+    data = data.encode()
+    parser = WSDLIncrementalParser(streaming=True)
+    end = data.index(b"</interface>") + len(b"</interface>")
+    with pytest.raises(KeyError) as excinfo:
+        parser.feed(data[:end])
+    assert not isinstance(excinfo.value, UnresolvedReference)
+    assert excinfo.value.args == ((None, "style"),)
+
+
+def test_streamingUnresolved():
+    """References still unresolved at the end of the document raise an
+    error naming the referenced component.
+    """
+    data = _reordered_ex1()
+    data = data[:data.index(b"  <interface ")] + b"</description>"
+    parser = WSDLIncrementalParser(streaming=True)
+    parser.feed(data)
+    with pytest.raises(WSDLXML_PluginException) as excinfo:
+        parser.close()
+    assert "{http://greath.example.com/2004/wsdl/resSvc}reservationInterface"\
+            in str(excinfo.value)
@@ -0,0 +1,113 @@
+import pytest
+from rdflib_wsdl import WSDLIncrementalParser
+from ..examplecases import ex1
+
+TNS = "http://greath.example.com/2004/wsdl/resSvc"
+
+
+@pytest.fixture
+def description():
+    parser = WSDLIncrementalParser(rdf_generator=lambda d: ())
+    parser.feed(ex1.path_wsdl.read_bytes())
+    parser.close()
+    return parser.description
+
+
+def test_symbolTables(description):
+    interface, = description.interfaces
+    binding, = description.bindings
+    service, = description.services
+    assert description.get_interface(TNS, interface.name) is interface
+    assert description.get_binding(TNS, binding.name) is binding
+    assert description.get_service(TNS, service.name) is service
+    assert binding.interface is interface
+    assert service.interface is interface
+    for operation in binding.binding_operations:
+        assert operation.interface_operation.parent is interface
+    for fault in binding.binding_faults:
+        assert fault.interface_fault.parent is interface
+
+
+def test_descriptionLookupUsesTables(description, monkeypatch):
+    """Lookups of operations and faults by the description dont scan the
+    operations and faults of the interfaces.
+    """
+    interface, = description.interfaces
+    operation = next(iter(interface.interface_operations))
+    fault = next(iter(interface.interface_faults))
+    def no_scan(self):
+        raise AssertionError("operations and faults shouldnt be scanned")
+    monkeypatch.setattr(type(interface), "interface_operations",
+                        property(no_scan))
+    monkeypatch.setattr(type(interface), "interface_faults",
+                        property(no_scan))
+    assert description.get_interfaceOperation(TNS, operation.name)\
+            is operation
+    assert description.get_interfaceFault(TNS, fault.name) is fault
+
+
+def test_symbolTablesNamespace(description):
+    """Lookups compare the namespace and raise KeyError."""
+    interface, = description.interfaces
+    operation = next(iter(interface.interface_operations))
+    with pytest.raises(KeyError):
+        description.get_interface("http://example.com/other", interface.name)
+    with pytest.raises(KeyError):
+        description.get_interfaceOperation("http://example.com/other",
+                                           operation.name)
+
+
+def test_childBuckets(description):
+    """Children are filed by type in document order, properties return
+    the same bucket on every access.
+    """
+    interface, = description.interfaces
+    assert description.interfaces is description.interfaces
+    operations = interface.interface_operations
+    assert operations is interface.interface_operations
+    assert operations == [x for x in interface.child_nodes
+                          if x in operations]
+    for operation in operations:
+        assert [x.direction for x in operation.interface_message_references]\
+                == ["in", "out"]
+    assert description.get_children("unknown") == []
+
+
+def _two_interfaces() -> bytes:
+    """Returns example 1 with a second interface and binding, that use
+    the same names for their fault and operation.
+    """
+    data = ex1.path_wsdl.read_text()
+    start = data.index("  <interface")
+    end = data.index("</binding>") + len("</binding>")
+    copy = data[start:end]\
+            .replace('"reservationInterface"', '"otherInterface"')\
+            .replace('"tns:reservationInterface"', '"tns:otherInterface"')\
+            .replace('"reservationSOAPBinding"', '"otherBinding"')
+    return (data[:end] + "\n" + copy + data[end:]).encode()
+
+
+def test_symbolsPerInterface():
+    """Operations and faults are resolved within the referenced
+    interface.
+    """
+    parser = WSDLIncrementalParser(rdf_generator=lambda d: ())
+    parser.feed(_two_interfaces())
+    parser.close()
+    description = parser.description
+    assert [i.name for i in description.interfaces]\
+            == ["reservationInterface", "otherInterface"]
+    for interface in description.interfaces:
+        for operation in interface.interface_operations:
+            for reference in operation.interface_fault_references:
+                assert reference.interface_fault.parent is interface
+    for binding in description.bindings:
+        for fault in binding.binding_faults:
+            assert fault.interface_fault.parent is binding.interface
+        for operation in binding.binding_operations:
+            assert operation.interface_operation.parent is binding.interface
+    first, other = description.interfaces
+    operation = next(iter(other.interface_operations))
+    # Lookups of the description go through the tables of the interfaces
+    assert description.get_interfaceOperation(TNS, operation.name)\
+            is first.get_interfaceOperation(TNS, operation.name)
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from rdflib_wsdl.wsdl2rdf import plugin_discovery, soapExtension
+
+IMPORTTIME_BUDGET_US = 50000
+"""Budget for the import of rdflib_wsdl.wsdl2rdf itself in microseconds"""
+
+
+def _importtime(statement: str) -> dict:
+    """Runs statement in a new process with ``-X importtime``.
+
+    :returns: Imported modules mapped to their own import time in us
+    """
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                          statement],
+                         check=True, capture_output=True, text=True)
+    times = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, module = line[12:].split("|")
+        times[module.strip()] = int(self_time)
+    return times
+
+
+def test_importWithoutDiscovery():
+    """Tests that importing doesnt discover plugins or create mappers."""
+    times = _importtime("import rdflib_wsdl.wsdl2rdf as w\n"
+                        "assert 'additional_parser' not in vars(w)\n"
+                        "assert 'generateRDF' not in vars(w)\n")
+    assert "rdflib_wsdl.wsdl2rdf" in times
+    assert "rdflib_wsdl.wsdl2rdf.plugin_discovery" not in times
+    assert times["rdflib_wsdl.wsdl2rdf"] < IMPORTTIME_BUDGET_US
+
+
+def test_manifestCache(tmp_path, monkeypatch):
+    scans = []
+    def scan():
+        scans.append(1)
+        return [("soap", "rdflib_wsdl.wsdl2rdf:soapExtension")]
+    monkeypatch.setattr(plugin_discovery, "_scan_entry_points", scan)
+    cache_path = tmp_path / "plugins.json"
+    assert plugin_discovery.load_plugins(cache_path) == [soapExtension]
+    assert plugin_discovery.load_plugins(cache_path) == [soapExtension]
+    assert len(scans) == 1, "second load should use the manifest"
+    monkeypatch.setattr(plugin_discovery, "_fingerprint",
+                        lambda: [["changed", 0]])
+    assert plugin_discovery.load_plugins(cache_path) == [soapExtension]
+    assert len(scans) == 2, "changed installation should invalidate manifest"
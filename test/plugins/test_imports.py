@@ -0,0 +1,20 @@
+from .test_discovery import _importtime
+
+
+def test_importPackage():
+    """Importing the package alone doesnt load any submodule."""
+    times = _importtime("import rdflib_wsdl")
+    assert [module for module in times if module.startswith("rdflib_wsdl.")]\
+            == []
+
+
+def test_importParser():
+    """The rdflib plugin only loads, what parsing needs."""
+    times = _importtime("import rdflib_wsdl\n"
+                        "rdflib_wsdl.WSDLXMLParser\n")
+    assert "rdflib_wsdl.rdflib_plugin" in times
+    for module in ("rdflib_wsdl.batch", "rdflib_wsdl.aio",
+                   "rdflib_wsdl.ntriples", "rdflib_wsdl.generate_helper",
+                   "asyncio",
+                   "concurrent.futures"):
+        assert module not in times
@@ -0,0 +1,44 @@
+from io import BytesIO
+import pytest
+from rdflib import Dataset, Graph, Literal, URIRef, XSD
+from rdflib.compare import isomorphic
+from rdflib_wsdl import convert_to_ntriples, write_ntriples
+from ..examplecases import ex1
+
+TNS = "http://greath.example.com/2004/wsdl/resSvc"
+
+
+def test_convertNTriples():
+    out = BytesIO()
+    count = convert_to_ntriples(ex1.path_wsdl, out)
+    graph = Graph().parse(data=out.getvalue(), format="nt")
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    assert count == len(graph)
+    assert isomorphic(graph, expected)
+
+
+def test_convertNQuads():
+    out = BytesIO()
+    with open(ex1.path_wsdl, "rb") as source:
+        convert_to_ntriples(source, out, format="nquads")
+    dataset = Dataset().parse(data=out.getvalue(), format="nquads")
+    graph = dataset.graph(URIRef(TNS + "#wsdl.description()"))
+    expected = Graph().parse(ex1.path_ttl, format="ttl")
+    assert isomorphic(graph, expected)
+
+
+def test_escaping():
+    s = URIRef("http://example.com/a b")
+    p = URIRef("http://example.com/p")
+    triples = [(s, p, Literal('line\n"quoted"\\')),
+               (s, p, Literal("1", datatype=XSD.int)),
+               (s, p, Literal("text", lang="en"))]
+    out = BytesIO()
+    assert write_ntriples(triples, out, block_size=2) == 3
+    graph = Graph().parse(data=out.getvalue(), format="nt")
+    assert set(graph) == set(triples)
+
+
+def test_unknownFormat():
+    with pytest.raises(ValueError):
+        convert_to_ntriples(ex1.path_wsdl, BytesIO(), format="turtle")